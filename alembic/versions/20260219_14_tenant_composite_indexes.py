@@ -0,0 +1,76 @@
+"""add tenant-scoped composite and partial indexes
+
+Revision ID: 20260219_14
+Revises: 20260218_13
+Create Date: 2026-02-19 09:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260219_14"
+down_revision: str | None = "20260218_13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_trips_tc_date_id", "trips", ["transport_company_id", "date", "id"])
+    op.create_index(
+        "ix_trips_tc_company_date", "trips", ["transport_company_id", "company_id", "date"]
+    )
+    op.create_index(
+        "ix_trips_tc_company_date_unpaid",
+        "trips",
+        ["transport_company_id", "company_id", "date"],
+        postgresql_where=sa.text("paid IS false"),
+        sqlite_where=sa.text("paid IS 0"),
+    )
+    op.create_index(
+        "ix_trips_tc_driver_date", "trips", ["transport_company_id", "driver_id", "date"]
+    )
+    op.create_index(
+        "ix_trips_tc_invoice_date", "trips", ["transport_company_id", "invoice_id", "date"]
+    )
+    op.create_index(
+        "ix_invoices_tc_generated_at", "invoices", ["transport_company_id", "generated_at"]
+    )
+    op.create_index(
+        "ix_invoices_tc_company_generated_at",
+        "invoices",
+        ["transport_company_id", "company_id", "generated_at"],
+    )
+    op.create_index(
+        "ix_invoices_tc_due_date_unpaid",
+        "invoices",
+        ["transport_company_id", "due_date"],
+        postgresql_where=sa.text("paid_at IS NULL"),
+        sqlite_where=sa.text("paid_at IS NULL"),
+    )
+    op.create_index(
+        "ix_driver_cash_handovers_tc_driver_date",
+        "driver_cash_handovers",
+        ["transport_company_id", "driver_id", "handover_date"],
+    )
+    op.create_index(
+        "ix_driver_cash_handovers_tc_date",
+        "driver_cash_handovers",
+        ["transport_company_id", "handover_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_driver_cash_handovers_tc_date", table_name="driver_cash_handovers")
+    op.drop_index("ix_driver_cash_handovers_tc_driver_date", table_name="driver_cash_handovers")
+    op.drop_index("ix_invoices_tc_due_date_unpaid", table_name="invoices")
+    op.drop_index("ix_invoices_tc_company_generated_at", table_name="invoices")
+    op.drop_index("ix_invoices_tc_generated_at", table_name="invoices")
+    op.drop_index("ix_trips_tc_invoice_date", table_name="trips")
+    op.drop_index("ix_trips_tc_driver_date", table_name="trips")
+    op.drop_index("ix_trips_tc_company_date_unpaid", table_name="trips")
+    op.drop_index("ix_trips_tc_company_date", table_name="trips")
+    op.drop_index("ix_trips_tc_date_id", table_name="trips")
@@ -0,0 +1,62 @@
+"""add pdf render job table
+
+Revision ID: 20261018_15
+Revises: 20260219_14
+Create Date: 2026-10-18 09:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_15"
+down_revision: str | None = "20260219_14"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pdf_render_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("transport_company_id", sa.Integer(), nullable=False),
+        sa.Column("invoice_id", sa.Integer(), nullable=False),
+        sa.Column("template_key", sa.String(length=50), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("requested_by", sa.String(length=120), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("result_size", sa.Integer(), nullable=True),
+        sa.Column("result_data", sa.LargeBinary(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["transport_company_id"],
+            ["transport_companies.id"],
+            ondelete="CASCADE",
+            name="fk_prj_transport_company_id_transport_companies",
+        ),
+        sa.ForeignKeyConstraint(
+            ["invoice_id"],
+            ["invoices.id"],
+            ondelete="CASCADE",
+            name="fk_prj_invoice_id_invoices",
+        ),
+    )
+    op.create_index(
+        "ix_pdf_render_jobs_transport_company_id", "pdf_render_jobs", ["transport_company_id"]
+    )
+    op.create_index("ix_pdf_render_jobs_invoice_id", "pdf_render_jobs", ["invoice_id"])
+    op.create_index("ix_pdf_render_jobs_status_id", "pdf_render_jobs", ["status", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pdf_render_jobs_status_id", table_name="pdf_render_jobs")
+    op.drop_index("ix_pdf_render_jobs_invoice_id", table_name="pdf_render_jobs")
+    op.drop_index("ix_pdf_render_jobs_transport_company_id", table_name="pdf_render_jobs")
+    op.drop_table("pdf_render_jobs")
@@ -0,0 +1,26 @@
+"""add invoice line snapshot hash
+
+Revision ID: 20261018_17
+Revises: 20261018_16
+Create Date: 2026-10-18 13:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_17"
+down_revision: str | None = "20261018_16"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("invoices", sa.Column("line_snapshot_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("invoices", "line_snapshot_hash")
@@ -0,0 +1,26 @@
+"""add pdf render job group_by
+
+Revision ID: 20261018_18
+Revises: 20261018_17
+Create Date: 2026-10-18 14:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_18"
+down_revision: str | None = "20261018_17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("pdf_render_jobs", sa.Column("group_by", sa.String(length=20), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("pdf_render_jobs", "group_by")
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from io import BytesIO
+from typing import cast
+
+from pypdf import PdfReader
+
+from src.models.company import Company
+from src.models.invoice import Invoice
+from src.models.trip import Trip
+from src.services.invoice import InvoiceService
+from src.services.invoice_pdf import InvoicePDFService
+
+
+def _fixture(rows: int) -> tuple[Invoice, Company, list[Trip]]:
+    company = Company(
+        name="Bench Customer",
+        address="Dubai",
+        email="ops@bench.example.com",
+        phone="+971551234567",
+        trn="100000000000999",
+        contact_person="Sam",
+        po_box="99",
+    )
+    invoice = Invoice(
+        id=1,
+        company_id=1,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 12, 31),
+        due_date=date(2027, 1, 30),
+        format_key="template_c",
+        prepared_by_mode="without_signature",
+        total_amount=Decimal("105.00") * rows,
+        generated_at=datetime(2026, 12, 31, tzinfo=UTC),
+    )
+    trips = [
+        Trip(
+            id=index + 1,
+            company_id=1,
+            date=date(2026, 1, 1) + timedelta(days=index % 365),
+            freight="1 Ton",
+            origin="Dubai",
+            destination="Sharjah",
+            destination_company_name=f"Site {index % 40}",
+            amount=Decimal("100.00"),
+            vat=Decimal("5.00"),
+            toll_gate=Decimal("0.00"),
+            total_amount=Decimal("105.00"),
+            driver=f"Driver {index % 50}",
+        )
+        for index in range(rows)
+    ]
+    return invoice, company, trips
+
+
+def _per_page_chrome(
+    invoice: Invoice, company: Company, trips: list[Trip], transport_company_trn: str = ""
+) -> bytes:
+    # Template C as it was drawn before page chrome moved into form XObjects.
+    modules = InvoicePDFService._reportlab_modules()
+    page_width, page_height = modules["A4"]
+    mm = modules["mm"]
+    canvas_cls = modules["canvas"].Canvas
+
+    buffer = BytesIO()
+    c = canvas_cls(buffer, pagesize=modules["A4"])
+
+    invoice_no = InvoiceService.generate_invoice_number(invoice.id, invoice.invoice_number)
+    invoice_date = invoice.generated_at.date().strftime("%d-%b-%Y")
+    invoice_month = invoice.generated_at.strftime("%b-%y")
+
+    headers = [
+        ["Sr No."],
+        ["Delivery", "Date"],
+        ["Description"],
+        ["Amount", "(Excl. VAT)"],
+        ["VAT%"],
+        ["VAT"],
+        ["Total", "Amount"],
+        ["Remarks"],
+    ]
+    widths = [10, 20, 62, 18, 12, 12, 20, 28]
+    header_height = 12.5 * mm
+    row_height = 7.2 * mm
+    table_x = 14 * mm
+
+    def draw_page_header(first_page: bool) -> float:
+        y_top = page_height - 14 * mm
+        y = InvoicePDFService._draw_brand_header(c, page_width, y_top)
+
+        if first_page:
+            # Match template_a header/info alignment.
+            y -= 3 * mm
+            c.setFont("Helvetica-Bold", 10)
+            c.drawString(14 * mm, y, f"Ms/ {company.name}")
+            c.setFont("Helvetica-Bold", 8)
+            y -= 4.1 * mm
+            c.drawString(14 * mm, y, f"TRN:- {company.trn or '-'}")
+            y -= 4.1 * mm
+            c.drawString(14 * mm, y, f"Mobile Number:- {company.phone or '-'}")
+
+            y -= 6 * mm
+            c.setFont("Helvetica-Bold", 14)
+            c.drawCentredString(page_width / 2, y, "TAX INVOICE")
+
+            y -= 4.6 * mm
+            c.setFont("Helvetica-Bold", 9)
+            c.drawCentredString(page_width / 2, y, invoice_month)
+
+            y -= 8 * mm
+            c.drawString(14 * mm, y, f"Invoice No. :- {invoice_no}")
+            y -= 4.1 * mm
+            c.drawString(14 * mm, y, f"Invoice Date :- {invoice_date}")
+            y -= 4.1 * mm
+            c.drawString(14 * mm, y, f"TRN:- {transport_company_trn or '-'}")
+        else:
+            y -= 2.5 * mm
+            c.setFont("Helvetica-Bold", 9)
+            c.drawString(14 * mm, y, f"Invoice No. :- {invoice_no}")
+            y -= 4.6 * mm
+            c.setFont("Helvetica-Bold", 8)
+            c.drawString(14 * mm, y, f"Invoice Date :- {invoice_date}")
+            y -= 4.2 * mm
+            c.setFont("Helvetica", 7.2)
+            c.drawString(14 * mm, y, "Continued trip details")
+
+        y -= 6 * mm
+        x = table_x
+        c.setFont("Helvetica-Bold", 6.5)
+        for idx, header_lines in enumerate(headers):
+            cell_width = widths[idx] * mm
+            c.rect(x, y - header_height, cell_width, header_height, stroke=1, fill=0)
+            if len(header_lines) == 1:
+                c.drawCentredString(x + (cell_width / 2), y - 7.7 * mm, header_lines[0])
+            else:
+                c.drawCentredString(x + (cell_width / 2), y - 5.3 * mm, header_lines[0])
+                c.drawCentredString(x + (cell_width / 2), y - 9.4 * mm, header_lines[1])
+            x += cell_width
+        return cast(float, y - header_height)
+
+    def draw_footer() -> None:
+        footer_line_y = 14 * mm
+        c.setLineWidth(1)
+        c.line(14 * mm, footer_line_y, page_width - 14 * mm, footer_line_y)
+        c.setFont("Helvetica", 8.2)
+        c.drawCentredString(
+            page_width / 2,
+            footer_line_y - (4.5 * mm),
+            "P.O. Box : 20124, Phone: 971 4 2503886, Fax: 971 4 2516492, Mobile: 971 55 2381722",
+        )
+        c.drawCentredString(
+            page_width / 2, footer_line_y - (8.5 * mm), "E-mail : sikarcargo@gmail.com"
+        )
+
+    y = draw_page_header(first_page=True)
+    c.setFont("Helvetica", 7)
+
+    for i, trip in enumerate(trips, start=1):
+        # Keep enough space for next row and footer; otherwise continue on next page.
+        if y - row_height < 34 * mm:
+            draw_footer()
+            c.showPage()
+            y = draw_page_header(first_page=False)
+            c.setFont("Helvetica", 7)
+
+        destination_company = (trip.destination_company_name or "").strip() or "Destination N/A"
+        row = [
+            str(i),
+            trip.date.strftime("%d-%b-%Y"),
+            f"{destination_company} ({trip.destination})",
+            f"{trip.amount:.2f}",
+            "0%" if float(trip.vat) == 0 else "5%",
+            f"{trip.vat:.2f}",
+            f"{trip.total_amount:.2f}",
+            trip.freight,
+        ]
+
+        x = table_x
+        for idx, value in enumerate(row):
+            cell_width = widths[idx] * mm
+            c.rect(x, y - row_height, cell_width, row_height, stroke=1, fill=0)
+            if idx == 2:
+                c.drawString(x + 1.4 * mm, y - 5.0 * mm, str(value)[:52])
+            else:
+                c.drawCentredString(x + (cell_width / 2), y - 5.0 * mm, str(value))
+            x += cell_width
+        y -= row_height
+
+    summary = InvoiceService.summarize_trips(trips)
+
+    if y - (row_height + (28 * mm)) < 24 * mm:
+        draw_footer()
+        c.showPage()
+        y = draw_page_header(first_page=False)
+
+    total_row = [
+        "",
+        "",
+        "",
+        f"{summary['total_amount']:.2f}",
+        "",
+        f"{summary['total_vat_amount']:.2f}",
+        f"{summary['total_amount_include_vat']:.2f}",
+        "",
+    ]
+    x = table_x
+    c.setFont("Helvetica-Bold", 7.8)
+    for idx, value in enumerate(total_row):
+        cell_width = widths[idx] * mm
+        c.rect(x, y - row_height, cell_width, row_height, stroke=1, fill=0)
+        c.drawCentredString(x + (cell_width / 2), y - 5.0 * mm, value)
+        x += cell_width
+    y -= row_height
+
+    y -= 9 * mm
+    c.setFont("Helvetica", 9)
+    c.drawString(14 * mm, y, "Prepare By  :-")
+    c.drawCentredString(page_width / 2, y, "Recived By")
+    c.drawRightString(page_width - 14 * mm, y, "Approved By :-")
+
+    draw_footer()
+    c.save()
+    return buffer.getvalue()
+
+
+def _forms(
+    invoice: Invoice, company: Company, trips: list[Trip], transport_company_trn: str = ""
+) -> bytes:
+    return InvoicePDFService.generate_pdf(
+        invoice, company, trips, "template_c", transport_company_trn
+    )
+
+
+def _measure(
+    render: Callable[[Invoice, Company, list[Trip], str], bytes],
+    fixture: tuple[Invoice, Company, list[Trip]],
+    repeat: int,
+) -> tuple[float, bytes]:
+    timings: list[float] = []
+    payload = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        payload = render(*fixture, "100000000000099")
+        timings.append(time.perf_counter() - started)
+    return min(timings), payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare template C page chrome rendering.")
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fixture = _fixture(args.rows)
+    legacy_seconds, legacy_pdf = _measure(_per_page_chrome, fixture, args.repeat)
+    forms_seconds, forms_pdf = _measure(_forms, fixture, args.repeat)
+    legacy_pages = len(PdfReader(BytesIO(legacy_pdf)).pages)
+    forms_pages = len(PdfReader(BytesIO(forms_pdf)).pages)
+    if legacy_pages != forms_pages:
+        raise SystemExit(f"page count differs: {legacy_pages} vs {forms_pages}")
+
+    print(f"rows={args.rows} repeat={args.repeat} pages={forms_pages}")
+    print(f"per-page chrome: {legacy_seconds * 1000:.1f} ms, {len(legacy_pdf) / 1024:.0f} KiB")
+    print(f"forms + grid:    {forms_seconds * 1000:.1f} ms, {len(forms_pdf) / 1024:.0f} KiB")
+    print(f"speedup:         {legacy_seconds / forms_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
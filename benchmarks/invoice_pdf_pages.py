@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from io import BytesIO
+
+from pypdf import PdfReader
+
+from benchmarks.invoice_pdf_forms import _fixture
+from src.services.invoice_pdf import INVOICE_TEMPLATES, InvoicePDFService
+
+TEMPLATES = ("template_a", "template_b", "template_c")
+
+
+def _measure(
+    template_key: str, rows: int, group_by: str | None, repeat: int
+) -> tuple[float, int, bytes]:
+    fixture = _fixture(rows)
+    timings: list[float] = []
+    payload = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        payload = InvoicePDFService.generate_pdf(
+            *fixture, template_key, "100000000000099", group_by
+        )
+        timings.append(time.perf_counter() - started)
+    # Measured separately so tracing overhead does not skew the timings.
+    tracemalloc.start()
+    InvoicePDFService.generate_pdf(*fixture, template_key, "100000000000099", group_by)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak, payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time invoice PDFs across trip counts.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 1_000, 20_000])
+    parser.add_argument("--templates", nargs="+", choices=sorted(INVOICE_TEMPLATES))
+    parser.add_argument("--group-by", choices=["date", "destination"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"group_by={args.group_by or '-'} repeat={args.repeat}")
+    print(f"{'template':<12}{'rows':>8}{'pages':>8}{'ms':>10}{'KiB':>10}{'peak KiB':>10}")
+    for template_key in args.templates or TEMPLATES:
+        for rows in args.rows:
+            seconds, peak, payload = _measure(template_key, rows, args.group_by, args.repeat)
+            pages = len(PdfReader(BytesIO(payload)).pages)
+            print(
+                f"{template_key:<12}{rows:>8}{pages:>8}{seconds * 1000:>10.1f}"
+                f"{len(payload) / 1024:>10.0f}{peak / 1024:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.responses import ProjectedJSONResponse
+from src.db.base import Base
+from src.handlers.trip import TripHandler
+from src.models.company import Company
+from src.models.transport_company import TransportCompany
+from src.models.trip import Trip
+from src.schemas.trip import TripRead
+
+handler = TripHandler()
+trip_list_adapter = TypeAdapter(list[TripRead])
+
+
+async def _seed(session: AsyncSession, rows: int) -> int:
+    tenant = TransportCompany(
+        uuid="00000000-0000-0000-0000-00000000b001",
+        name="Bench Co",
+        email="bench@co.local",
+        location="Bench City",
+        trn="TRN-BENCH-01",
+    )
+    session.add(tenant)
+    await session.flush()
+    company = Company(
+        transport_company_id=tenant.id,
+        name="Customer",
+        address="Road",
+        email="customer@bench.local",
+        phone="555",
+        trn="100000000000999",
+        contact_person="Sam",
+        po_box="99",
+    )
+    session.add(company)
+    await session.flush()
+    await session.execute(
+        insert(Trip),
+        [
+            {
+                "transport_company_id": tenant.id,
+                "company_id": company.id,
+                "date": date(2026, 1, 1) + timedelta(days=index % 365),
+                "freight": "1 Ton",
+                "origin": "Origin",
+                "destination": "Destination",
+                "amount": Decimal("100.00"),
+                "vat": Decimal("5.00"),
+                "toll_gate": Decimal("0.00"),
+                "total_amount": Decimal("105.00"),
+                "driver": f"Driver {index % 50}",
+            }
+            for index in range(rows)
+        ],
+    )
+    await session.commit()
+    return tenant.id
+
+
+async def _orm_path(session: AsyncSession, tenant_id: int, rows: int) -> bytes:
+    result = await session.execute(
+        select(Trip)
+        .where(Trip.transport_company_id == tenant_id)
+        .order_by(Trip.date.desc(), Trip.id.desc())
+        .limit(rows)
+    )
+    items = [TripRead.model_validate(entity) for entity in result.scalars().all()]
+    # Mirrors FastAPI's response_model handling: re-serialize, then json.dumps.
+    return JSONResponse(trip_list_adapter.dump_python(items, mode="json")).body
+
+
+async def _projected_path(session: AsyncSession, tenant_id: int, rows: int) -> bytes:
+    page = await handler.list_trips_page(session, tenant_id, limit=rows)
+    return ProjectedJSONResponse(page.items).body
+
+
+async def _measure(
+    factory: async_sessionmaker[AsyncSession],
+    run: Callable[[AsyncSession, int, int], Awaitable[bytes]],
+    tenant_id: int,
+    rows: int,
+    repeat: int,
+) -> tuple[float, bytes]:
+    timings: list[float] = []
+    body = b""
+    for _ in range(repeat):
+        async with factory() as session:
+            started = time.perf_counter()
+            body = await run(session, tenant_id, rows)
+            timings.append(time.perf_counter() - started)
+    return min(timings), body
+
+
+async def _run(rows: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with factory() as session:
+        tenant_id = await _seed(session, rows)
+
+    orm_seconds, orm_body = await _measure(factory, _orm_path, tenant_id, rows, repeat)
+    projected_seconds, projected_body = await _measure(
+        factory, _projected_path, tenant_id, rows, repeat
+    )
+    await engine.dispose()
+
+    if orm_body != projected_body:
+        raise SystemExit("projected response body differs from the ORM response body")
+    print(f"rows={rows} repeat={repeat} bytes={len(projected_body)}")
+    print(f"orm+model_validate: {orm_seconds * 1000:.1f} ms")
+    print(f"projected+to_json:  {projected_seconds * 1000:.1f} ms")
+    print(f"speedup:            {orm_seconds / projected_seconds:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare trip list serialization paths.")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
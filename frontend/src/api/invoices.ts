@@ -1,13 +1,30 @@
 import { apiClient } from "./apiClient";
 import { sensitiveExportStepUpHeaders } from "./stepUp";
-import type { InvoiceApi, InvoiceCreateInput, SignatoryApi } from "../types";
+import type { InvoiceApi, InvoiceCreateInput, InvoiceSummaryApi, SignatoryApi } from "../types";
+
+const INVOICES_PAGE_SIZE = 500;
 
 export const listInvoices = async (status?: string, companyId?: number): Promise<InvoiceApi[]> => {
-  const response = await apiClient.get<InvoiceApi[]>("/invoices", {
-    params: {
-      ...(status ? { status } : {}),
-      ...(companyId ? { company_id: companyId } : {}),
-    },
+  const invoices: InvoiceApi[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await apiClient.get<InvoiceApi[]>("/invoices", {
+      params: {
+        ...(status ? { status } : {}),
+        ...(companyId ? { company_id: companyId } : {}),
+        limit: INVOICES_PAGE_SIZE,
+        ...(cursor ? { cursor } : {}),
+      },
+    });
+    invoices.push(...response.data);
+    cursor = response.headers["x-next-cursor"] || undefined;
+  } while (cursor);
+  return invoices;
+};
+
+export const getInvoiceSummary = async (groupByCompany = false): Promise<InvoiceSummaryApi[]> => {
+  const response = await apiClient.get<InvoiceSummaryApi[]>("/invoices/summary", {
+    params: groupByCompany ? { group_by: "company_id" } : {},
   });
   return response.data;
 };
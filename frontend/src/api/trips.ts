@@ -2,6 +2,8 @@ import { apiClient } from "./apiClient";
 import { sensitiveExportStepUpHeaders } from "./stepUp";
 import type { TripApi, TripCreateInput } from "../types";
 
+const TRIPS_PAGE_SIZE = 500;
+
 export const listTrips = async (filters?: {
   companyId?: number;
   paid?: boolean;
@@ -9,16 +11,24 @@ export const listTrips = async (filters?: {
   startDate?: string;
   endDate?: string;
 }): Promise<TripApi[]> => {
-  const response = await apiClient.get<TripApi[]>("/trips", {
-    params: {
-      ...(filters?.companyId ? { company_id: filters.companyId } : {}),
-      ...(filters?.paid !== undefined ? { paid: filters.paid } : {}),
-      ...(filters?.driverId ? { driver_id: filters.driverId } : {}),
-      ...(filters?.startDate ? { start_date: filters.startDate } : {}),
-      ...(filters?.endDate ? { end_date: filters.endDate } : {}),
-    },
-  });
-  return response.data;
+  const trips: TripApi[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await apiClient.get<TripApi[]>("/trips", {
+      params: {
+        ...(filters?.companyId ? { company_id: filters.companyId } : {}),
+        ...(filters?.paid !== undefined ? { paid: filters.paid } : {}),
+        ...(filters?.driverId ? { driver_id: filters.driverId } : {}),
+        ...(filters?.startDate ? { start_date: filters.startDate } : {}),
+        ...(filters?.endDate ? { end_date: filters.endDate } : {}),
+        limit: TRIPS_PAGE_SIZE,
+        ...(cursor ? { cursor } : {}),
+      },
+    });
+    trips.push(...response.data);
+    cursor = response.headers["x-next-cursor"] || undefined;
+  } while (cursor);
+  return trips;
 };
 
 export const createTrip = async (payload: TripCreateInput): Promise<TripApi> => {
@@ -17,6 +17,18 @@ export interface InvoiceApi {
   company_name?: string;
 }
 
+export interface InvoiceStatusTotalsApi {
+  count: number;
+  total_amount: string;
+}
+
+export interface InvoiceSummaryApi {
+  company_id: number | null;
+  paid: InvoiceStatusTotalsApi;
+  unpaid: InvoiceStatusTotalsApi;
+  overdue: InvoiceStatusTotalsApi;
+}
+
 export interface InvoiceCreateInput {
   companyId: number;
   startDate?: string;
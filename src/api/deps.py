@@ -1,13 +1,25 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.auth import CurrentAdminContext, get_current_admin_context, get_current_subject
 from src.core.config import Settings, get_settings
-from src.db.session import get_db_session
+from src.db.session import (
+    get_db_session,
+    get_read_db_session,
+    get_read_session_factory,
+    get_session_factory,
+)
 
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 DBSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+ReadDBSessionDep = Annotated[AsyncSession, Depends(get_read_db_session)]
+# Streaming responses and background tasks outlive their request-scoped sessions and
+# open their own from these.
+SessionFactoryDep = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
+ReadSessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession], Depends(get_read_session_factory)
+]
 CurrentSubjectDep = Annotated[str, Depends(get_current_subject)]
 CurrentAdminDep = Annotated[CurrentAdminContext, Depends(get_current_admin_context)]
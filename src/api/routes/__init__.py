@@ -7,6 +7,7 @@ from src.api.routes.drivers import router as drivers_router
 from src.api.routes.employee_salaries import router as employee_salaries_router
 from src.api.routes.health import router as health_router
 from src.api.routes.invoices import router as invoices_router
+from src.api.routes.pdf_jobs import router as pdf_jobs_router
 from src.api.routes.public import router as public_router
 from src.api.routes.trips import router as trips_router
 
@@ -19,5 +20,6 @@ __all__ = [
     "employee_salaries_router",
     "trips_router",
     "invoices_router",
+    "pdf_jobs_router",
     "public_router",
 ]
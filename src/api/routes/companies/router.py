@@ -1,6 +1,7 @@
 from fastapi import APIRouter, status
 
 from src.api.deps import CurrentAdminDep, DBSessionDep
+from src.core.responses import ProjectedJSONResponse
 from src.handlers.company import CompanyHandler
 from src.schemas.company import CompanyCreate, CompanyRead, CompanyUpdate
 
@@ -11,9 +12,9 @@ handler = CompanyHandler()
 @router.get("", response_model=list[CompanyRead])
 async def list_companies(
     session: DBSessionDep, current_admin: CurrentAdminDep
-) -> list[CompanyRead]:
+) -> ProjectedJSONResponse:
     companies = await handler.list_companies(session, current_admin.transport_company_id)
-    return [CompanyRead.model_validate(entity) for entity in companies]
+    return ProjectedJSONResponse(companies)
 
 
 @router.post("", response_model=CompanyRead, status_code=status.HTTP_201_CREATED)
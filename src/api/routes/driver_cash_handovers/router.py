@@ -5,7 +5,7 @@ from datetime import date
 from fastapi import APIRouter, Query, Request, status
 from sqlalchemy import Select, select
 
-from src.api.deps import CurrentAdminDep, DBSessionDep
+from src.api.deps import CurrentAdminDep, DBSessionDep, ReadDBSessionDep
 from src.core.audit import audit_event
 from src.handlers.driver_cash_handover import DriverCashHandoverHandler
 from src.models.driver import Driver
@@ -22,7 +22,7 @@ handler = DriverCashHandoverHandler()
 @router.get("", response_model=list[DriverCashHandoverRead])
 async def list_driver_cash_handovers(
     request: Request,
-    session: DBSessionDep,
+    session: ReadDBSessionDep,
     current_admin: CurrentAdminDep,
     driver_id: int | None = Query(default=None),
     start_date: date | None = Query(default=None),
@@ -99,7 +99,7 @@ async def create_driver_cash_handover(
 @router.get("/summary", response_model=list[DriverCashSummaryRow])
 async def summarize_driver_cash(
     request: Request,
-    session: DBSessionDep,
+    session: ReadDBSessionDep,
     current_admin: CurrentAdminDep,
     driver_id: int | None = Query(default=None),
     start_date: date | None = Query(default=None),
@@ -5,6 +5,7 @@ from fastapi import APIRouter, File, Query, Request, Response, UploadFile, statu
 from src.api.deps import CurrentAdminDep, DBSessionDep, SettingsDep
 from src.core.audit import audit_event, enforce_sensitive_export_step_up
 from src.core.exceptions import AppException
+from src.core.responses import ProjectedJSONResponse
 from src.handlers.employee_salary import EmployeeSalaryHandler
 from src.schemas.employee_salary import (
     EmployeeSalaryCreate,
@@ -23,8 +24,8 @@ async def list_employee_salaries(
     request: Request,
     session: DBSessionDep,
     current_admin: CurrentAdminDep,
-) -> list[EmployeeSalaryRead]:
-    employees = await handler.list_employees(session, current_admin.transport_company_id)
+) -> ProjectedJSONResponse:
+    employees = await handler.list_employee_rows(session, current_admin.transport_company_id)
     await audit_event(
         request,
         actor=current_admin.username,
@@ -33,7 +34,7 @@ async def list_employee_salaries(
         action="list",
         metadata={"count": len(employees)},
     )
-    return [EmployeeSalaryRead.model_validate(item) for item in employees]
+    return ProjectedJSONResponse(employees)
 
 
 @router.post("", response_model=EmployeeSalaryRead, status_code=status.HTTP_201_CREATED)
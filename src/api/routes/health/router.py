@@ -1,4 +1,11 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Request, Response, status
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.api.deps import CurrentAdminDep
+from src.core.logging import logger
+from src.db.session import measure_replica_lag, read_engine
 
 router = APIRouter(tags=["health"])
 
@@ -6,3 +13,29 @@ router = APIRouter(tags=["health"])
 @router.get("/health", summary="Service health check")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/replica", summary="Read replica lag")
+async def replica_health(
+    response: Response, current_admin: CurrentAdminDep
+) -> dict[str, str | float | None]:
+    if read_engine is None:
+        return {"status": "disabled", "lag_seconds": None}
+    try:
+        lag_seconds = await measure_replica_lag(read_engine)
+    except (SQLAlchemyError, OSError, TimeoutError) as exc:
+        logger.warning("replica_health_unavailable error=%s", exc)
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "unavailable", "lag_seconds": None}
+    return {"status": "ok", "lag_seconds": lag_seconds}
+
+
+@router.get("/health/pdf-cache", summary="Invoice PDF cache counters")
+async def pdf_cache_health(
+    request: Request, current_admin: CurrentAdminDep
+) -> dict[str, str | int]:
+    cache = request.app.state.invoice_pdf_cache
+    if cache is None:
+        return {"status": "disabled"}
+    # stats() scans the cache directory.
+    return {"status": "ok", **await asyncio.to_thread(cache.stats)}
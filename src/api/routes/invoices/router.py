@@ -1,26 +1,61 @@
+import asyncio
 import re
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
+from typing import Literal
 
 from cryptography.exceptions import InvalidTag
-from fastapi import APIRouter, File, Form, Query, Request, Response, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Form,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy import Select, select
-
-from src.api.deps import CurrentAdminDep, DBSessionDep, SettingsDep
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import undefer
+
+from src.api.deps import (
+    CurrentAdminDep,
+    DBSessionDep,
+    ReadDBSessionDep,
+    ReadSessionFactoryDep,
+    SessionFactoryDep,
+    SettingsDep,
+)
 from src.core.audit import audit_event, enforce_sensitive_export_step_up
 from src.core.exceptions import AppException
+from src.core.logging import logger
+from src.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
+from src.core.responses import ProjectedJSONResponse
 from src.core.signature_crypto import get_signature_crypto
-from src.handlers.invoice import InvoiceHandler
+from src.handlers.invoice import InvoiceBundle, InvoiceHandler
+from src.handlers.pdf_render_job import PdfRenderJobHandler
 from src.models.signatory import Signatory
-from src.models.transport_company import TransportCompany
 from src.schemas.invoice import (
+    InvoiceBatchCreate,
     InvoiceCreate,
     InvoiceMarkPaid,
     InvoiceRead,
+    InvoiceSummaryRow,
     SignatoryRead,
 )
+from src.schemas.pdf_render_job import PdfRenderJobRead
 from src.services.invoice_pdf import InvoicePDFService
+from src.services.invoice_pdf_archive import ZipStreamWriter
+from src.services.invoice_pdf_cache import InvoicePDFCache, invoice_pdf_cache_key
+from src.services.invoice_pdf_renderer import InvoicePDFJob, InvoicePDFRenderer
 
 router = APIRouter(prefix="/invoices", tags=["invoices"])
 handler = InvoiceHandler()
+pdf_job_handler = PdfRenderJobHandler()
 ALLOWED_SIGNATURE_MIME_TYPES = {
     "image/png",
     "image/jpeg",
@@ -49,21 +84,93 @@ def _serialize_signatory(signatory: Signatory) -> SignatoryRead:
         id=signatory.id,
         name=signatory.name,
         signature_image_mime=signatory.signature_image_mime,
-        # Avoid decrypt on list endpoint; this is metadata only.
-        has_signature=signatory._signature_image_data is not None,
+        # Avoid loading and decrypting the blob on list endpoints; this is metadata only.
+        has_signature=signatory.has_signature_image,
+    )
+
+
+def _pdf_filename(bundle: InvoiceBundle) -> str:
+    company = bundle.snapshot["company"]
+    safe_company_name = (
+        re.sub(r"[^a-z0-9]+", "-", company["name"].lower()).strip("-") or f"company-{company['id']}"
     )
+    generated_ts = bundle.invoice.generated_at.strftime("%Y%m%d_%H%M")
+    return f"{safe_company_name}_{generated_ts}.pdf"
+
+
+async def _render_pdf(
+    request: Request,
+    bundle: InvoiceBundle,
+    template_key: str,
+    cache_key: str | None,
+    group_by: str | None = None,
+    *,
+    wait_for_slot: bool = False,
+) -> bytes:
+    renderer: InvoicePDFRenderer = request.app.state.invoice_pdf_renderer
+    cache: InvoicePDFCache | None = request.app.state.invoice_pdf_cache
+    invoice_id = bundle.invoice.id
+    if cache is not None and cache_key is not None:
+        cached = await asyncio.to_thread(cache.get, invoice_id, cache_key)
+        if cached is not None:
+            return cached
+    job = InvoicePDFJob.from_snapshot(bundle.invoice, bundle.snapshot, template_key, group_by)
+    pdf_bytes = await renderer.render(job, wait_for_slot=wait_for_slot)
+    if cache is not None and cache_key is not None:
+        await asyncio.to_thread(cache.put, invoice_id, cache_key, pdf_bytes)
+    return pdf_bytes
+
+
+async def _prerender_pdf(
+    request: Request,
+    session_factory: async_sessionmaker[AsyncSession],
+    transport_company_id: int,
+    invoice_id: int,
+) -> None:
+    try:
+        async with session_factory() as session:
+            bundle = await handler.get_invoice_bundle(
+                session, transport_company_id, invoice_id, legacy_trip_fallback=False
+            )
+        template_key = InvoicePDFService.resolve_template_key(bundle.invoice)
+        await _render_pdf(
+            request, bundle, template_key, _pdf_cache_key(request, bundle, template_key)
+        )
+    except AppException as exc:
+        # The first download renders it instead.
+        logger.warning(
+            "invoice_pdf_prerender_skipped invoice_id=%s error=%s", invoice_id, exc.message
+        )
+    except Exception:
+        # Runs after the response was sent, so nothing may escape; the download renders it.
+        logger.exception("invoice_pdf_prerender_failed invoice_id=%s", invoice_id)
+
+
+def _pdf_cache_key(
+    request: Request, bundle: InvoiceBundle, template_key: str, group_by: str | None = None
+) -> str | None:
+    if request.app.state.invoice_pdf_cache is None:
+        return None
+    return invoice_pdf_cache_key(bundle.invoice, bundle.snapshot_hash, template_key, group_by)
 
 
 @router.get("", response_model=list[InvoiceRead])
 async def list_invoices(
     request: Request,
-    session: DBSessionDep,
+    session: ReadDBSessionDep,
     current_admin: CurrentAdminDep,
     company_id: int | None = Query(default=None),
     status_filter: str | None = Query(default=None, alias="status"),
-) -> list[InvoiceRead]:
-    invoices = await handler.list_invoices(
-        session, current_admin.transport_company_id, company_id, status_filter
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = Query(default=None, max_length=256),
+) -> ProjectedJSONResponse:
+    page = await handler.list_invoices_page(
+        session,
+        current_admin.transport_company_id,
+        limit=limit,
+        cursor=cursor,
+        company_id=company_id,
+        status=status_filter,
     )
     await audit_event(
         request,
@@ -71,9 +178,23 @@ async def list_invoices(
         tenant_id=current_admin.transport_company_id,
         resource="invoice",
         action="list",
-        metadata={"count": len(invoices)},
+        metadata={"count": len(page.items)},
+    )
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor is not None else None
+    return ProjectedJSONResponse(page.items, headers=headers)
+
+
+@router.get("/summary", response_model=list[InvoiceSummaryRow])
+async def invoice_summary(
+    session: ReadDBSessionDep,
+    current_admin: CurrentAdminDep,
+    group_by: Literal["company_id"] | None = Query(default=None),
+) -> list[InvoiceSummaryRow]:
+    return await handler.invoice_summary(
+        session,
+        current_admin.transport_company_id,
+        group_by_company=group_by == "company_id",
     )
-    return [InvoiceRead.model_validate(item) for item in invoices]
 
 
 @router.get("/signatories", response_model=list[SignatoryRead])
@@ -152,6 +273,7 @@ async def get_signatory_signature(
 ) -> Response:
     stmt: Select[tuple[Signatory]] = (
         select(Signatory)
+        .options(undefer(Signatory._signature_image_data))
         .where(Signatory.id == signatory_id)
         .where(Signatory.transport_company_id == current_admin.transport_company_id)
     )
@@ -281,7 +403,10 @@ async def create_invoice(
     request: Request,
     payload: InvoiceCreate,
     session: DBSessionDep,
+    session_factory: SessionFactoryDep,
     current_admin: CurrentAdminDep,
+    settings: SettingsDep,
+    background_tasks: BackgroundTasks,
 ) -> InvoiceRead:
     invoice = await handler.create_invoice(session, current_admin.transport_company_id, payload)
     await audit_event(
@@ -292,9 +417,43 @@ async def create_invoice(
         resource_id=str(invoice.id),
         action="create",
     )
+    if settings.invoice_pdf_prerender_enabled:
+        # The bundle is loaded after the response is sent, in a session of its own.
+        background_tasks.add_task(
+            _prerender_pdf,
+            request,
+            session_factory,
+            current_admin.transport_company_id,
+            invoice.id,
+        )
     return InvoiceRead.model_validate(invoice)
 
 
+@router.post("/batch", response_model=list[InvoiceRead], status_code=status.HTTP_201_CREATED)
+async def create_invoices_batch(
+    request: Request,
+    payload: InvoiceBatchCreate,
+    session: DBSessionDep,
+    current_admin: CurrentAdminDep,
+) -> list[InvoiceRead]:
+    invoices = await handler.create_invoices_for_period(
+        session, current_admin.transport_company_id, payload
+    )
+    await audit_event(
+        request,
+        actor=current_admin.username,
+        tenant_id=current_admin.transport_company_id,
+        resource="invoice",
+        action="batch_create",
+        metadata={
+            "count": len(invoices),
+            "start_date": payload.start_date.isoformat(),
+            "end_date": payload.end_date.isoformat(),
+        },
+    )
+    return [InvoiceRead.model_validate(invoice) for invoice in invoices]
+
+
 @router.patch("/{invoice_id}/mark-paid", response_model=InvoiceRead)
 async def mark_invoice_paid(
     request: Request,
@@ -317,6 +476,117 @@ async def mark_invoice_paid(
     return InvoiceRead.model_validate(invoice)
 
 
+@router.get("/pdf-archive")
+async def download_invoice_pdf_archive(
+    request: Request,
+    session: ReadDBSessionDep,
+    read_session_factory: ReadSessionFactoryDep,
+    current_admin: CurrentAdminDep,
+    settings: SettingsDep,
+    start_date: date = Query(alias="start"),
+    end_date: date = Query(alias="end"),
+    company_id: int | None = Query(default=None),
+) -> StreamingResponse:
+    enforce_sensitive_export_step_up(request, settings)
+    if end_date < start_date:
+        raise AppException("end must be on or after start", status_code=400)
+    transport_company_id = current_admin.transport_company_id
+    invoice_ids = await handler.list_invoice_ids_generated_between(
+        session, transport_company_id, start_date, end_date, company_id=company_id
+    )
+    parallelism = settings.invoice_pdf_archive_parallelism
+
+    async def archive_entry(bundle: InvoiceBundle) -> tuple[str, bytes]:
+        template_key = InvoicePDFService.resolve_template_key(bundle.invoice)
+        # The response has already started, so wait for a render slot instead of failing.
+        pdf = await _render_pdf(
+            request,
+            bundle,
+            template_key,
+            _pdf_cache_key(request, bundle, template_key),
+            wait_for_slot=True,
+        )
+        return f"{bundle.invoice.id:06d}_{_pdf_filename(bundle)}", pdf
+
+    async def zip_chunks() -> AsyncIterator[bytes]:
+        archive = ZipStreamWriter()
+        # Bundles load one at a time; at most `parallelism` renders are in flight.
+        in_flight: deque[tuple[int, datetime, asyncio.Task[tuple[str, bytes]]]] = deque()
+        # The response has already started, so a failed entry is skipped and listed instead.
+        failures: list[str] = []
+
+        def skip(invoice_id: int, exc: AppException) -> None:
+            logger.warning(
+                "invoice_pdf_archive_entry_skipped invoice_id=%s error=%s", invoice_id, exc.message
+            )
+            failures.append(f"{invoice_id}: {exc.message}")
+
+        async def finish_oldest() -> bytes:
+            invoice_id, generated_at, task = in_flight.popleft()
+            try:
+                name, content = await task
+            except AppException as exc:
+                skip(invoice_id, exc)
+                return b""
+            return archive.add(name, content, generated_at)
+
+        try:
+            async with read_session_factory() as stream_session:
+                for invoice_id in invoice_ids:
+                    try:
+                        bundle = await handler.get_invoice_bundle(
+                            stream_session,
+                            transport_company_id,
+                            invoice_id,
+                            legacy_trip_fallback=settings.invoice_legacy_trip_fallback_enabled,
+                        )
+                    except AppException as exc:
+                        skip(invoice_id, exc)
+                        continue
+                    in_flight.append(
+                        (
+                            invoice_id,
+                            bundle.invoice.generated_at,
+                            asyncio.create_task(archive_entry(bundle)),
+                        )
+                    )
+                    if len(in_flight) >= parallelism and (chunk := await finish_oldest()):
+                        yield chunk
+            while in_flight:
+                if chunk := await finish_oldest():
+                    yield chunk
+        finally:
+            tasks = [task for _, _, task in in_flight]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if failures:
+            yield archive.add("errors.txt", "\n".join(failures).encode(), datetime.now(UTC))
+        yield archive.close()
+
+        await audit_event(
+            request,
+            actor=current_admin.username,
+            tenant_id=transport_company_id,
+            resource="invoice_pdf_archive",
+            action="export",
+            metadata={
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "company_id": company_id,
+                "invoice_count": len(invoice_ids),
+                "failed_count": len(failures),
+            },
+        )
+
+    filename = f"invoices_{start_date.isoformat()}_{end_date.isoformat()}.zip"
+    return StreamingResponse(
+        zip_chunks(),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{invoice_id}/pdf")
 async def download_invoice_pdf(
     request: Request,
@@ -325,30 +595,83 @@ async def download_invoice_pdf(
     current_admin: CurrentAdminDep,
     settings: SettingsDep,
     template_key: str | None = Query(default=None, alias="template"),
+    group_by: Literal["date", "destination"] | None = Query(default=None),
 ) -> Response:
     enforce_sensitive_export_step_up(request, settings)
-    invoice, company, trips = await handler.get_invoice_bundle(
-        session, current_admin.transport_company_id, invoice_id
+    bundle = await handler.get_invoice_bundle(
+        session,
+        current_admin.transport_company_id,
+        invoice_id,
+        legacy_trip_fallback=settings.invoice_legacy_trip_fallback_enabled,
     )
-    tc = await session.get(TransportCompany, current_admin.transport_company_id)
-    tc_trn = tc.trn if tc else ""
-    pdf_bytes = InvoicePDFService.generate_pdf(invoice, company, trips, template_key, tc_trn)
-    safe_company_name = (
-        re.sub(r"[^a-z0-9]+", "-", company.name.lower()).strip("-") or f"company-{company.id}"
-    )
-    generated_ts = invoice.generated_at.strftime("%Y%m%d_%H%M")
-    filename = f"{safe_company_name}_{generated_ts}.pdf"
+    selected_template = InvoicePDFService.resolve_template_key(bundle.invoice, template_key)
+    filename = _pdf_filename(bundle)
+    cache_key = _pdf_cache_key(request, bundle, selected_template, group_by)
+
+    response: Response
+    if cache_key is not None and request.headers.get("if-none-match") == f'"{cache_key}"':
+        response = Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": f'"{cache_key}"'}
+        )
+    else:
+        pdf = await _render_pdf(request, bundle, selected_template, cache_key, group_by)
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+        if cache_key is not None:
+            headers["ETag"] = f'"{cache_key}"'
+        response = Response(content=pdf, media_type="application/pdf", headers=headers)
+
     await audit_event(
         request,
         actor=current_admin.username,
         tenant_id=current_admin.transport_company_id,
         resource="invoice_pdf",
-        resource_id=str(invoice.id),
+        resource_id=str(bundle.invoice.id),
         action="download",
-        metadata={"trip_count": len(trips), "template": template_key or "default"},
+        metadata={
+            "trip_count": len(bundle.snapshot["trips"]),
+            "template": template_key or "default",
+            "group_by": group_by,
+        },
     )
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    return response
+
+
+@router.post(
+    "/{invoice_id}/pdf-jobs",
+    response_model=PdfRenderJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_invoice_pdf_job(
+    request: Request,
+    response: Response,
+    invoice_id: int,
+    session: DBSessionDep,
+    current_admin: CurrentAdminDep,
+    settings: SettingsDep,
+    template_key: str | None = Query(default=None, alias="template"),
+    group_by: Literal["date", "destination"] | None = Query(default=None),
+) -> PdfRenderJobRead:
+    enforce_sensitive_export_step_up(request, settings)
+    job = await pdf_job_handler.create_job(
+        session,
+        current_admin.transport_company_id,
+        invoice_id,
+        template_key,
+        current_admin.username,
+        group_by,
+    )
+    await audit_event(
+        request,
+        actor=current_admin.username,
+        tenant_id=current_admin.transport_company_id,
+        resource="invoice_pdf",
+        resource_id=str(invoice_id),
+        action="queue",
+        metadata={
+            "job_id": job.id,
+            "template": template_key or "default",
+            "group_by": group_by,
+        },
     )
+    response.headers["Location"] = str(request.url_for("get_pdf_job", job_id=job.id))
+    return PdfRenderJobRead.model_validate(job)
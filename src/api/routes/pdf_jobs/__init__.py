@@ -0,0 +1,3 @@
+from src.api.routes.pdf_jobs.router import router
+
+__all__ = ["router"]
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Request, Response
+
+from src.api.deps import CurrentAdminDep, DBSessionDep, SettingsDep
+from src.core.audit import audit_event, enforce_sensitive_export_step_up
+from src.handlers.pdf_render_job import PdfRenderJobHandler
+from src.models.pdf_render_job import PDF_JOB_SUCCEEDED, PdfRenderJob
+from src.schemas.pdf_render_job import PdfRenderJobRead
+
+router = APIRouter(prefix="/pdf-jobs", tags=["pdf-jobs"])
+handler = PdfRenderJobHandler()
+
+
+def _serialize_job(request: Request, job: PdfRenderJob) -> PdfRenderJobRead:
+    payload = PdfRenderJobRead.model_validate(job)
+    if job.status == PDF_JOB_SUCCEEDED:
+        payload.result_url = str(request.url_for("download_pdf_job_result", job_id=job.id))
+    return payload
+
+
+@router.get("/{job_id}", response_model=PdfRenderJobRead)
+async def get_pdf_job(
+    request: Request,
+    job_id: int,
+    session: DBSessionDep,
+    current_admin: CurrentAdminDep,
+) -> PdfRenderJobRead:
+    job = await handler.get_job(session, current_admin.transport_company_id, job_id)
+    return _serialize_job(request, job)
+
+
+@router.get("/{job_id}/result")
+async def download_pdf_job_result(
+    request: Request,
+    job_id: int,
+    session: DBSessionDep,
+    current_admin: CurrentAdminDep,
+    settings: SettingsDep,
+) -> Response:
+    enforce_sensitive_export_step_up(request, settings)
+    job, content = await handler.get_result(session, current_admin.transport_company_id, job_id)
+    await audit_event(
+        request,
+        actor=current_admin.username,
+        tenant_id=current_admin.transport_company_id,
+        resource="invoice_pdf",
+        resource_id=str(job.invoice_id),
+        action="download",
+        metadata={"job_id": job.id, "template": job.template_key or "default"},
+    )
+    filename = f"invoice_{job.invoice_id}_{job.id}.pdf"
+    return Response(
+        content=content,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request, status
 
 from src.api.deps import CurrentAdminDep, DBSessionDep
+from src.core.responses import ProjectedJSONResponse
 from src.handlers.public_request import PublicRequestHandler
 from src.schemas.contact import ContactRequestCreate, ContactRequestRead, ContactRequestUpdate
 from src.schemas.quote import QuoteRequestCreate, QuoteRequestRead, QuoteRequestUpdate
@@ -26,9 +27,9 @@ async def create_contact_request(
 async def list_contact_requests(
     session: DBSessionDep,
     current_admin: CurrentAdminDep,
-) -> list[ContactRequestRead]:
+) -> ProjectedJSONResponse:
     requests = await handler.list_contact_requests(session, current_admin.transport_company_id)
-    return [ContactRequestRead.model_validate(item) for item in requests]
+    return ProjectedJSONResponse(requests)
 
 
 @router.patch("/contact-requests/{request_id}", response_model=ContactRequestRead)
@@ -61,9 +62,9 @@ async def create_quote_request(
 async def list_quote_requests(
     session: DBSessionDep,
     current_admin: CurrentAdminDep,
-) -> list[QuoteRequestRead]:
+) -> ProjectedJSONResponse:
     requests = await handler.list_quote_requests(session, current_admin.transport_company_id)
-    return [QuoteRequestRead.model_validate(item) for item in requests]
+    return ProjectedJSONResponse(requests)
 
 
 @router.patch("/quote-requests/{request_id}", response_model=QuoteRequestRead)
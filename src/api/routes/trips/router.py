@@ -1,176 +1,216 @@
+import asyncio
 import csv
-from collections import defaultdict
+from collections.abc import AsyncIterator
 from datetime import date
+from decimal import Decimal
 from io import StringIO
 
-from fastapi import APIRouter, Query, Request, Response, status
+from fastapi import APIRouter, File, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import CurrentAdminDep, DBSessionDep, SettingsDep
+from src.api.deps import (
+    CurrentAdminDep,
+    DBSessionDep,
+    ReadDBSessionDep,
+    ReadSessionFactoryDep,
+    SettingsDep,
+)
 from src.core.audit import audit_event, enforce_sensitive_export_step_up
 from src.core.exceptions import AppException
+from src.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
+from src.core.responses import ProjectedJSONResponse
 from src.handlers.trip import TripHandler
 from src.models.company import Company
 from src.models.driver import Driver
-from src.schemas.trip import TripCreate, TripRead, TripUpdate
+from src.models.invoice import Invoice
+from src.models.trip import Trip
+from src.schemas.trip import (
+    TripBatchCreate,
+    TripBatchUpdate,
+    TripBatchUpdateResult,
+    TripCreate,
+    TripImportResult,
+    TripRead,
+    TripUpdate,
+)
+from src.services.invoice_pdf_cache import InvoicePDFCache
+from src.services.trip_import import TripImportService
 
 router = APIRouter(prefix="/trips", tags=["trips"])
 handler = TripHandler()
+# Rows per database fetch and per chunk flushed to the client during CSV export.
+EXPORT_CHUNK_SIZE = 500
+
+
+def _ensure_batch_size(operations: int, limit: int) -> None:
+    if operations > limit:
+        raise AppException(f"Trip batch exceeds {limit} operations", status_code=400)
+
+
+async def _invalidate_invoice_pdfs(
+    request: Request, session: AsyncSession, trips: list[Trip]
+) -> None:
+    cache: InvoicePDFCache | None = request.app.state.invoice_pdf_cache
+    invoice_ids = {trip.invoice_id for trip in trips if trip.invoice_id is not None}
+    if cache is None or not invoice_ids:
+        return
+    # Invoices with a line snapshot never re-read their trips, so their PDFs stay valid.
+    legacy_invoice_ids = await session.scalars(
+        select(Invoice.id)
+        .where(Invoice.transport_company_id == trips[0].transport_company_id)
+        .where(Invoice.id.in_(invoice_ids))
+        .where(Invoice.line_snapshot.is_(None))
+    )
+    for invoice_id in legacy_invoice_ids:
+        await asyncio.to_thread(cache.invalidate, invoice_id)
 
 
 @router.get("", response_model=list[TripRead])
 async def list_trips(
-    session: DBSessionDep,
+    session: ReadDBSessionDep,
     current_admin: CurrentAdminDep,
     company_id: int | None = Query(default=None),
     paid: bool | None = Query(default=None),
     driver_id: int | None = Query(default=None),
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
-) -> list[TripRead]:
-    trips = await handler.list_trips(
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = Query(default=None, max_length=256),
+) -> ProjectedJSONResponse:
+    page = await handler.list_trips_page(
         session,
         current_admin.transport_company_id,
-        company_id,
-        paid,
-        driver_id,
-        start_date,
-        end_date,
+        limit=limit,
+        cursor=cursor,
+        company_id=company_id,
+        paid=paid,
+        driver_id=driver_id,
+        start_date=start_date,
+        end_date=end_date,
     )
-    return [TripRead.model_validate(entity) for entity in trips]
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor is not None else None
+    return ProjectedJSONResponse(page.items, headers=headers)
 
 
 @router.get("/driver-report")
 async def driver_report(
-    session: DBSessionDep,
+    session: ReadDBSessionDep,
     current_admin: CurrentAdminDep,
     driver_id: int | None = Query(default=None),
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
 ) -> list[dict[str, str | int]]:
-    trips = await handler.list_trips(
-        session=session,
-        transport_company_id=current_admin.transport_company_id,
-        company_id=None,
-        paid=None,
+    rows = await handler.driver_report(
+        session,
+        current_admin.transport_company_id,
         driver_id=driver_id,
         start_date=start_date,
         end_date=end_date,
     )
-
-    grouped: dict[str, dict[str, int | str | float]] = defaultdict(
-        lambda: {"trip_count": 0, "amount_excl_vat_total": 0.0}
-    )
-    for trip in trips:
-        key = trip.driver
-        grouped[key]["driver_name"] = key
-        grouped[key]["trip_count"] = int(grouped[key]["trip_count"]) + 1
-        grouped[key]["amount_excl_vat_total"] = float(
-            grouped[key]["amount_excl_vat_total"]
-        ) + float(trip.amount)
-
-    rows = sorted(grouped.values(), key=lambda item: str(item["driver_name"]).lower())
     return [
         {
-            "driver_name": str(row["driver_name"]),
-            "trip_count": int(row["trip_count"]),
-            "amount_excl_vat_total": f"{float(row['amount_excl_vat_total']):.2f}",
+            "driver_name": driver_name,
+            "trip_count": trip_count,
+            "amount_excl_vat_total": f"{amount_total:.2f}",
         }
-        for row in rows
+        for driver_name, trip_count, amount_total in rows
     ]
 
 
 @router.get("/driver-report/export")
 async def export_driver_report(
     request: Request,
-    session: DBSessionDep,
+    session: ReadDBSessionDep,
+    read_session_factory: ReadSessionFactoryDep,
     current_admin: CurrentAdminDep,
     settings: SettingsDep,
     driver_id: int | None = Query(default=None),
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
-) -> Response:
+) -> StreamingResponse:
     enforce_sensitive_export_step_up(request, settings)
+    transport_company_id = current_admin.transport_company_id
     if driver_id is not None:
         driver_stmt: Select[tuple[Driver]] = (
             select(Driver)
             .where(Driver.id == driver_id)
-            .where(Driver.transport_company_id == current_admin.transport_company_id)
+            .where(Driver.transport_company_id == transport_company_id)
         )
         driver_result = await session.execute(driver_stmt)
         if driver_result.scalar_one_or_none() is None:
             raise AppException("Driver not found", status_code=404)
 
-    trips = await handler.list_trips(
-        session=session,
-        transport_company_id=current_admin.transport_company_id,
-        company_id=None,
-        paid=None,
-        driver_id=driver_id,
-        start_date=start_date,
-        end_date=end_date,
+    company_stmt = select(Company.id, Company.name).where(
+        Company.transport_company_id == transport_company_id
     )
+    company_result = await session.execute(company_stmt)
+    company_name_by_id: dict[int, str] = {row.id: row.name for row in company_result.all()}
 
-    company_ids = sorted({trip.company_id for trip in trips})
-    company_name_by_id: dict[int, str] = {}
-    if company_ids:
-        stmt: Select[tuple[Company]] = (
-            select(Company)
-            .where(Company.id.in_(company_ids))
-            .where(Company.transport_company_id == current_admin.transport_company_id)
-        )
-        company_result = await session.execute(stmt)
-        company_name_by_id = {
-            company.id: company.name for company in company_result.scalars().all()
-        }
-
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "Trip ID",
-            "Date",
-            "Driver",
-            "Company Name",
-            "Origin",
-            "Destination",
-            "Amount (AED, excl. VAT)",
-        ]
-    )
-    total = 0.0
-    for trip in trips:
-        amount = float(trip.amount)
-        total += amount
+    async def csv_rows() -> AsyncIterator[str]:
+        buffer = StringIO()
+        writer = csv.writer(buffer)
         writer.writerow(
             [
-                trip.id,
-                trip.date.isoformat(),
-                trip.driver,
-                company_name_by_id.get(trip.company_id, f"Company #{trip.company_id}"),
-                trip.origin,
-                trip.destination,
-                f"{amount:.2f}",
+                "Trip ID",
+                "Date",
+                "Driver",
+                "Company Name",
+                "Origin",
+                "Destination",
+                "Amount (AED, excl. VAT)",
             ]
         )
-    writer.writerow([])
-    writer.writerow(["", "", "", "", "", "Total", f"{total:.2f}"])
+        total = Decimal("0.00")
+        trip_count = 0
+        async with read_session_factory() as stream_session:
+            async for trip in handler.stream_trips(
+                stream_session,
+                transport_company_id,
+                driver_id=driver_id,
+                start_date=start_date,
+                end_date=end_date,
+                chunk_size=EXPORT_CHUNK_SIZE,
+            ):
+                total += trip.amount
+                trip_count += 1
+                writer.writerow(
+                    [
+                        trip.id,
+                        trip.date.isoformat(),
+                        trip.driver,
+                        company_name_by_id.get(trip.company_id, f"Company #{trip.company_id}"),
+                        trip.origin,
+                        trip.destination,
+                        f"{trip.amount:.2f}",
+                    ]
+                )
+                if trip_count % EXPORT_CHUNK_SIZE == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate(0)
 
-    await audit_event(
-        request,
-        actor=current_admin.username,
-        tenant_id=current_admin.transport_company_id,
-        resource="driver_report",
-        action="export",
-        metadata={
-            "driver_id": driver_id,
-            "start_date": start_date.isoformat() if start_date else None,
-            "end_date": end_date.isoformat() if end_date else None,
-            "trip_count": len(trips),
-        },
-    )
+        writer.writerow([])
+        writer.writerow(["", "", "", "", "", "Total", f"{total:.2f}"])
+        yield buffer.getvalue()
 
-    return Response(
-        content=output.getvalue(),
+        await audit_event(
+            request,
+            actor=current_admin.username,
+            tenant_id=transport_company_id,
+            resource="driver_report",
+            action="export",
+            metadata={
+                "driver_id": driver_id,
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None,
+                "trip_count": trip_count,
+            },
+        )
+
+    return StreamingResponse(
+        csv_rows(),
         media_type="text/csv",
         headers={"Content-Disposition": 'attachment; filename="driver_report.csv"'},
     )
@@ -186,6 +226,62 @@ async def create_trip(
     return TripRead.model_validate(trip)
 
 
+@router.post("/batch", response_model=list[TripRead], status_code=status.HTTP_201_CREATED)
+async def create_trips_batch(
+    payload: TripBatchCreate,
+    session: DBSessionDep,
+    current_admin: CurrentAdminDep,
+    settings: SettingsDep,
+) -> list[TripRead]:
+    _ensure_batch_size(len(payload.trips), settings.trip_batch_max_operations)
+    trips = await handler.create_trips(session, current_admin.transport_company_id, payload.trips)
+    return [TripRead.model_validate(trip) for trip in trips]
+
+
+@router.patch("/batch", response_model=TripBatchUpdateResult)
+async def update_trips_batch(
+    request: Request,
+    payload: TripBatchUpdate,
+    session: DBSessionDep,
+    current_admin: CurrentAdminDep,
+    settings: SettingsDep,
+) -> TripBatchUpdateResult:
+    _ensure_batch_size(
+        len(payload.trips) + len(payload.delete_ids), settings.trip_batch_max_operations
+    )
+    updated, deleted = await handler.update_trips(
+        session, current_admin.transport_company_id, payload.trips, payload.delete_ids
+    )
+    await _invalidate_invoice_pdfs(request, session, updated)
+    return TripBatchUpdateResult(
+        updated=[TripRead.model_validate(trip) for trip in updated],
+        deleted=deleted,
+    )
+
+
+@router.post("/import", response_model=TripImportResult)
+async def import_trips(
+    request: Request,
+    session: DBSessionDep,
+    current_admin: CurrentAdminDep,
+    file: UploadFile = File(...),
+) -> TripImportResult:
+    rows = TripImportService.iter_rows(file.file, file.filename, file.content_type)
+    result = await handler.import_trips(session, current_admin.transport_company_id, rows)
+    await audit_event(
+        request,
+        actor=current_admin.username,
+        tenant_id=current_admin.transport_company_id,
+        resource="trip",
+        action="import",
+        metadata={
+            "created": result.created,
+            "skipped": len(result.skipped),
+        },
+    )
+    return result
+
+
 @router.get("/{trip_id}", response_model=TripRead)
 async def get_trip(
     trip_id: int,
@@ -198,12 +294,14 @@ async def get_trip(
 
 @router.patch("/{trip_id}", response_model=TripRead)
 async def update_trip(
+    request: Request,
     trip_id: int,
     payload: TripUpdate,
     session: DBSessionDep,
     current_admin: CurrentAdminDep,
 ) -> TripRead:
     trip = await handler.update_trip(session, current_admin.transport_company_id, trip_id, payload)
+    await _invalidate_invoice_pdfs(request, session, [trip])
     return TripRead.model_validate(trip)
 
 
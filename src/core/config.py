@@ -17,6 +17,21 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./db.sqlite3",
         description="Async SQLAlchemy database URL.",
     )
+    database_read_url: str = Field(
+        default="",
+        description="Optional async SQLAlchemy URL of a read replica for read-only endpoints.",
+    )
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_pool_order: Literal["fifo", "lifo"] = "fifo"
+    db_pool_warmup_enabled: bool = True
+    db_server_max_connections: int | None = None
+    db_statement_cache_size: int = 100
+    db_prepared_statement_cache_size: int = 100
+    db_command_timeout_seconds: float | None = None
 
     secret_key: str = Field(default="dev-only-change-me", min_length=16)
     jwt_previous_secret_keys: str = ""
@@ -63,6 +78,21 @@ class Settings(BaseSettings):
     max_auth_body_bytes: int = 16 * 1024
     max_upload_body_bytes: int = 6 * 1024 * 1024
     max_public_request_body_bytes: int = 128 * 1024
+    trip_batch_max_operations: int = 200
+    invoice_legacy_trip_fallback_enabled: bool = True
+    invoice_pdf_cache_dir: str = ""
+    invoice_pdf_cache_max_bytes: int = 256 * 1024 * 1024
+    invoice_pdf_render_workers: int = 2
+    invoice_pdf_render_max_pending: int = 8
+    invoice_pdf_render_timeout_seconds: float = 30.0
+    invoice_pdf_archive_parallelism: int = 2
+    invoice_pdf_prerender_enabled: bool = False
+    pdf_job_worker_enabled: bool = False
+    pdf_job_worker_concurrency: int = 2
+    pdf_job_poll_interval_seconds: float = 1.0
+    pdf_job_render_timeout_seconds: float = 120.0
+    pdf_job_stale_after_seconds: float = 300.0
+    pdf_job_max_attempts: int = 3
     sensitive_export_step_up_required: bool = False
     sensitive_export_step_up_token: str = ""
     audit_hash_key: str = "dev-audit-hash-key-change-me"
@@ -103,6 +133,55 @@ class Settings(BaseSettings):
             raise ValueError("MAX_UPLOAD_BODY_BYTES must be > 0.")
         if self.max_public_request_body_bytes <= 0:
             raise ValueError("MAX_PUBLIC_REQUEST_BODY_BYTES must be > 0.")
+        if self.trip_batch_max_operations <= 0:
+            raise ValueError("TRIP_BATCH_MAX_OPERATIONS must be > 0.")
+        if self.invoice_pdf_cache_max_bytes <= 0:
+            raise ValueError("INVOICE_PDF_CACHE_MAX_BYTES must be > 0.")
+        if self.invoice_pdf_render_workers < 0:
+            raise ValueError("INVOICE_PDF_RENDER_WORKERS must be >= 0.")
+        if self.invoice_pdf_render_max_pending <= 0:
+            raise ValueError("INVOICE_PDF_RENDER_MAX_PENDING must be > 0.")
+        if self.invoice_pdf_render_timeout_seconds <= 0:
+            raise ValueError("INVOICE_PDF_RENDER_TIMEOUT_SECONDS must be > 0.")
+        if not 0 < self.invoice_pdf_archive_parallelism <= self.invoice_pdf_render_max_pending:
+            raise ValueError(
+                "INVOICE_PDF_ARCHIVE_PARALLELISM must be > 0 and <= "
+                "INVOICE_PDF_RENDER_MAX_PENDING."
+            )
+        if self.invoice_pdf_prerender_enabled and not self.invoice_pdf_cache_dir.strip():
+            raise ValueError("INVOICE_PDF_PRERENDER_ENABLED requires INVOICE_PDF_CACHE_DIR.")
+        if self.pdf_job_worker_concurrency <= 0:
+            raise ValueError("PDF_JOB_WORKER_CONCURRENCY must be > 0.")
+        if self.pdf_job_poll_interval_seconds <= 0:
+            raise ValueError("PDF_JOB_POLL_INTERVAL_SECONDS must be > 0.")
+        if self.pdf_job_render_timeout_seconds <= 0:
+            raise ValueError("PDF_JOB_RENDER_TIMEOUT_SECONDS must be > 0.")
+        if self.pdf_job_stale_after_seconds <= self.pdf_job_render_timeout_seconds:
+            raise ValueError(
+                "PDF_JOB_STALE_AFTER_SECONDS must be > PDF_JOB_RENDER_TIMEOUT_SECONDS."
+            )
+        if self.pdf_job_max_attempts <= 0:
+            raise ValueError("PDF_JOB_MAX_ATTEMPTS must be > 0.")
+        if self.db_pool_size <= 0:
+            raise ValueError("DB_POOL_SIZE must be > 0.")
+        if self.db_max_overflow < 0:
+            raise ValueError("DB_MAX_OVERFLOW must be >= 0.")
+        if self.db_pool_timeout_seconds <= 0:
+            raise ValueError("DB_POOL_TIMEOUT_SECONDS must be > 0.")
+        if self.db_statement_cache_size < 0:
+            raise ValueError("DB_STATEMENT_CACHE_SIZE must be >= 0.")
+        if self.db_prepared_statement_cache_size < 0:
+            raise ValueError("DB_PREPARED_STATEMENT_CACHE_SIZE must be >= 0.")
+        if self.db_command_timeout_seconds is not None and self.db_command_timeout_seconds <= 0:
+            raise ValueError("DB_COMMAND_TIMEOUT_SECONDS must be > 0 when set.")
+        if (
+            self.db_server_max_connections is not None
+            and self.db_max_connections_total > self.db_server_max_connections
+        ):
+            raise ValueError(
+                "WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) must not exceed "
+                "DB_SERVER_MAX_CONNECTIONS."
+            )
         if self.auth_rate_limit_window_seconds <= 0:
             raise ValueError("AUTH_RATE_LIMIT_WINDOW_SECONDS must be > 0.")
         if self.auth_rate_limit_ip_max_attempts <= 0:
@@ -153,6 +232,8 @@ class Settings(BaseSettings):
                 raise ValueError("DEBUG must be false in production.")
             if self.database_url.startswith("sqlite"):
                 raise ValueError("DATABASE_URL cannot use sqlite in production.")
+            if self.database_read_url.startswith("sqlite"):
+                raise ValueError("DATABASE_READ_URL cannot use sqlite in production.")
             if not self.signature_encryption_enabled:
                 raise ValueError("SIGNATURE_ENCRYPTION_ENABLED must be true in production.")
             if (
@@ -187,6 +268,10 @@ class Settings(BaseSettings):
                 unique.append(key)
         return unique
 
+    @property
+    def db_max_connections_total(self) -> int:
+        return self.web_concurrency * (self.db_pool_size + self.db_max_overflow)
+
     @property
     def is_production(self) -> bool:
         return self.app_env.lower() in {"prod", "production"}
@@ -106,7 +106,11 @@ def _resolve_body_limit(*, settings: Settings, path: str, method: str) -> int:
         return settings.max_auth_body_bytes
     if path.startswith(f"{settings.api_v1_prefix.rstrip('/')}/public/"):
         return settings.max_public_request_body_bytes
-    if path.endswith("/employee-salaries/import") or "/invoices/signatories" in path:
+    if (
+        path.endswith("/employee-salaries/import")
+        or path.endswith("/trips/import")
+        or "/invoices/signatories" in path
+    ):
         return settings.max_upload_body_bytes
     return settings.max_request_body_bytes
 
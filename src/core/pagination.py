@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from src.core.exceptions import AppException
+
+ItemT = TypeVar("ItemT")
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CursorValue = str | int
+
+
+@dataclass(slots=True)
+class Page(Generic[ItemT]):
+    items: list[ItemT] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: Sequence[CursorValue]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> list[CursorValue]:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise AppException("Invalid pagination cursor", status_code=400) from exc
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(isinstance(item, str | int) for item in values)
+    ):
+        raise AppException("Invalid pagination cursor", status_code=400)
+    return values
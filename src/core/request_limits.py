@@ -84,14 +84,22 @@ class RequestRateLimiter:
             scopes.append(("auth", self.auth_max_requests))
 
         if upper_method in {"POST", "PUT", "PATCH"} and (
-            path.endswith("/employee-salaries/import") or "/invoices/signatories" in path
+            path.endswith("/employee-salaries/import")
+            or path.endswith("/trips/import")
+            or "/invoices/signatories" in path
         ):
             scopes.append(("upload", self.upload_max_requests))
 
-        if upper_method == "GET" and (
-            path.endswith("/employee-salaries/export")
-            or path.endswith("/driver-report/export")
-            or path.endswith("/pdf")
+        if (
+            upper_method == "GET"
+            and (
+                path.endswith("/employee-salaries/export")
+                or path.endswith("/driver-report/export")
+                or path.endswith("/pdf")
+                or path.endswith("/invoices/pdf-archive")
+                or ("/pdf-jobs/" in path and path.endswith("/result"))
+            )
+            or (upper_method == "POST" and path.endswith("/pdf-jobs"))
         ):
             scopes.append(("export", self.export_max_requests))
         return scopes
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+from sqlalchemy import Row
+
+
+class ProjectedJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Iterable[Row[Any]]) -> bytes:
+        # Rows come from read_columns(), so their labels already match the read schema.
+        return to_json([row._asdict() for row in content])
@@ -1,7 +1,15 @@
 """Database layer package."""
 
 from src.db.db_handler import GenericDBHandler
-from src.db.session import SessionFactory, create_engine, create_session_factory, get_db_session
+from src.db.session import (
+    ReadSessionFactory,
+    SessionFactory,
+    create_engine,
+    create_read_engine,
+    create_session_factory,
+    get_db_session,
+    get_read_db_session,
+)
 
 __all__ = [
     "GenericDBHandler",
@@ -9,4 +17,7 @@ __all__ = [
     "create_session_factory",
     "SessionFactory",
     "get_db_session",
+    "create_read_engine",
+    "ReadSessionFactory",
+    "get_read_db_session",
 ]
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import Select, delete, select
+from sqlalchemy import Insert, Select, delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.base import Base
 
 ModelT = TypeVar("ModelT", bound=Base)
 
+# asyncpg and SQLite both cap a statement at roughly 32k bound parameters.
+MAX_BIND_PARAMETERS = 32_000
+DEFAULT_BULK_CHUNK_SIZE = 500
+
 
 class GenericDBHandler(Generic[ModelT]):
     def __init__(self, model: type[ModelT]) -> None:
@@ -68,3 +73,85 @@ class GenericDBHandler(Generic[ModelT]):
             if column in values and column not in conflict_columns
         }
         return await self.update(session, entity, updates)
+
+    async def bulk_create(
+        self,
+        session: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> Sequence[ModelT]:
+        entities: list[ModelT] = []
+        # Batched RETURNING rows only come back in input order when asked to.
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        for chunk in self._chunks(rows, chunk_size):
+            result = await session.scalars(stmt, chunk)
+            entities.extend(result.all())
+        await session.commit()
+        return entities
+
+    async def bulk_upsert(
+        self,
+        session: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> Sequence[ModelT]:
+        dialect_name = session.get_bind().dialect.name
+        # PostgreSQL cannot update one row twice in a statement, so the last duplicate wins.
+        unique_rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for row in rows:
+            unique_rows[self._conflict_key(row, conflict_columns)] = row
+        deduplicated = list(unique_rows.values())
+        entities: list[ModelT] = []
+        for chunk in self._chunks(deduplicated, chunk_size):
+            stmt = self._upsert_stmt(dialect_name, chunk, conflict_columns, update_columns)
+            result = await session.scalars(
+                stmt.returning(self.model, sort_by_parameter_order=True),
+                chunk,
+                execution_options={"populate_existing": True},
+            )
+            entities.extend(result.all())
+        await session.commit()
+        by_key = dict(zip(unique_rows, entities, strict=True))
+        return [by_key[self._conflict_key(row, conflict_columns)] for row in rows]
+
+    @staticmethod
+    def _conflict_key(row: dict[str, Any], conflict_columns: Sequence[str]) -> tuple[Any, ...]:
+        return tuple(row[column] for column in conflict_columns)
+
+    def _upsert_stmt(
+        self,
+        dialect_name: str,
+        chunk: Sequence[dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None,
+    ) -> Insert:
+        stmt: postgresql.Insert | sqlite.Insert
+        if dialect_name == "postgresql":
+            stmt = postgresql.insert(self.model)
+        elif dialect_name == "sqlite":
+            stmt = sqlite.insert(self.model)
+        else:
+            raise ValueError(f"bulk_upsert is not supported for dialect {dialect_name!r}")
+
+        table = self.model.__table__
+        columns = update_columns or [key for key in chunk[0] if key not in conflict_columns]
+        set_ = {column: stmt.excluded[column] for column in columns}
+        for column in table.columns:
+            if column.onupdate is not None and column.name not in set_:
+                set_[column.name] = stmt.excluded[column.name]
+        if not set_:
+            # DO NOTHING would drop existing rows from RETURNING; a no-op update keeps them.
+            set_ = {conflict_columns[0]: stmt.excluded[conflict_columns[0]]}
+        return stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+
+    def _chunks(
+        self, rows: Sequence[dict[str, Any]], chunk_size: int
+    ) -> Iterator[Sequence[dict[str, Any]]]:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
+        width = max(len(self.model.__table__.columns), 1)
+        size = max(1, min(chunk_size, MAX_BIND_PARAMETERS // width))
+        for start in range(0, len(rows), size):
+            yield rows[start : start + size]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, inspect
+
+from src.db.base import Base
+
+
+def read_columns(
+    model: type[Base],
+    schema: type[BaseModel],
+    **overrides: ColumnElement[Any],
+) -> list[ColumnElement[Any]]:
+    mapper = inspect(model)
+    columns: list[ColumnElement[Any]] = []
+    for name in schema.model_fields:
+        if name in overrides:
+            columns.append(overrides[name].label(name))
+        elif name in mapper.column_attrs:
+            columns.append(getattr(model, name))
+        else:
+            raise ValueError(f"{schema.__name__}.{name} has no column on {model.__name__}")
+    return columns
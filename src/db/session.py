@@ -1,26 +1,94 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
+from typing import Any
 
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from starlette.requests import Request
 
 from src.core.config import Settings, get_settings
 
+READ_CONSISTENCY_HEADER = "X-Read-Consistency"
+
+
+def engine_options(settings: Settings, database_url: str | None = None) -> dict[str, Any]:
+    url = make_url(database_url or settings.database_url)
+    options: dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if url.get_backend_name() == "sqlite":
+        # SQLite engines use SQLAlchemy's single-file pools; sizing knobs do not apply.
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_use_lifo=settings.db_pool_order == "lifo",
+    )
+    if url.get_driver_name() == "asyncpg":
+        connect_args: dict[str, Any] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        }
+        if settings.db_command_timeout_seconds is not None:
+            connect_args["command_timeout"] = settings.db_command_timeout_seconds
+        options["connect_args"] = connect_args
+    return options
+
 
 def create_engine(settings: Settings | None = None) -> AsyncEngine:
     active_settings = settings or get_settings()
     return create_async_engine(
         active_settings.database_url,
-        pool_pre_ping=True,
         future=True,
+        **engine_options(active_settings),
+    )
+
+
+def create_read_engine(settings: Settings | None = None) -> AsyncEngine | None:
+    active_settings = settings or get_settings()
+    read_url = active_settings.database_read_url.strip()
+    if not read_url:
+        return None
+    return create_async_engine(
+        read_url,
+        future=True,
+        **engine_options(active_settings, read_url),
     )
 
 
+async def measure_replica_lag(target: AsyncEngine) -> float | None:
+    if target.dialect.name != "postgresql":
+        return None
+    async with target.connect() as connection:
+        result = await connection.execute(
+            text(
+                "SELECT CASE "
+                "WHEN NOT pg_is_in_recovery() THEN 0 "
+                "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+            )
+        )
+        lag = result.scalar_one_or_none()
+    return float(lag) if lag is not None else None
+
+
+async def warm_engine_pool(target: AsyncEngine, connections: int) -> None:
+    async def _checkout() -> None:
+        async with target.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_checkout() for _ in range(max(connections, 0))))
+
+
 def create_session_factory(
     engine: AsyncEngine,
 ) -> async_sessionmaker[AsyncSession]:
@@ -34,8 +102,27 @@ def create_session_factory(
 
 engine = create_engine()
 SessionFactory = create_session_factory(engine)
+read_engine = create_read_engine()
+ReadSessionFactory = (
+    create_session_factory(read_engine) if read_engine is not None else SessionFactory
+)
 
 
 async def get_db_session() -> AsyncIterator[AsyncSession]:
     async with SessionFactory() as session:
         yield session
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return SessionFactory
+
+
+def get_read_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    # Callers that must observe their own recent writes can pin the read to the primary.
+    wants_primary = request.headers.get(READ_CONSISTENCY_HEADER, "").strip().lower() == "primary"
+    return SessionFactory if wants_primary else ReadSessionFactory
+
+
+async def get_read_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    async with get_read_session_factory(request)() as session:
+        yield session
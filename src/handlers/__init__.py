@@ -5,6 +5,7 @@ from src.handlers.driver import DriverHandler
 from src.handlers.driver_cash_handover import DriverCashHandoverHandler
 from src.handlers.employee_salary import EmployeeSalaryHandler
 from src.handlers.invoice import InvoiceHandler
+from src.handlers.pdf_render_job import PdfRenderJobHandler
 from src.handlers.public_request import PublicRequestHandler
 from src.handlers.trip import TripHandler
 
@@ -15,5 +16,6 @@ __all__ = [
     "EmployeeSalaryHandler",
     "TripHandler",
     "InvoiceHandler",
+    "PdfRenderJobHandler",
     "PublicRequestHandler",
 ]
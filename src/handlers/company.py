@@ -1,22 +1,28 @@
-from sqlalchemy import Select, select
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import AppException
+from src.db.projection import read_columns
 from src.models.company import Company
-from src.schemas.company import CompanyCreate, CompanyUpdate
+from src.schemas.company import CompanyCreate, CompanyRead, CompanyUpdate
+
+COMPANY_READ_COLUMNS = read_columns(Company, CompanyRead)
 
 
 class CompanyHandler:
     async def list_companies(
         self, session: AsyncSession, transport_company_id: int
-    ) -> list[Company]:
-        stmt: Select[tuple[Company]] = (
-            select(Company)
+    ) -> Sequence[Row[Any]]:
+        stmt = (
+            select(*COMPANY_READ_COLUMNS)
             .where(Company.transport_company_id == transport_company_id)
             .order_by(Company.id.asc())
         )
         result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return result.all()
 
     async def create_company(
         self,
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import AppException
@@ -18,13 +16,6 @@ from src.schemas.driver_cash_handover import (
 )
 
 
-@dataclass
-class _SummaryAccumulator:
-    trip_count: int = 0
-    earned: Decimal = Decimal("0.00")
-    handover: Decimal = Decimal("0.00")
-
-
 class DriverCashHandoverHandler:
     async def list_handovers(
         self,
@@ -78,63 +69,73 @@ class DriverCashHandoverHandler:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> list[DriverCashSummaryRow]:
-        accum: dict[int, _SummaryAccumulator] = defaultdict(_SummaryAccumulator)
-
-        trip_stmt: Select[tuple[Trip]] = (
-            select(Trip)
-            .where(Trip.transport_company_id == transport_company_id)
-            .where(Trip.driver_id.is_not(None))
-        )
+        trip_filters = [
+            Trip.transport_company_id == transport_company_id,
+            Trip.driver_id.is_not(None),
+        ]
+        handover_filters = [DriverCashHandover.transport_company_id == transport_company_id]
         if driver_id is not None:
-            trip_stmt = trip_stmt.where(Trip.driver_id == driver_id)
+            trip_filters.append(Trip.driver_id == driver_id)
+            handover_filters.append(DriverCashHandover.driver_id == driver_id)
         if start_date is not None:
-            trip_stmt = trip_stmt.where(Trip.date >= start_date)
+            trip_filters.append(Trip.date >= start_date)
+            handover_filters.append(DriverCashHandover.handover_date >= start_date)
         if end_date is not None:
-            trip_stmt = trip_stmt.where(Trip.date <= end_date)
-        trip_result = await session.execute(trip_stmt)
-        for trip in trip_result.scalars().all():
-            if trip.driver_id is None:
-                continue
-            rec = accum[trip.driver_id]
-            rec.trip_count += 1
-            rec.earned += trip.amount
+            trip_filters.append(Trip.date <= end_date)
+            handover_filters.append(DriverCashHandover.handover_date <= end_date)
 
-        handover_stmt: Select[tuple[DriverCashHandover]] = select(DriverCashHandover).where(
-            DriverCashHandover.transport_company_id == transport_company_id
+        trip_totals = (
+            select(
+                Trip.driver_id.label("driver_id"),
+                func.count(Trip.id).label("trip_count"),
+                func.sum(Trip.amount).label("earned"),
+            )
+            .where(*trip_filters)
+            .group_by(Trip.driver_id)
+            .subquery()
         )
-        if driver_id is not None:
-            handover_stmt = handover_stmt.where(DriverCashHandover.driver_id == driver_id)
-        if start_date is not None:
-            handover_stmt = handover_stmt.where(DriverCashHandover.handover_date >= start_date)
-        if end_date is not None:
-            handover_stmt = handover_stmt.where(DriverCashHandover.handover_date <= end_date)
-        handover_result = await session.execute(handover_stmt)
-        for handover in handover_result.scalars().all():
-            rec = accum[handover.driver_id]
-            rec.handover += handover.amount
-
-        if not accum:
-            return []
-
-        driver_ids = sorted(accum.keys())
-        driver_stmt: Select[tuple[Driver]] = (
-            select(Driver)
-            .where(Driver.id.in_(driver_ids))
+        handover_totals = (
+            select(
+                DriverCashHandover.driver_id.label("driver_id"),
+                func.sum(DriverCashHandover.amount).label("handover"),
+            )
+            .where(*handover_filters)
+            .group_by(DriverCashHandover.driver_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                Driver.id,
+                Driver.name,
+                func.coalesce(trip_totals.c.trip_count, 0),
+                func.coalesce(trip_totals.c.earned, Decimal("0.00")),
+                func.coalesce(handover_totals.c.handover, Decimal("0.00")),
+            )
+            .outerjoin(trip_totals, trip_totals.c.driver_id == Driver.id)
+            .outerjoin(handover_totals, handover_totals.c.driver_id == Driver.id)
             .where(Driver.transport_company_id == transport_company_id)
+            .where(
+                or_(
+                    trip_totals.c.driver_id.is_not(None),
+                    handover_totals.c.driver_id.is_not(None),
+                )
+            )
+            .order_by(func.lower(Driver.name), Driver.id)
         )
-        driver_result = await session.execute(driver_stmt)
-        names = {driver.id: driver.name for driver in driver_result.scalars().all()}
+        result = await session.execute(stmt)
 
-        rows = [
-            DriverCashSummaryRow(
-                driver_id=driver_key,
-                driver_name=names.get(driver_key, f"Driver #{driver_key}"),
-                trip_count=acc.trip_count,
-                earned_amount_total=acc.earned.quantize(Decimal("0.01")),
-                handover_amount_total=acc.handover.quantize(Decimal("0.01")),
-                balance_amount=(acc.earned - acc.handover).quantize(Decimal("0.01")),
+        rows: list[DriverCashSummaryRow] = []
+        for row_driver_id, driver_name, trip_count, earned, handover in result.all():
+            earned_total = Decimal(earned).quantize(Decimal("0.01"))
+            handover_total = Decimal(handover).quantize(Decimal("0.01"))
+            rows.append(
+                DriverCashSummaryRow(
+                    driver_id=row_driver_id,
+                    driver_name=driver_name,
+                    trip_count=int(trip_count),
+                    earned_amount_total=earned_total,
+                    handover_amount_total=handover_total,
+                    balance_amount=earned_total - handover_total,
+                )
             )
-            for driver_key, acc in accum.items()
-        ]
-        rows.sort(key=lambda item: item.driver_name.lower())
         return rows
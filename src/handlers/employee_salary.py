@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import Select, select
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import AppException
+from src.db.projection import read_columns
 from src.models.employee_salary import EmployeeSalary
 from src.schemas.employee_salary import (
     EmployeeSalaryCreate,
     EmployeeSalaryImportResult,
     EmployeeSalaryImportSkipped,
+    EmployeeSalaryRead,
     EmployeeSalaryUpdate,
 )
 from src.services.employee_salary_excel import (
@@ -18,6 +22,8 @@ from src.services.employee_salary_excel import (
     ParsedEmployeeSalarySkippedRow,
 )
 
+EMPLOYEE_SALARY_READ_COLUMNS = read_columns(EmployeeSalary, EmployeeSalaryRead)
+
 
 class EmployeeSalaryHandler:
     async def list_employees(
@@ -33,6 +39,19 @@ class EmployeeSalaryHandler:
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_employee_rows(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+    ) -> Sequence[Row[Any]]:
+        stmt = (
+            select(*EMPLOYEE_SALARY_READ_COLUMNS)
+            .where(EmployeeSalary.transport_company_id == transport_company_id)
+            .order_by(EmployeeSalary.id.asc())
+        )
+        result = await session.execute(stmt)
+        return result.all()
+
     async def get_employee(
         self,
         session: AsyncSession,
@@ -1,18 +1,44 @@
 from __future__ import annotations
 
-from datetime import UTC, date, datetime, timedelta
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import Select, select
+from sqlalchemy import ColumnElement, Row, Select, case, func, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from src.core.exceptions import AppException
+from src.core.pagination import Page, decode_cursor, encode_cursor
+from src.db.projection import read_columns
 from src.models.company import Company
 from src.models.invoice import Invoice
 from src.models.signatory import Signatory
+from src.models.transport_company import TransportCompany
 from src.models.trip import Trip
-from src.schemas.invoice import InvoiceCreate
+from src.schemas.invoice import (
+    InvoiceBatchCreate,
+    InvoiceCreate,
+    InvoiceRead,
+    InvoiceStatusTotals,
+    InvoiceSummaryRow,
+)
 from src.services.invoice import InvoiceService
+from src.services.invoice_snapshot import (
+    SNAPSHOT_TRIP_COLUMNS,
+    build_invoice_snapshot,
+    snapshot_hash,
+)
+
+
+@dataclass(slots=True)
+class InvoiceBundle:
+    invoice: Invoice
+    # Always in line_snapshot form; invoices issued before snapshots get one from the live rows.
+    snapshot: dict[str, Any]
+    snapshot_hash: str
 
 
 class InvoiceHandler:
@@ -22,11 +48,96 @@ class InvoiceHandler:
         transport_company_id: int,
         company_id: int | None = None,
         status: str | None = None,
-    ) -> list[Invoice]:
-        stmt: Select[tuple[Invoice]] = (
-            select(Invoice)
-            .options(selectinload(Invoice.signatory))
-            .where(Invoice.transport_company_id == transport_company_id)
+    ) -> Sequence[Row[Any]]:
+        stmt = self._list_invoices_stmt(transport_company_id, company_id, status)
+        result = await session.execute(stmt)
+        return result.all()
+
+    async def list_invoices_page(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        limit: int,
+        cursor: str | None = None,
+        company_id: int | None = None,
+        status: str | None = None,
+    ) -> Page[Row[Any]]:
+        stmt = self._list_invoices_stmt(transport_company_id, company_id, status)
+        if cursor is not None:
+            after_generated_at, after_id = self._decode_invoice_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(Invoice.generated_at, Invoice.id)
+                < tuple_(literal(after_generated_at), literal(after_id))
+            )
+        result = await session.execute(stmt.limit(limit + 1))
+        invoices = list(result.all())
+        if len(invoices) <= limit:
+            return Page(items=invoices)
+
+        invoices = invoices[:limit]
+        last = invoices[-1]
+        return Page(
+            items=invoices,
+            next_cursor=encode_cursor([last.generated_at.isoformat(), last.id]),
+        )
+
+    async def invoice_summary(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        group_by_company: bool = False,
+    ) -> list[InvoiceSummaryRow]:
+        today = literal(date.today())
+        conditions = {
+            "paid": Invoice.paid_at.is_not(None),
+            "unpaid": Invoice.paid_at.is_(None) & (Invoice.due_date >= today),
+            "overdue": Invoice.paid_at.is_(None) & (Invoice.due_date < today),
+        }
+        aggregates: list[ColumnElement[Any]] = []
+        for name, condition in conditions.items():
+            aggregates.append(
+                func.coalesce(func.sum(case((condition, 1), else_=0)), 0).label(f"{name}_count")
+            )
+            aggregates.append(
+                func.coalesce(func.sum(case((condition, Invoice.total_amount), else_=0)), 0).label(
+                    f"{name}_total"
+                )
+            )
+
+        stmt = select(*aggregates).where(Invoice.transport_company_id == transport_company_id)
+        if group_by_company:
+            stmt = (
+                stmt.add_columns(Invoice.company_id)
+                .group_by(Invoice.company_id)
+                .order_by(Invoice.company_id.asc())
+            )
+        result = await session.execute(stmt)
+        return [
+            InvoiceSummaryRow(
+                company_id=row.get("company_id"),
+                **{
+                    name: self._status_totals(row[f"{name}_count"], row[f"{name}_total"])
+                    for name in conditions
+                },
+            )
+            for row in result.mappings().all()
+        ]
+
+    @staticmethod
+    def _status_totals(count: int, total: Decimal | int) -> InvoiceStatusTotals:
+        return InvoiceStatusTotals(
+            count=int(count),
+            total_amount=Decimal(total).quantize(Decimal("0.01")),
+        )
+
+    def _list_invoices_stmt(
+        self,
+        transport_company_id: int,
+        company_id: int | None,
+        status: str | None,
+    ) -> Select[Any]:
+        stmt = select(*self._invoice_read_columns()).where(
+            Invoice.transport_company_id == transport_company_id
         )
         if company_id is not None:
             stmt = stmt.where(Invoice.company_id == company_id)
@@ -38,9 +149,26 @@ class InvoiceHandler:
         elif status == "overdue":
             stmt = stmt.where(Invoice.paid_at.is_(None)).where(Invoice.due_date < date.today())
 
-        stmt = stmt.order_by(Invoice.generated_at.desc())
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.order_by(Invoice.generated_at.desc(), Invoice.id.desc())
+
+    @staticmethod
+    def _decode_invoice_cursor(cursor: str) -> tuple[datetime, int]:
+        raw_generated_at, raw_id = decode_cursor(cursor, 2)
+        if not isinstance(raw_generated_at, str) or not isinstance(raw_id, int):
+            raise AppException("Invalid pagination cursor", status_code=400)
+        try:
+            return datetime.fromisoformat(raw_generated_at), raw_id
+        except ValueError as exc:
+            raise AppException("Invalid pagination cursor", status_code=400) from exc
+
+    @staticmethod
+    def _invoice_read_columns() -> list[ColumnElement[Any]]:
+        status = case(
+            (Invoice.paid_at.is_not(None), "paid"),
+            (Invoice.due_date < literal(date.today()), "overdue"),
+            else_="unpaid",
+        )
+        return read_columns(Invoice, InvoiceRead, status=status)
 
     async def get_invoice(
         self, session: AsyncSession, transport_company_id: int, invoice_id: int
@@ -57,28 +185,75 @@ class InvoiceHandler:
             raise AppException("Invoice not found", status_code=404)
         return invoice
 
+    async def list_invoice_ids_generated_between(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        start_date: date,
+        end_date: date,
+        company_id: int | None = None,
+    ) -> list[int]:
+        stmt = (
+            select(Invoice.id)
+            .where(Invoice.transport_company_id == transport_company_id)
+            .where(Invoice.generated_at >= datetime.combine(start_date, time.min, UTC))
+            .where(
+                Invoice.generated_at < datetime.combine(end_date + timedelta(days=1), time.min, UTC)
+            )
+            .order_by(Invoice.generated_at.asc(), Invoice.id.asc())
+        )
+        if company_id is not None:
+            stmt = stmt.where(Invoice.company_id == company_id)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_invoice_bundle(
         self,
         session: AsyncSession,
         transport_company_id: int,
         invoice_id: int,
-    ) -> tuple[Invoice, Company, list[Trip]]:
-        invoice = await self.get_invoice(session, transport_company_id, invoice_id)
-        company = await session.get(Company, invoice.company_id)
-        if company is None or company.transport_company_id != transport_company_id:
-            raise AppException("Company not found", status_code=404)
+        legacy_trip_fallback: bool = True,
+    ) -> InvoiceBundle:
+        invoice = await session.scalar(
+            select(Invoice)
+            .options(undefer(Invoice._signatory_image_data), undefer(Invoice.line_snapshot))
+            .where(Invoice.id == invoice_id)
+            .where(Invoice.transport_company_id == transport_company_id)
+        )
+        if invoice is None:
+            raise AppException("Invoice not found", status_code=404)
+        if invoice.line_snapshot is not None:
+            return InvoiceBundle(
+                invoice=invoice,
+                snapshot=invoice.line_snapshot,
+                snapshot_hash=invoice.line_snapshot_hash or snapshot_hash(invoice.line_snapshot),
+            )
 
-        stmt: Select[tuple[Trip]] = (
+        # Invoices issued before line snapshots existed render from the live rows.
+        row = (
+            await session.execute(
+                select(Company, TransportCompany.trn)
+                .join(TransportCompany, TransportCompany.id == Company.transport_company_id)
+                .where(Company.id == invoice.company_id)
+                .where(Company.transport_company_id == transport_company_id)
+            )
+        ).one_or_none()
+        if row is None:
+            raise AppException("Invoice not found", status_code=404)
+        company, transport_company_trn = row
+
+        trips_stmt: Select[tuple[Trip]] = (
             select(Trip)
             .where(Trip.invoice_id == invoice.id)
             .where(Trip.transport_company_id == transport_company_id)
             .order_by(Trip.date.asc(), Trip.id.asc())
         )
-        trips_result = await session.execute(stmt)
+        trips_result = await session.execute(trips_stmt)
         trips = list(trips_result.scalars().all())
 
-        # Backward compatibility for invoices created before invoice_id linkage.
-        if not trips:
+        # Backward compatibility for invoices created before invoice_id linkage; disable with
+        # INVOICE_LEGACY_TRIP_FALLBACK_ENABLED once backfill_invoice_trip_links has run.
+        if not trips and legacy_trip_fallback:
             fallback_stmt: Select[tuple[Trip]] = (
                 select(Trip)
                 .where(Trip.company_id == invoice.company_id)
@@ -91,7 +266,10 @@ class InvoiceHandler:
             fallback_result = await session.execute(fallback_stmt)
             trips = list(fallback_result.scalars().all())
 
-        return invoice, company, trips
+        snapshot = build_invoice_snapshot(company, transport_company_trn or "", trips)
+        return InvoiceBundle(
+            invoice=invoice, snapshot=snapshot, snapshot_hash=snapshot_hash(snapshot)
+        )
 
     async def create_invoice(
         self, session: AsyncSession, transport_company_id: int, payload: InvoiceCreate
@@ -132,22 +310,9 @@ class InvoiceHandler:
         summary = InvoiceService.summarize_trips(trips)
         due_date = payload.due_date or end_date + timedelta(days=30)
         prepared_by_mode = payload.prepared_by_mode or "without_signature"
-        if prepared_by_mode not in {"without_signature", "with_signature"}:
-            raise AppException("Invalid prepared_by_mode", status_code=400)
-
-        selected_signatory: Signatory | None = None
-        if prepared_by_mode == "with_signature":
-            if payload.signatory_id is None:
-                raise AppException(
-                    "signatory_id is required when prepared_by_mode is with_signature",
-                    status_code=400,
-                )
-            selected_signatory = await session.get(Signatory, payload.signatory_id)
-            if (
-                selected_signatory is None
-                or selected_signatory.transport_company_id != transport_company_id
-            ):
-                raise AppException("Selected signatory not found", status_code=404)
+        selected_signatory = await self._resolve_signatory(
+            session, transport_company_id, prepared_by_mode, payload.signatory_id
+        )
 
         invoice = Invoice(
             company_id=payload.company_id,
@@ -158,35 +323,124 @@ class InvoiceHandler:
             invoice_number=payload.invoice_number.strip() if payload.invoice_number else None,
             format_key=payload.format_key,
             prepared_by_mode=prepared_by_mode,
-            signatory_id=selected_signatory.id if selected_signatory else None,
-            signatory_name=selected_signatory.name if selected_signatory else None,
-            signatory_image_path=selected_signatory.signature_image_path
-            if selected_signatory
-            else None,
-            signatory_image_mime=selected_signatory.signature_image_mime
-            if selected_signatory
-            else None,
-            signatory_image_data=selected_signatory.signature_image_data
-            if selected_signatory
-            else None,
             total_amount=summary["total_amount_include_vat"],
             generated_at=summary["invoice_date"],
             paid_at=None,
+            **self._signatory_fields(selected_signatory),
         )
 
         session.add(invoice)
         await session.flush()
 
-        for trip in trips:
-            trip.paid = True
-            trip.invoice_id = invoice.id
-            company.paid_amount = company.paid_amount + trip.total_amount
-            company.unpaid_amount = company.unpaid_amount - trip.total_amount
+        claimed = await self._claim_trips(
+            session,
+            transport_company_id,
+            invoice.id,
+            [Trip.company_id == company.id, Trip.id.in_([trip.id for trip in trips])],
+        )
+        claimed_total = sum((row.total_amount for row in claimed), Decimal("0.00"))
+        if len(claimed) != len(trips) or claimed_total != invoice.total_amount:
+            await session.rollback()
+            raise AppException("Trips changed while invoicing; please retry", status_code=409)
+        await self._move_balance_to_paid(session, transport_company_id, {company.id: claimed_total})
+        self._store_line_snapshot(
+            invoice,
+            build_invoice_snapshot(
+                company, await self._transport_company_trn(session, transport_company_id), claimed
+            ),
+        )
 
         await session.commit()
         await session.refresh(invoice)
         return invoice
 
+    async def create_invoices_for_period(
+        self, session: AsyncSession, transport_company_id: int, payload: InvoiceBatchCreate
+    ) -> list[Invoice]:
+        if payload.end_date < payload.start_date:
+            raise AppException("end_date must be on or after start_date", status_code=400)
+        selected_signatory = await self._resolve_signatory(
+            session, transport_company_id, payload.prepared_by_mode, payload.signatory_id
+        )
+
+        period_filters = [
+            Trip.transport_company_id == transport_company_id,
+            Trip.paid.is_(False),
+            Trip.date >= payload.start_date,
+            Trip.date <= payload.end_date,
+        ]
+        if payload.company_ids:
+            period_filters.append(Trip.company_id.in_(payload.company_ids))
+        totals_stmt = (
+            select(
+                Trip.company_id,
+                func.count(Trip.id).label("trip_count"),
+                func.sum(Trip.total_amount).label("total_amount"),
+            )
+            .where(*period_filters)
+            .group_by(Trip.company_id)
+            .order_by(Trip.company_id.asc())
+        )
+        totals = (await session.execute(totals_stmt)).all()
+        if not totals:
+            raise AppException("No unpaid trips found in selected period", status_code=400)
+
+        generated_at = datetime.now(UTC)
+        due_date = payload.due_date or payload.end_date + timedelta(days=30)
+        invoices = [
+            Invoice(
+                company_id=row.company_id,
+                transport_company_id=transport_company_id,
+                start_date=payload.start_date,
+                end_date=payload.end_date,
+                due_date=due_date,
+                format_key=payload.format_key,
+                prepared_by_mode=payload.prepared_by_mode,
+                total_amount=Decimal(row.total_amount).quantize(Decimal("0.01")),
+                generated_at=generated_at,
+                paid_at=None,
+                **self._signatory_fields(selected_signatory),
+            )
+            for row in totals
+        ]
+        session.add_all(invoices)
+        await session.flush()
+
+        companies = {
+            company.id: company
+            for company in (
+                await session.scalars(
+                    select(Company)
+                    .where(Company.transport_company_id == transport_company_id)
+                    .where(Company.id.in_([row.company_id for row in totals]))
+                )
+            ).all()
+        }
+        transport_company_trn = await self._transport_company_trn(session, transport_company_id)
+        paid_delta_by_company: dict[int, Decimal] = {}
+        for invoice, row in zip(invoices, totals, strict=True):
+            claimed = await self._claim_trips(
+                session,
+                transport_company_id,
+                invoice.id,
+                [*period_filters, Trip.company_id == invoice.company_id],
+            )
+            claimed_total = sum((trip.total_amount for trip in claimed), Decimal("0.00"))
+            if len(claimed) != row.trip_count or claimed_total != invoice.total_amount:
+                await session.rollback()
+                raise AppException("Trips changed while invoicing; please retry", status_code=409)
+            paid_delta_by_company[invoice.company_id] = claimed_total
+            self._store_line_snapshot(
+                invoice,
+                build_invoice_snapshot(
+                    companies[invoice.company_id], transport_company_trn, claimed
+                ),
+            )
+
+        await self._move_balance_to_paid(session, transport_company_id, paid_delta_by_company)
+        await session.commit()
+        return invoices
+
     async def mark_invoice_paid(
         self,
         session: AsyncSession,
@@ -203,6 +457,103 @@ class InvoiceHandler:
         await session.refresh(invoice)
         return invoice
 
+    async def _resolve_signatory(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        prepared_by_mode: str,
+        signatory_id: int | None,
+    ) -> Signatory | None:
+        if prepared_by_mode not in {"without_signature", "with_signature"}:
+            raise AppException("Invalid prepared_by_mode", status_code=400)
+        if prepared_by_mode != "with_signature":
+            return None
+        if signatory_id is None:
+            raise AppException(
+                "signatory_id is required when prepared_by_mode is with_signature",
+                status_code=400,
+            )
+        signatory = await session.get(
+            Signatory,
+            signatory_id,
+            options=[undefer(Signatory._signature_image_data)],
+        )
+        if signatory is None or signatory.transport_company_id != transport_company_id:
+            raise AppException("Selected signatory not found", status_code=404)
+        return signatory
+
+    @staticmethod
+    def _signatory_fields(signatory: Signatory | None) -> dict[str, Any]:
+        if signatory is None:
+            return {}
+        return {
+            "signatory_id": signatory.id,
+            "signatory_name": signatory.name,
+            "signatory_image_path": signatory.signature_image_path,
+            "signatory_image_mime": signatory.signature_image_mime,
+            "signatory_image_data": signatory.signature_image_data,
+        }
+
+    @staticmethod
+    async def _claim_trips(
+        session: AsyncSession,
+        transport_company_id: int,
+        invoice_id: int,
+        filters: Sequence[ColumnElement[bool]],
+    ) -> list[Row[Any]]:
+        # paid = false in the WHERE clause makes concurrent claims on the same trip exclusive.
+        # The returned lines are exactly what was claimed, so they also feed the line snapshot.
+        stmt = (
+            update(Trip)
+            .where(Trip.transport_company_id == transport_company_id)
+            .where(Trip.paid.is_(False))
+            .where(*filters)
+            .values(paid=True, invoice_id=invoice_id)
+            .returning(*SNAPSHOT_TRIP_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        return list(result.all())
+
+    @staticmethod
+    def _store_line_snapshot(invoice: Invoice, snapshot: dict[str, Any]) -> None:
+        # Hashed once here so downloads can key the PDF cache and ETag without reading the lines.
+        invoice.line_snapshot = snapshot
+        invoice.line_snapshot_hash = snapshot_hash(snapshot)
+
+    @staticmethod
+    async def _transport_company_trn(session: AsyncSession, transport_company_id: int) -> str:
+        trn = await session.scalar(
+            select(TransportCompany.trn).where(TransportCompany.id == transport_company_id)
+        )
+        return trn or ""
+
+    @staticmethod
+    async def _move_balance_to_paid(
+        session: AsyncSession,
+        transport_company_id: int,
+        paid_delta_by_company: dict[int, Decimal],
+    ) -> None:
+        if not paid_delta_by_company:
+            return
+        delta = case(
+            *(
+                (Company.id == company_id, amount)
+                for company_id, amount in paid_delta_by_company.items()
+            ),
+            else_=Decimal("0.00"),
+        )
+        await session.execute(
+            update(Company)
+            .where(Company.transport_company_id == transport_company_id)
+            .where(Company.id.in_(paid_delta_by_company))
+            .values(
+                paid_amount=Company.paid_amount + delta,
+                unpaid_amount=Company.unpaid_amount - delta,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def _unpaid_trips(
         self,
         session: AsyncSession,
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from src.core.exceptions import AppException
+from src.models.invoice import Invoice
+from src.models.pdf_render_job import (
+    PDF_JOB_FAILED,
+    PDF_JOB_QUEUED,
+    PDF_JOB_RUNNING,
+    PDF_JOB_SUCCEEDED,
+    PdfRenderJob,
+)
+
+
+class PdfRenderJobHandler:
+    async def create_job(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        invoice_id: int,
+        template_key: str | None,
+        requested_by: str,
+        group_by: str | None = None,
+    ) -> PdfRenderJob:
+        invoice_exists = await session.scalar(
+            select(Invoice.id)
+            .where(Invoice.id == invoice_id)
+            .where(Invoice.transport_company_id == transport_company_id)
+        )
+        if invoice_exists is None:
+            raise AppException("Invoice not found", status_code=404)
+        job = PdfRenderJob(
+            transport_company_id=transport_company_id,
+            invoice_id=invoice_id,
+            template_key=template_key,
+            group_by=group_by,
+            status=PDF_JOB_QUEUED,
+            attempts=0,
+            requested_by=requested_by,
+        )
+        session.add(job)
+        await session.commit()
+        return job
+
+    async def get_job(
+        self, session: AsyncSession, transport_company_id: int, job_id: int
+    ) -> PdfRenderJob:
+        job = await session.scalar(
+            select(PdfRenderJob)
+            .where(PdfRenderJob.id == job_id)
+            .where(PdfRenderJob.transport_company_id == transport_company_id)
+        )
+        if job is None:
+            raise AppException("PDF job not found", status_code=404)
+        return job
+
+    async def get_result(
+        self, session: AsyncSession, transport_company_id: int, job_id: int
+    ) -> tuple[PdfRenderJob, bytes]:
+        job = await session.scalar(
+            select(PdfRenderJob)
+            .options(undefer(PdfRenderJob.result_data))
+            .where(PdfRenderJob.id == job_id)
+            .where(PdfRenderJob.transport_company_id == transport_company_id)
+        )
+        if job is None:
+            raise AppException("PDF job not found", status_code=404)
+        if job.status != PDF_JOB_SUCCEEDED or job.result_data is None:
+            raise AppException("PDF job has not finished", status_code=409, code="pdf_job_pending")
+        return job, job.result_data
+
+    async def claim_next_job(self, session: AsyncSession) -> PdfRenderJob | None:
+        while True:
+            job_id = await session.scalar(
+                select(PdfRenderJob.id)
+                .where(PdfRenderJob.status == PDF_JOB_QUEUED)
+                .order_by(PdfRenderJob.id.asc())
+                .limit(1)
+            )
+            if job_id is None:
+                return None
+            # Guarded on status so that concurrent workers never claim the same job.
+            claimed = await session.execute(
+                update(PdfRenderJob)
+                .where(PdfRenderJob.id == job_id)
+                .where(PdfRenderJob.status == PDF_JOB_QUEUED)
+                .values(
+                    status=PDF_JOB_RUNNING,
+                    attempts=PdfRenderJob.attempts + 1,
+                    started_at=datetime.now(UTC),
+                )
+                .returning(PdfRenderJob.id)
+                .execution_options(synchronize_session=False)
+            )
+            if claimed.scalar_one_or_none() is not None:
+                await session.commit()
+                return await session.get(PdfRenderJob, job_id, populate_existing=True)
+            await session.rollback()
+
+    async def finish_job(
+        self,
+        session: AsyncSession,
+        job_id: int,
+        attempt: int,
+        *,
+        result: bytes | None = None,
+        error: str | None = None,
+    ) -> bool:
+        # Only the current claim may finish the job; a stale worker's late result is dropped.
+        finished = await session.execute(
+            update(PdfRenderJob)
+            .where(PdfRenderJob.id == job_id)
+            .where(PdfRenderJob.status == PDF_JOB_RUNNING)
+            .where(PdfRenderJob.attempts == attempt)
+            .values(
+                status=PDF_JOB_FAILED if error is not None else PDF_JOB_SUCCEEDED,
+                error=error,
+                result_data=result,
+                result_size=len(result) if result is not None else None,
+                finished_at=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return int(getattr(finished, "rowcount", 0)) > 0
+
+    async def release_job(self, session: AsyncSession, job_id: int, attempt: int) -> None:
+        await session.execute(
+            update(PdfRenderJob)
+            .where(PdfRenderJob.id == job_id)
+            .where(PdfRenderJob.status == PDF_JOB_RUNNING)
+            .where(PdfRenderJob.attempts == attempt)
+            .values(
+                status=PDF_JOB_QUEUED,
+                attempts=PdfRenderJob.attempts - 1,
+                started_at=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+    async def requeue_stale_jobs(
+        self, session: AsyncSession, stale_after: timedelta, max_attempts: int
+    ) -> int:
+        cutoff = datetime.now(UTC) - stale_after
+        stale = (
+            PdfRenderJob.status == PDF_JOB_RUNNING,
+            PdfRenderJob.started_at < cutoff,
+        )
+        failed = await session.execute(
+            update(PdfRenderJob)
+            .where(*stale, PdfRenderJob.attempts >= max_attempts)
+            .values(
+                status=PDF_JOB_FAILED,
+                error="Render worker stopped before finishing",
+                finished_at=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        requeued = await session.execute(
+            update(PdfRenderJob)
+            .where(*stale, PdfRenderJob.attempts < max_attempts)
+            .values(status=PDF_JOB_QUEUED, started_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return int(getattr(failed, "rowcount", 0)) + int(getattr(requeued, "rowcount", 0))
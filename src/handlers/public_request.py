@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 from fastapi import Request
-from sqlalchemy import Select, select
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import decode_access_token
 from src.core.config import get_settings
 from src.core.exceptions import AppException
+from src.db.projection import read_columns
 from src.models.admin_user import AdminUser
 from src.models.contact_request import ContactRequest
 from src.models.quote_request import QuoteRequest
 from src.models.transport_company import TransportCompany
-from src.schemas.contact import ContactRequestCreate, ContactRequestUpdate
-from src.schemas.quote import QuoteRequestCreate, QuoteRequestUpdate
+from src.schemas.contact import ContactRequestCreate, ContactRequestRead, ContactRequestUpdate
+from src.schemas.quote import QuoteRequestCreate, QuoteRequestRead, QuoteRequestUpdate
+
+CONTACT_REQUEST_READ_COLUMNS = read_columns(ContactRequest, ContactRequestRead)
+QUOTE_REQUEST_READ_COLUMNS = read_columns(QuoteRequest, QuoteRequestRead)
 
 
 class PublicRequestHandler:
@@ -106,14 +113,14 @@ class PublicRequestHandler:
         self,
         session: AsyncSession,
         transport_company_id: int,
-    ) -> list[ContactRequest]:
-        stmt: Select[tuple[ContactRequest]] = (
-            select(ContactRequest)
+    ) -> Sequence[Row[Any]]:
+        stmt = (
+            select(*CONTACT_REQUEST_READ_COLUMNS)
             .where(ContactRequest.transport_company_id == transport_company_id)
             .order_by(ContactRequest.created_at.desc())
         )
         result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return result.all()
 
     async def update_contact_request(
         self,
@@ -155,14 +162,14 @@ class PublicRequestHandler:
         self,
         session: AsyncSession,
         transport_company_id: int,
-    ) -> list[QuoteRequest]:
-        stmt: Select[tuple[QuoteRequest]] = (
-            select(QuoteRequest)
+    ) -> Sequence[Row[Any]]:
+        stmt = (
+            select(*QUOTE_REQUEST_READ_COLUMNS)
             .where(QuoteRequest.transport_company_id == transport_company_id)
             .order_by(QuoteRequest.created_at.desc())
         )
         result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return result.all()
 
     async def update_quote_request(
         self,
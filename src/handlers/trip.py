@@ -1,16 +1,33 @@
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import date
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import Select, select
+from pydantic import ValidationError
+from sqlalchemy import Row, Select, func, insert, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import AppException
+from src.core.pagination import Page, decode_cursor, encode_cursor
+from src.db.projection import read_columns
 from src.models.company import Company
 from src.models.driver import Driver
 from src.models.trip import Trip
-from src.schemas.trip import TripCreate, TripUpdate
+from src.schemas.trip import (
+    TripBatchUpdateItem,
+    TripCreate,
+    TripImportResult,
+    TripImportSkipped,
+    TripRead,
+    TripUpdate,
+)
 from src.services.trip import TripService
 
+IMPORT_BATCH_SIZE = 500
+TRIP_READ_COLUMNS = read_columns(Trip, TripRead)
+DRIVER_FIELDS = ("driver_id", "external_driver_name", "external_driver_mobile", "driver")
+
 
 class TripHandler:
     async def list_trips(
@@ -23,6 +40,96 @@ class TripHandler:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> list[Trip]:
+        stmt = self._list_trips_stmt(
+            transport_company_id, company_id, paid, driver_id, start_date, end_date
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_trips_page(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        limit: int,
+        cursor: str | None = None,
+        company_id: int | None = None,
+        paid: bool | None = None,
+        driver_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Page[Row[Any]]:
+        stmt = self._list_trips_stmt(
+            transport_company_id, company_id, paid, driver_id, start_date, end_date
+        ).with_only_columns(*TRIP_READ_COLUMNS)
+        if cursor is not None:
+            after_date, after_id = self._decode_trip_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(Trip.date, Trip.id) < tuple_(literal(after_date), literal(after_id))
+            )
+        result = await session.execute(stmt.limit(limit + 1))
+        trips = list(result.all())
+        if len(trips) <= limit:
+            return Page(items=trips)
+
+        trips = trips[:limit]
+        last = trips[-1]
+        return Page(items=trips, next_cursor=encode_cursor([last.date.isoformat(), last.id]))
+
+    async def stream_trips(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        driver_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Trip]:
+        stmt = self._list_trips_stmt(
+            transport_company_id, None, None, driver_id, start_date, end_date
+        ).execution_options(yield_per=chunk_size)
+        result = await session.stream_scalars(stmt)
+        async for trip in result:
+            yield trip
+
+    async def driver_report(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        driver_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[tuple[str, int, Decimal]]:
+        stmt = (
+            select(
+                Trip.driver,
+                func.count(Trip.id),
+                func.coalesce(func.sum(Trip.amount), Decimal("0.00")),
+            )
+            .where(Trip.transport_company_id == transport_company_id)
+            .group_by(Trip.driver)
+            .order_by(func.lower(Trip.driver), Trip.driver)
+        )
+        if driver_id is not None:
+            stmt = stmt.where(Trip.driver_id == driver_id)
+        if start_date is not None:
+            stmt = stmt.where(Trip.date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(Trip.date <= end_date)
+        result = await session.execute(stmt)
+        return [
+            (driver_name, int(trip_count), amount_total.quantize(Decimal("0.01")))
+            for driver_name, trip_count, amount_total in result.all()
+        ]
+
+    @staticmethod
+    def _list_trips_stmt(
+        transport_company_id: int,
+        company_id: int | None,
+        paid: bool | None,
+        driver_id: int | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> Select[tuple[Trip]]:
         stmt: Select[tuple[Trip]] = select(Trip).where(
             Trip.transport_company_id == transport_company_id
         )
@@ -36,9 +143,17 @@ class TripHandler:
             stmt = stmt.where(Trip.date >= start_date)
         if end_date is not None:
             stmt = stmt.where(Trip.date <= end_date)
-        stmt = stmt.order_by(Trip.date.desc(), Trip.id.desc())
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.order_by(Trip.date.desc(), Trip.id.desc())
+
+    @staticmethod
+    def _decode_trip_cursor(cursor: str) -> tuple[date, int]:
+        raw_date, raw_id = decode_cursor(cursor, size=2)
+        if not isinstance(raw_date, str) or not isinstance(raw_id, int):
+            raise AppException("Invalid pagination cursor", status_code=400)
+        try:
+            return date.fromisoformat(raw_date), raw_id
+        except ValueError as exc:
+            raise AppException("Invalid pagination cursor", status_code=400) from exc
 
     async def get_trip(
         self, session: AsyncSession, transport_company_id: int, trip_id: int
@@ -88,31 +203,11 @@ class TripHandler:
         if company is None or company.transport_company_id != transport_company_id:
             raise AppException("Company not found", status_code=404)
 
-        old_total = trip.total_amount
-        updates = payload.model_dump(exclude_none=True)
-        if "trip_category" in updates:
-            updates["trip_category"] = self._normalize_trip_category(updates["trip_category"])
-
-        if any(
-            key in updates
-            for key in ("driver_id", "external_driver_name", "external_driver_mobile", "driver")
-        ):
-            current: dict[str, object] = {
-                "driver_id": trip.driver_id,
-                "external_driver_name": trip.external_driver_name,
-                "external_driver_mobile": trip.external_driver_mobile,
-                "driver": trip.driver,
-            }
-            current.update(updates)
-            updates.update(
-                await self._normalize_driver_payload(session, transport_company_id, current)
-            )
-
-        for key, value in updates.items():
-            setattr(trip, key, value)
+        updates = self._pending_updates(trip, payload)
+        if self._touches_driver(updates):
+            updates = await self._normalize_driver_payload(session, transport_company_id, updates)
 
-        TripService.apply_trip_amounts(trip)
-        delta = trip.total_amount - old_total
+        delta = self._apply_updates(trip, updates)
         company.unpaid_amount = company.unpaid_amount + delta
 
         await session.commit()
@@ -131,6 +226,292 @@ class TripHandler:
         await session.delete(trip)
         await session.commit()
 
+    async def create_trips(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        payloads: Sequence[TripCreate],
+    ) -> list[Trip]:
+        company_ids = set(
+            await session.scalars(
+                select(Company.id)
+                .where(Company.transport_company_id == transport_company_id)
+                .where(Company.id.in_({payload.company_id for payload in payloads}))
+            )
+        )
+        drivers_by_id = await self._drivers_by_id(
+            session,
+            transport_company_id,
+            {payload.driver_id for payload in payloads if payload.driver_id is not None},
+        )
+
+        trips: list[Trip] = []
+        unpaid_delta_by_company: dict[int, Decimal] = defaultdict(lambda: Decimal("0.00"))
+        for index, payload in enumerate(payloads):
+            try:
+                if payload.company_id not in company_ids:
+                    raise AppException("Company not found", status_code=404)
+                values = payload.model_dump()
+                values["transport_company_id"] = transport_company_id
+                values = self._apply_driver(
+                    values, self._batch_driver(drivers_by_id, payload.driver_id)
+                )
+                values["trip_category"] = self._normalize_trip_category(payload.trip_category)
+            except AppException as exc:
+                raise self._batch_item_error(index, exc) from exc
+            trip = Trip(**values)
+            TripService.apply_trip_amounts(trip)
+            unpaid_delta_by_company[trip.company_id] += trip.total_amount
+            trips.append(trip)
+
+        session.add_all(trips)
+        await session.flush()
+        await self._apply_unpaid_deltas(session, transport_company_id, unpaid_delta_by_company)
+        await session.commit()
+        return trips
+
+    async def update_trips(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        payloads: Sequence[TripBatchUpdateItem],
+        delete_ids: Sequence[int] = (),
+    ) -> tuple[list[Trip], list[int]]:
+        trip_ids = [payload.id for payload in payloads] + list(delete_ids)
+        if not trip_ids:
+            raise AppException("Trip batch is empty", status_code=400)
+        if len(set(trip_ids)) != len(trip_ids):
+            raise AppException("Each trip can appear only once per batch", status_code=400)
+
+        result = await session.scalars(
+            select(Trip)
+            .where(Trip.transport_company_id == transport_company_id)
+            .where(Trip.id.in_(trip_ids))
+        )
+        trips_by_id = {trip.id: trip for trip in result.all()}
+        missing = [trip_id for trip_id in trip_ids if trip_id not in trips_by_id]
+        if missing:
+            raise AppException(f"Trip not found: {missing[0]}", status_code=404)
+
+        pending: list[tuple[Trip, dict[str, object]]] = []
+        driver_ids: set[int] = set()
+        for index, payload in enumerate(payloads):
+            trip = trips_by_id[payload.id]
+            try:
+                updates = self._pending_updates(trip, payload)
+            except AppException as exc:
+                raise self._batch_item_error(index, exc) from exc
+            driver_id = updates.get("driver_id")
+            if self._touches_driver(updates) and isinstance(driver_id, int):
+                driver_ids.add(driver_id)
+            pending.append((trip, updates))
+        drivers_by_id = await self._drivers_by_id(session, transport_company_id, driver_ids)
+
+        updated: list[Trip] = []
+        unpaid_delta_by_company: dict[int, Decimal] = defaultdict(lambda: Decimal("0.00"))
+        for index, (trip, updates) in enumerate(pending):
+            if self._touches_driver(updates):
+                try:
+                    driver_id = updates.get("driver_id")
+                    driver = self._batch_driver(
+                        drivers_by_id, driver_id if isinstance(driver_id, int) else None
+                    )
+                    updates = self._apply_driver(updates, driver)
+                except AppException as exc:
+                    raise self._batch_item_error(index, exc) from exc
+            unpaid_delta_by_company[trip.company_id] += self._apply_updates(trip, updates)
+            updated.append(trip)
+
+        for trip_id in delete_ids:
+            trip = trips_by_id[trip_id]
+            if not trip.paid:
+                unpaid_delta_by_company[trip.company_id] -= trip.total_amount
+            await session.delete(trip)
+
+        await session.flush()
+        await self._apply_unpaid_deltas(session, transport_company_id, unpaid_delta_by_company)
+        await session.commit()
+        return updated, list(delete_ids)
+
+    async def import_trips(
+        self,
+        session: AsyncSession,
+        transport_company_id: int,
+        rows: Iterable[tuple[int, dict[str, Any]]],
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> TripImportResult:
+        company_ids = set(
+            await session.scalars(
+                select(Company.id).where(Company.transport_company_id == transport_company_id)
+            )
+        )
+        drivers_by_id, drivers_by_name = await self._driver_maps(session, transport_company_id)
+
+        created = 0
+        skipped: list[TripImportSkipped] = []
+        unpaid_delta_by_company: dict[int, Decimal] = defaultdict(lambda: Decimal("0.00"))
+        batch: list[tuple[TripCreate, dict[str, object]]] = []
+        for row_number, raw in rows:
+            try:
+                payload = TripCreate.model_validate(raw)
+                values = self._prepare_trip_values(
+                    transport_company_id,
+                    payload,
+                    company_ids,
+                    drivers_by_id,
+                    drivers_by_name,
+                )
+            except ValidationError as exc:
+                skipped.append(
+                    TripImportSkipped(row_number=row_number, reason=self._validation_reason(exc))
+                )
+                continue
+            except AppException as exc:
+                skipped.append(TripImportSkipped(row_number=row_number, reason=exc.message))
+                continue
+
+            batch.append((payload, values))
+            if len(batch) >= batch_size:
+                created += await self._insert_trip_batch(session, batch, unpaid_delta_by_company)
+                batch = []
+        if batch:
+            created += await self._insert_trip_batch(session, batch, unpaid_delta_by_company)
+
+        if created == 0:
+            raise AppException("No valid trip rows to import", status_code=400)
+
+        await self._apply_unpaid_deltas(session, transport_company_id, unpaid_delta_by_company)
+        await session.commit()
+        return TripImportResult(created=created, skipped=skipped)
+
+    async def _driver_maps(
+        self, session: AsyncSession, transport_company_id: int
+    ) -> tuple[dict[int, Driver], dict[str, Driver]]:
+        result = await session.scalars(
+            select(Driver).where(Driver.transport_company_id == transport_company_id)
+        )
+        drivers = list(result.all())
+        return (
+            {driver.id: driver for driver in drivers},
+            {driver.name.strip().casefold(): driver for driver in drivers},
+        )
+
+    def _prepare_trip_values(
+        self,
+        transport_company_id: int,
+        payload: TripCreate,
+        company_ids: set[int],
+        drivers_by_id: dict[int, Driver],
+        drivers_by_name: dict[str, Driver],
+    ) -> dict[str, object]:
+        if payload.company_id not in company_ids:
+            raise AppException("Company not found", status_code=404)
+
+        values: dict[str, object] = payload.model_dump()
+        values["transport_company_id"] = transport_company_id
+        values["trip_category"] = self._normalize_trip_category(payload.trip_category)
+        driver: Driver | None = None
+        if payload.driver_id is not None:
+            driver = drivers_by_id.get(payload.driver_id)
+            if driver is None:
+                raise AppException("Selected driver not found", status_code=404)
+        elif not (payload.external_driver_name or "").strip():
+            driver = drivers_by_name.get(payload.driver.strip().casefold())
+        return self._apply_driver(values, driver)
+
+    @staticmethod
+    async def _insert_trip_batch(
+        session: AsyncSession,
+        batch: list[tuple[TripCreate, dict[str, object]]],
+        unpaid_delta_by_company: dict[int, Decimal],
+    ) -> int:
+        for payload, values in batch:
+            vat, total = TripService.calculate_amounts(
+                payload.amount, payload.toll_gate, str(values["trip_category"])
+            )
+            values["vat"] = vat
+            values["total_amount"] = total
+            unpaid_delta_by_company[payload.company_id] += total
+        await session.execute(insert(Trip), [values for _, values in batch])
+        return len(batch)
+
+    async def _drivers_by_id(
+        self, session: AsyncSession, transport_company_id: int, driver_ids: set[int]
+    ) -> dict[int, Driver]:
+        if not driver_ids:
+            return {}
+        result = await session.scalars(
+            select(Driver)
+            .where(Driver.transport_company_id == transport_company_id)
+            .where(Driver.id.in_(driver_ids))
+        )
+        return {driver.id: driver for driver in result.all()}
+
+    @staticmethod
+    def _batch_driver(drivers_by_id: dict[int, Driver], driver_id: int | None) -> Driver | None:
+        if driver_id is None:
+            return None
+        driver = drivers_by_id.get(driver_id)
+        if driver is None:
+            raise AppException("Selected driver not found", status_code=404)
+        return driver
+
+    @staticmethod
+    def _batch_item_error(index: int, exc: AppException) -> AppException:
+        return AppException(f"trips[{index}]: {exc.message}", exc.status_code, exc.code)
+
+    @staticmethod
+    async def _apply_unpaid_deltas(
+        session: AsyncSession,
+        transport_company_id: int,
+        unpaid_delta_by_company: dict[int, Decimal],
+    ) -> None:
+        # Sorted so concurrent batches lock company rows in the same order.
+        for company_id in sorted(unpaid_delta_by_company):
+            delta = unpaid_delta_by_company[company_id]
+            if not delta:
+                continue
+            await session.execute(
+                update(Company)
+                .where(Company.id == company_id)
+                .where(Company.transport_company_id == transport_company_id)
+                .values(unpaid_amount=Company.unpaid_amount + delta)
+            )
+
+    @staticmethod
+    def _validation_reason(exc: ValidationError) -> str:
+        error = exc.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        return f"{location}: {error['msg']}" if location else str(error["msg"])
+
+    @classmethod
+    def _pending_updates(cls, trip: Trip, payload: TripUpdate) -> dict[str, object]:
+        updates = payload.model_dump(exclude_none=True, exclude={"id"})
+        if "trip_category" in updates:
+            updates["trip_category"] = cls._normalize_trip_category(updates["trip_category"])
+        if cls._touches_driver(updates):
+            current: dict[str, object] = {
+                "driver_id": trip.driver_id,
+                "external_driver_name": trip.external_driver_name,
+                "external_driver_mobile": trip.external_driver_mobile,
+                "driver": trip.driver,
+            }
+            current.update(updates)
+            updates.update(current)
+        return updates
+
+    @staticmethod
+    def _touches_driver(updates: dict[str, object]) -> bool:
+        return any(key in updates for key in DRIVER_FIELDS)
+
+    @staticmethod
+    def _apply_updates(trip: Trip, updates: dict[str, object]) -> Decimal:
+        old_total = trip.total_amount
+        for key, value in updates.items():
+            setattr(trip, key, value)
+        TripService.apply_trip_amounts(trip)
+        return trip.total_amount - old_total
+
     @staticmethod
     def _normalize_trip_category(value: str | None) -> str:
         category = (value or "domestic").strip().lower()
@@ -144,15 +525,21 @@ class TripHandler:
         transport_company_id: int,
         values: dict[str, object],
     ) -> dict[str, object]:
+        driver: Driver | None = None
         driver_id = values.get("driver_id")
-        external_name = str(values.get("external_driver_name") or "").strip()
-        external_mobile = str(values.get("external_driver_mobile") or "").strip()
-        manual_driver = str(values.get("driver") or "").strip()
-
         if isinstance(driver_id, int):
             driver = await session.get(Driver, driver_id)
             if driver is None or driver.transport_company_id != transport_company_id:
                 raise AppException("Selected driver not found", status_code=404)
+        return self._apply_driver(values, driver)
+
+    @staticmethod
+    def _apply_driver(values: dict[str, object], driver: Driver | None) -> dict[str, object]:
+        external_name = str(values.get("external_driver_name") or "").strip()
+        external_mobile = str(values.get("external_driver_mobile") or "").strip()
+        manual_driver = str(values.get("driver") or "").strip()
+
+        if driver is not None:
             values["driver"] = driver.name
             values["driver_id"] = driver.id
             values["external_driver_name"] = None
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -12,6 +13,7 @@ from src.api.routes import (
     employee_salaries_router,
     health_router,
     invoices_router,
+    pdf_jobs_router,
     public_router,
     trips_router,
 )
@@ -21,8 +23,18 @@ from src.core.config import get_settings
 from src.core.exceptions import register_exception_handlers
 from src.core.logging import configure_logging, logger
 from src.core.middleware import register_middlewares
+from src.core.pagination import NEXT_CURSOR_HEADER
 from src.core.request_limits import RequestRateLimiter
-from src.db.session import SessionFactory
+from src.db.session import (
+    READ_CONSISTENCY_HEADER,
+    SessionFactory,
+    engine,
+    read_engine,
+    warm_engine_pool,
+)
+from src.services.invoice_pdf_cache import InvoicePDFCache
+from src.services.invoice_pdf_renderer import InvoicePDFRenderer
+from src.services.pdf_render_worker import PdfRenderWorker
 from src.services.signature_encryption_integrity import check_signature_encryption_integrity
 
 
@@ -31,6 +43,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
     configure_logging(settings.log_level)
     logger.info("application_startup")
+    if settings.db_pool_warmup_enabled:
+        await warm_engine_pool(engine, settings.db_pool_size)
+        if read_engine is not None:
+            await warm_engine_pool(read_engine, settings.db_pool_size)
+        logger.info("db_pool_warmed connections=%s", settings.db_pool_size)
     if settings.signature_startup_integrity_check_enabled:
         async with SessionFactory() as session:
             report = await check_signature_encryption_integrity(session)
@@ -50,7 +67,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
                 "signature_encryption_integrity_ok checked_total=%s",
                 report.checked_total,
             )
+    worker_stop = asyncio.Event()
+    worker_task: asyncio.Task[None] | None = None
+    job_renderer: InvoicePDFRenderer | None = None
+    if settings.pdf_job_worker_enabled:
+        job_renderer = InvoicePDFRenderer.for_pdf_jobs(settings)
+        worker = PdfRenderWorker.from_settings(settings, SessionFactory, job_renderer)
+        worker_task = asyncio.create_task(worker.run_forever(worker_stop))
     yield
+    if worker_task is not None:
+        worker_stop.set()
+        await worker_task
+    if job_renderer is not None:
+        job_renderer.shutdown()
+    app.state.invoice_pdf_renderer.shutdown()
     redis_client = getattr(app.state, "redis_client", None)
     if redis_client is not None:
         await redis_client.aclose()
@@ -82,6 +112,8 @@ def create_app() -> FastAPI:
     app.state.auth_attempt_guard = AuthAttemptGuard.from_settings(settings, redis_client)
     app.state.request_rate_limiter = RequestRateLimiter.from_settings(settings, redis_client)
     app.state.audit_logger = AuditLogger.from_settings(settings)
+    app.state.invoice_pdf_cache = InvoicePDFCache.from_settings(settings)
+    app.state.invoice_pdf_renderer = InvoicePDFRenderer.from_settings(settings)
 
     app.add_middleware(
         CORSMiddleware,
@@ -96,8 +128,9 @@ def create_app() -> FastAPI:
             "X-Transport-Company-UUID",
             "X-Transport-Company-ID",
             "X-Step-Up-Token",
+            READ_CONSISTENCY_HEADER,
         ],
-        expose_headers=["Content-Disposition"],
+        expose_headers=["Content-Disposition", "ETag", NEXT_CURSOR_HEADER],
     )
 
     register_exception_handlers(app)
@@ -111,6 +144,7 @@ def create_app() -> FastAPI:
     app.include_router(employee_salaries_router, prefix=settings.api_v1_prefix)
     app.include_router(trips_router, prefix=settings.api_v1_prefix)
     app.include_router(invoices_router, prefix=settings.api_v1_prefix)
+    app.include_router(pdf_jobs_router, prefix=settings.api_v1_prefix)
     app.include_router(public_router, prefix=settings.api_v1_prefix)
     return app
 
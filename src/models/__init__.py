@@ -9,6 +9,7 @@ from src.models.driver import Driver
 from src.models.driver_cash_handover import DriverCashHandover
 from src.models.employee_salary import EmployeeSalary
 from src.models.invoice import Invoice
+from src.models.pdf_render_job import PdfRenderJob
 from src.models.quote_request import QuoteRequest
 from src.models.signatory import Signatory
 from src.models.transport_company import TransportCompany
@@ -29,6 +30,7 @@ __all__ = [
     "EmployeeSalary",
     "Trip",
     "Invoice",
+    "PdfRenderJob",
     "Signatory",
     "ContactRequest",
     "QuoteRequest",
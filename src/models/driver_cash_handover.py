@@ -4,7 +4,7 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, Numeric, String
+from sqlalchemy import Date, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import AuditMixin, BaseModel, IDMixin, TransportCompanyMixin
@@ -28,3 +28,16 @@ class DriverCashHandover(IDMixin, TransportCompanyMixin, AuditMixin, BaseModel):
     transport_company: Mapped[TransportCompany] = relationship(
         back_populates="driver_cash_handovers"
     )
+
+
+Index(
+    "ix_driver_cash_handovers_tc_driver_date",
+    DriverCashHandover.transport_company_id,
+    DriverCashHandover.driver_id,
+    DriverCashHandover.handover_date,
+)
+Index(
+    "ix_driver_cash_handovers_tc_date",
+    DriverCashHandover.transport_company_id,
+    DriverCashHandover.handover_date,
+)
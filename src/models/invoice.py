@@ -2,9 +2,19 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Date, DateTime, ForeignKey, LargeBinary, Numeric, String, Text
+from sqlalchemy import (
+    JSON,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    Numeric,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.signature_crypto import get_signature_crypto
@@ -35,12 +45,23 @@ class Invoice(IDMixin, CompanyMixin, TransportCompanyMixin, BaseModel):
     signatory_image_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
     signatory_image_mime: Mapped[str | None] = mapped_column(String(100), nullable=True)
     _signatory_image_data: Mapped[bytes | None] = mapped_column(
-        "signatory_image_data", LargeBinary, nullable=True
+        "signatory_image_data",
+        LargeBinary,
+        nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
     )
     notes: Mapped[str] = mapped_column(Text, nullable=False, default="")
     total_amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     paid_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    line_snapshot: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON(none_as_null=True),
+        nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
+    )
+    line_snapshot_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     company: Mapped[Company] = relationship(back_populates="invoices")
     signatory: Mapped[Signatory | None] = relationship(back_populates="invoices")
@@ -62,3 +83,19 @@ class Invoice(IDMixin, CompanyMixin, TransportCompanyMixin, BaseModel):
     @signatory_image_data.setter
     def signatory_image_data(self, value: bytes | None) -> None:
         self._signatory_image_data = get_signature_crypto().encrypt_for_storage(value)
+
+
+Index("ix_invoices_tc_generated_at", Invoice.transport_company_id, Invoice.generated_at)
+Index(
+    "ix_invoices_tc_company_generated_at",
+    Invoice.transport_company_id,
+    Invoice.company_id,
+    Invoice.generated_at,
+)
+Index(
+    "ix_invoices_tc_due_date_unpaid",
+    Invoice.transport_company_id,
+    Invoice.due_date,
+    postgresql_where=Invoice.paid_at.is_(None),
+    sqlite_where=Invoice.paid_at.is_(None),
+)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import AuditMixin, BaseModel, IDMixin, TransportCompanyMixin
+
+PDF_JOB_QUEUED = "queued"
+PDF_JOB_RUNNING = "running"
+PDF_JOB_SUCCEEDED = "succeeded"
+PDF_JOB_FAILED = "failed"
+
+
+class PdfRenderJob(IDMixin, TransportCompanyMixin, AuditMixin, BaseModel):
+    __tablename__ = "pdf_render_jobs"
+
+    invoice_id: Mapped[int] = mapped_column(
+        ForeignKey("invoices.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    template_key: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    group_by: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default=PDF_JOB_QUEUED)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    requested_by: Mapped[str] = mapped_column(String(120), nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    result_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    result_data: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
+    )
+
+
+Index("ix_pdf_render_jobs_status_id", PdfRenderJob.status, PdfRenderJob.id)
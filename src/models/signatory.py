@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from sqlalchemy import LargeBinary, String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from src.core.signature_crypto import get_signature_crypto
 from src.models.base import BaseModel, IDMixin, TransportCompanyMixin
@@ -25,8 +25,13 @@ class Signatory(IDMixin, TransportCompanyMixin, BaseModel):
     signature_image_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
     signature_image_mime: Mapped[str | None] = mapped_column(String(100), nullable=True)
     _signature_image_data: Mapped[bytes | None] = mapped_column(
-        "signature_image_data", LargeBinary, nullable=True
+        "signature_image_data",
+        LargeBinary,
+        nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
     )
+    has_signature_image: Mapped[bool] = column_property(_signature_image_data.is_not(None))
 
     invoices: Mapped[list[Invoice]] = relationship(back_populates="signatory")
     transport_company: Mapped[TransportCompany] = relationship(back_populates="signatories")
@@ -4,7 +4,7 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Date, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel, CompanyMixin, IDMixin, TransportCompanyMixin
@@ -43,3 +43,17 @@ class Trip(IDMixin, CompanyMixin, TransportCompanyMixin, BaseModel):
     company: Mapped[Company] = relationship(back_populates="trips")
     driver_ref: Mapped[Driver | None] = relationship(back_populates="trips")
     transport_company: Mapped[TransportCompany] = relationship(back_populates="trips")
+
+
+Index("ix_trips_tc_date_id", Trip.transport_company_id, Trip.date, Trip.id)
+Index("ix_trips_tc_company_date", Trip.transport_company_id, Trip.company_id, Trip.date)
+Index(
+    "ix_trips_tc_company_date_unpaid",
+    Trip.transport_company_id,
+    Trip.company_id,
+    Trip.date,
+    postgresql_where=Trip.paid.is_(False),
+    sqlite_where=Trip.paid.is_(False),
+)
+Index("ix_trips_tc_driver_date", Trip.transport_company_id, Trip.driver_id, Trip.date)
+Index("ix_trips_tc_invoice_date", Trip.transport_company_id, Trip.invoice_id, Trip.date)
@@ -20,6 +20,16 @@ class InvoiceCreate(ORMModel):
     trip_ids: list[int] = Field(default_factory=list)
 
 
+class InvoiceBatchCreate(ORMModel):
+    start_date: date
+    end_date: date
+    due_date: date | None = None
+    company_ids: list[int] | None = None
+    prepared_by_mode: str = Field(default="without_signature", max_length=25)
+    signatory_id: int | None = None
+    format_key: str = Field(default="standard", max_length=50)
+
+
 class InvoiceRead(ORMModel):
     id: int
     company_id: int
@@ -39,6 +49,18 @@ class InvoiceRead(ORMModel):
     status: str
 
 
+class InvoiceStatusTotals(ORMModel):
+    count: int
+    total_amount: Decimal
+
+
+class InvoiceSummaryRow(ORMModel):
+    company_id: int | None
+    paid: InvoiceStatusTotals
+    unpaid: InvoiceStatusTotals
+    overdue: InvoiceStatusTotals
+
+
 class InvoiceMarkPaid(ORMModel):
     paid_at: datetime | None = None
 
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from src.schemas.common import ORMModel
+
+
+class PdfRenderJobRead(ORMModel):
+    id: int
+    invoice_id: int
+    template_key: str | None
+    group_by: str | None
+    status: str
+    attempts: int
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    result_size: int | None
+    result_url: str | None = None
@@ -44,9 +44,37 @@ class TripUpdate(ORMModel):
     paid: bool | None = None
 
 
+class TripBatchUpdateItem(TripUpdate):
+    id: int
+
+
+class TripBatchCreate(ORMModel):
+    trips: list[TripCreate] = Field(min_length=1)
+
+
+class TripBatchUpdate(ORMModel):
+    trips: list[TripBatchUpdateItem] = Field(default_factory=list)
+    delete_ids: list[int] = Field(default_factory=list)
+
+
 class TripRead(TripBase):
     id: int
     vat: Decimal
     total_amount: Decimal
     paid: bool
     invoice_id: int | None
+
+
+class TripImportSkipped(ORMModel):
+    row_number: int
+    reason: str
+
+
+class TripImportResult(ORMModel):
+    created: int
+    skipped: list[TripImportSkipped]
+
+
+class TripBatchUpdateResult(ORMModel):
+    updated: list[TripRead]
+    deleted: list[int]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any, cast
@@ -9,6 +12,64 @@ from src.models.company import Company
 from src.models.invoice import Invoice
 from src.models.trip import Trip
 from src.services.invoice import InvoiceService
+from src.services.invoice_pdf_layout import Column, TableSpec, TableWriter, compile_table
+
+BRAND_HEADER_DIR = Path(__file__).resolve().parents[2] / "frontend" / "public"
+BRAND_HEADER_FILENAMES = (
+    "Sikar_cargo_transport_logo.png",
+    "sikar_invoice_header_A4_exactstyle.svg",
+    "sikar_invoice_header.svg",
+    "sikar transport logo.svg",
+)
+
+
+@dataclass(slots=True)
+class BrandHeaderAsset:
+    image: Any = None
+    drawing: Any = None
+
+
+@dataclass(slots=True)
+class InvoiceDocument:
+    c: Any
+    invoice: Invoice
+    company: Company
+    transport_company_trn: str
+    page_width: float
+    page_height: float
+    mm: float
+    invoice_no: str
+    brand_header_bottom: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class InvoiceTemplate:
+    table: TableSpec
+    first_page: Callable[[InvoiceDocument], float]
+    continuation_page: Callable[[InvoiceDocument], float]
+    closing: Callable[[InvoiceDocument, float], None]
+    footer: Callable[[InvoiceDocument], None] | None = None
+    footer_on_every_page: bool = False
+    setup: Callable[[InvoiceDocument], None] | None = None
+
+
+# Decoded header per (path, mtime_ns, target width), shared by every render in the process.
+_brand_header_cache: dict[tuple[str, int, float], BrandHeaderAsset | None] = {}
+
+
+def _brand_header_path() -> Path | None:
+    # Keyed on the directory mtime, so adding or removing an asset is picked up without a restart.
+    try:
+        mtime_ns = BRAND_HEADER_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _find_brand_header(BRAND_HEADER_DIR, mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _find_brand_header(directory: Path, _mtime_ns: int) -> Path | None:
+    candidates = [directory / filename for filename in BRAND_HEADER_FILENAMES]
+    return next((path for path in candidates if path.exists()), None)
 
 
 class InvoicePDFService:
@@ -30,6 +91,13 @@ class InvoicePDFService:
             "canvas": canvas,
         }
 
+    @staticmethod
+    def resolve_template_key(invoice: Invoice, template_key: str | None = None) -> str:
+        selected = (template_key or invoice.format_key or "template_a").lower()
+        if selected == "standard":
+            return "template_a"
+        return selected
+
     @classmethod
     def generate_pdf(
         cls,
@@ -38,19 +106,15 @@ class InvoicePDFService:
         trips: list[Trip],
         template_key: str | None = None,
         transport_company_trn: str = "",
+        group_by: str | None = None,
     ) -> bytes:
-        selected = (template_key or invoice.format_key or "template_a").lower()
-        if selected == "standard":
-            selected = "template_a"
-
-        if selected == "template_a":
-            return cls._template_a(invoice, company, trips, transport_company_trn)
-        if selected == "template_b":
-            return cls._template_b(invoice, company, trips, transport_company_trn)
-        if selected in {"template_c", "detailed"}:
-            return cls._template_c(invoice, company, trips, transport_company_trn)
-
-        raise AppException(f"Unsupported template key: {selected}", status_code=400)
+        selected = cls.resolve_template_key(invoice, template_key)
+        template = INVOICE_TEMPLATES.get(selected)
+        if template is None:
+            raise AppException(f"Unsupported template key: {selected}", status_code=400)
+        if group_by is not None and group_by not in SUMMARY_COLUMNS:
+            raise AppException(f"Unsupported summary grouping: {group_by}", status_code=400)
+        return cls._render(template, invoice, company, trips, transport_company_trn, group_by)
 
     @classmethod
     def _draw_brand_header(
@@ -78,41 +142,73 @@ class InvoicePDFService:
             c.line(18 * mm, y_top - (7 * mm), page_width - 18 * mm, y_top - (7 * mm))
             return cast(float, y_top - (12 * mm))
 
-        root = Path(__file__).resolve().parents[2]
-        candidates = [
-            root / "frontend" / "public" / "Sikar_cargo_transport_logo.png",
-            root / "frontend" / "public" / "sikar_invoice_header_A4_exactstyle.svg",
-            root / "frontend" / "public" / "sikar_invoice_header.svg",
-            root / "frontend" / "public" / "sikar transport logo.svg",
-        ]
+        target_width = page_width - (24 * mm)
+        asset = cls._brand_header_asset(target_width)
+        if asset is None:
+            return _draw_text_fallback()
+
+        if asset.image is not None:
+            image_width, image_height = asset.image.getSize()
+            draw_height = target_width * (image_height / image_width)
+            x = (page_width - target_width) / 2
+            y = y_top - draw_height
+            try:
+                c.drawImage(
+                    asset.image,
+                    x,
+                    y,
+                    width=target_width,
+                    height=draw_height,
+                    preserveAspectRatio=True,
+                    mask="auto",
+                )
+            except Exception:
+                return _draw_text_fallback()
+            return cast(float, y - (4 * mm))
+
+        from reportlab.graphics import renderPDF
 
-        header_asset = next((path for path in candidates if path.exists()), None)
+        drawing = asset.drawing
+        x = (page_width - drawing.width) / 2
+        y = y_top - drawing.height
+        renderPDF.draw(drawing, c, x, y)
+        return cast(float, y - (4 * mm))
+
+    @classmethod
+    def warm_brand_header(cls) -> None:
+        modules = cls._reportlab_modules()
+        cls._brand_header_asset(modules["A4"][0] - (24 * modules["mm"]))
+
+    @classmethod
+    def _brand_header_asset(cls, target_width: float) -> BrandHeaderAsset | None:
+        header_asset = _brand_header_path()
         if header_asset is None:
-            return _draw_text_fallback()
+            return None
+        try:
+            mtime_ns = header_asset.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Removed since the probe; the directory mtime changed, so the next call re-probes.
+            return None
 
-        target_width = page_width - (24 * mm)
+        key = (str(header_asset), mtime_ns, round(target_width, 3))
+        if key not in _brand_header_cache:
+            stale = [cached for cached in _brand_header_cache if cached[:2] != key[:2]]
+            for cached in stale:
+                del _brand_header_cache[cached]
+            _brand_header_cache[key] = cls._load_brand_header(header_asset, target_width)
+        return _brand_header_cache[key]
+
+    @staticmethod
+    def _load_brand_header(header_asset: Path, target_width: float) -> BrandHeaderAsset | None:
+        from reportlab.lib.utils import ImageReader
 
         # If a pre-designed bitmap header is available, render it directly.
         if header_asset.suffix.lower() in {".png", ".jpg", ".jpeg"}:
             try:
-                from reportlab.lib.utils import ImageReader
-
-                image = ImageReader(str(header_asset))
+                image = ImageReader(BytesIO(header_asset.read_bytes()))
                 image_width, image_height = image.getSize()
                 if image_width > 0 and image_height > 0:
-                    draw_height = target_width * (image_height / image_width)
-                    x = (page_width - target_width) / 2
-                    y = y_top - draw_height
-                    c.drawImage(
-                        image,
-                        x,
-                        y,
-                        width=target_width,
-                        height=draw_height,
-                        preserveAspectRatio=True,
-                        mask="auto",
-                    )
-                    return cast(float, y - (4 * mm))
+                    return BrandHeaderAsset(image=image)
             except Exception:
                 pass
 
@@ -120,7 +216,6 @@ class InvoicePDFService:
         # is preserved consistently in generated PDFs.
         try:
             import cairosvg
-            from reportlab.lib.utils import ImageReader
 
             png_bytes = cairosvg.svg2png(
                 url=str(header_asset),
@@ -129,431 +224,70 @@ class InvoicePDFService:
             image = ImageReader(BytesIO(png_bytes))
             image_width, image_height = image.getSize()
             if image_width > 0 and image_height > 0:
-                draw_height = target_width * (image_height / image_width)
-                x = (page_width - target_width) / 2
-                y = y_top - draw_height
-                c.drawImage(
-                    image,
-                    x,
-                    y,
-                    width=target_width,
-                    height=draw_height,
-                    preserveAspectRatio=True,
-                    mask="auto",
-                )
-                return cast(float, y - (4 * mm))
+                return BrandHeaderAsset(image=image)
         except Exception:
             # Fall back to vector rendering below.
             pass
 
         try:
-            from reportlab.graphics import renderPDF
             from svglib.svglib import svg2rlg
         except ImportError:
-            return _draw_text_fallback()
+            return None
 
         drawing = svg2rlg(str(header_asset))
         if drawing is None:
-            return _draw_text_fallback()
+            return None
 
         scale = target_width / drawing.width if drawing.width else 1.0
         drawing.width *= scale
         drawing.height *= scale
         drawing.scale(scale, scale)
-
-        x = (page_width - drawing.width) / 2
-        y = y_top - drawing.height
-        renderPDF.draw(drawing, c, x, y)
-        return cast(float, y - (4 * mm))
+        return BrandHeaderAsset(drawing=drawing)
 
     @classmethod
-    def _template_a(cls, invoice: Invoice, company: Company, trips: list[Trip], transport_company_trn: str = "") -> bytes:
+    def _render(
+        cls,
+        template: InvoiceTemplate,
+        invoice: Invoice,
+        company: Company,
+        trips: list[Trip],
+        transport_company_trn: str,
+        group_by: str | None = None,
+    ) -> bytes:
         modules = cls._reportlab_modules()
         page_width, page_height = modules["A4"]
-        mm = modules["mm"]
-        canvas_cls = modules["canvas"].Canvas
-
         buffer = BytesIO()
-        c = canvas_cls(buffer, pagesize=modules["A4"])
-
-        y = page_height - 14 * mm
-        y = cls._draw_brand_header(c, page_width, y)
-
-        invoice_no = InvoiceService.generate_invoice_number(invoice.id, invoice.invoice_number)
-        invoice_date = invoice.generated_at.date().strftime("%d-%b-%Y")
-
-        # Block 1 (below header with margin): customer details on left.
-        y -= 3 * mm
-        c.setFont("Helvetica-Bold", 10)
-        c.drawString(14 * mm, y, f"Ms/ {company.name}")
-        c.setFont("Helvetica-Bold", 8)
-        y -= 4.1 * mm
-        c.drawString(14 * mm, y, f"TRN:- {company.trn or '-'}")
-        y -= 4.1 * mm
-        c.drawString(14 * mm, y, f"Mobile Number:- {company.phone or '-'}")
-
-        # Block 2 (separate row): centered TAX INVOICE + TRN.
-        y -= 6 * mm
-        c.setFont("Helvetica-Bold", 14)
-        c.drawCentredString(page_width / 2, y, "TAX INVOICE")
-        y -= 4.6 * mm
-        c.setFont("Helvetica-Bold", 9)
-        c.drawCentredString(page_width / 2, y, f"TRN:- {transport_company_trn or '-'}")
-
-        # Block 3 (separate row): invoice metadata on left.
-        y -= 8 * mm
-        c.setFont("Helvetica-Bold", 9)
-        c.drawString(14 * mm, y, f"Invoice No. :- {invoice_no}")
-        y -= 4.1 * mm
-        c.drawString(14 * mm, y, f"Invoice Date :- {invoice_date}")
-
-        y -= 6 * mm
-        headers = [
-            ["Sr No."],
-            ["Delivery", "Date"],
-            ["Description"],
-            ["Amount", "(Excl. VAT)"],
-            ["VAT 5%"],
-            ["Pass &", "Parking"],
-            ["Total", "Amount"],
-            ["Remarks"],
-        ]
-        # Total width: 182mm (fits A4 printable area from 14mm to 196mm).
-        widths = [10, 22, 56, 18, 14, 14, 20, 28]
-        x = 14 * mm
-        header_height = 13 * mm
-        row_height = 7.5 * mm
-
-        c.setFont("Helvetica-Bold", 6.6)
-        for idx, header_lines in enumerate(headers):
-            cell_width = widths[idx] * mm
-            c.rect(x, y - header_height, cell_width, header_height, stroke=1, fill=0)
-            if len(header_lines) == 1:
-                c.drawCentredString(x + (cell_width / 2), y - 8.0 * mm, header_lines[0])
-            else:
-                c.drawCentredString(x + (cell_width / 2), y - 5.6 * mm, header_lines[0])
-                c.drawCentredString(x + (cell_width / 2), y - 9.8 * mm, header_lines[1])
-            x += cell_width
-
-        y -= header_height
-        c.setFont("Helvetica", 7)
-        for i, trip in enumerate(trips, start=1):
-            destination_company = (trip.destination_company_name or "").strip() or "Destination N/A"
-            row = [
-                str(i),
-                trip.date.strftime("%d-%b-%Y"),
-                f"{trip.origin} to {destination_company} ({trip.destination})",
-                f"{trip.amount:.2f}",
-                f"{trip.vat:.2f}",
-                f"{trip.toll_gate:.2f}",
-                f"{trip.total_amount:.2f}",
-                trip.freight,
-            ]
-
-            x = 14 * mm
-            for idx, value in enumerate(row):
-                cell_width = widths[idx] * mm
-                c.rect(x, y - row_height, cell_width, row_height, stroke=1, fill=0)
-                if idx == 2:
-                    c.drawString(x + 1.5 * mm, y - 5.2 * mm, str(value)[:40])
-                else:
-                    c.drawCentredString(x + (cell_width / 2), y - 5.2 * mm, str(value))
-                x += cell_width
-
-            y -= row_height
-            if y < 55 * mm:
-                c.showPage()
-                y = page_height - 22 * mm
-
-        summary = InvoiceService.summarize_trips(trips)
-        total_toll = summary.get("total_toll_amount", summary.get("total_toll_gate", 0))
-        total_row = [
-            "",
-            "",
-            "",
-            f"{summary['total_amount']:.2f}",
-            f"{summary['total_vat_amount']:.2f}",
-            f"{total_toll:.2f}",
-            f"{summary['total_amount_include_vat']:.2f}",
-            "",
-        ]
-        x = 14 * mm
-        c.setFont("Helvetica-Bold", 8)
-        for idx, value in enumerate(total_row):
-            cell_width = widths[idx] * mm
-            c.rect(x, y - row_height, cell_width, row_height, stroke=1, fill=0)
-            c.drawCentredString(x + (cell_width / 2), y - 5.1 * mm, value)
-            x += cell_width
-        y -= row_height
-
-        y -= 9 * mm
-        c.setFont("Helvetica", 9)
-        c.drawString(14 * mm, y, "Prepare By  :-")
-        c.drawCentredString(page_width / 2, y, "Recived By")
-        c.drawRightString(page_width - 14 * mm, y, "Approved By :-")
-
-        if invoice.prepared_by_mode == "with_signature":
-            # Larger signature, placed right under "Prepare By :-"
-            cls._draw_prepare_by_signature(c, invoice, 16 * mm, y + (0.8 * mm), 46 * mm, 20 * mm)
-
-        # Footer block (fixed near page bottom) matching reference invoice style.
-        footer_line_y = 14 * mm
-        c.setLineWidth(1)
-        c.line(14 * mm, footer_line_y, page_width - 14 * mm, footer_line_y)
-        c.setFont("Helvetica", 8.5)
-        c.drawCentredString(
-            page_width / 2,
-            footer_line_y - (4.5 * mm),
-            "P.O. Box : 20124, Phone: 971 4 2503886, Fax: 971 4 2516492, Mobile: 971 55 2381722",
+        doc = InvoiceDocument(
+            c=modules["canvas"].Canvas(buffer, pagesize=modules["A4"]),
+            invoice=invoice,
+            company=company,
+            transport_company_trn=transport_company_trn,
+            page_width=page_width,
+            page_height=page_height,
+            mm=modules["mm"],
+            invoice_no=InvoiceService.generate_invoice_number(invoice.id, invoice.invoice_number),
         )
-        c.drawCentredString(
-            page_width / 2, footer_line_y - (8.5 * mm), "E-mail : sikarcargo@gmail.com"
-        )
-
-        c.save()
-        return buffer.getvalue()
-
-    @classmethod
-    def _template_b(cls, invoice: Invoice, company: Company, trips: list[Trip], transport_company_trn: str = "") -> bytes:
-        modules = cls._reportlab_modules()
-        page_width, page_height = modules["A4"]
-        mm = modules["mm"]
-        canvas_cls = modules["canvas"].Canvas
-
-        buffer = BytesIO()
-        c = canvas_cls(buffer, pagesize=modules["A4"])
-
-        c.setFillColorRGB(0.05, 0.19, 0.35)
-        c.rect(0, page_height - 32 * mm, page_width, 32 * mm, fill=1, stroke=0)
-        c.setFillColorRGB(1, 1, 1)
-        c.setFont("Helvetica-Bold", 18)
-        c.drawString(16 * mm, page_height - 18 * mm, "INVOICE")
-        c.setFont("Helvetica", 10)
-        c.drawString(16 * mm, page_height - 24 * mm, company.name)
-
-        c.setFillColorRGB(0.1, 0.1, 0.1)
-        y = page_height - 44 * mm
-        c.setFont("Helvetica", 9)
-        c.drawString(
-            16 * mm,
-            y,
-            f"Invoice No: {InvoiceService.generate_invoice_number(invoice.id, invoice.invoice_number)}",
-        )
-        c.drawRightString(
-            page_width - 16 * mm, y, f"Date: {invoice.generated_at.date().isoformat()}"
-        )
-        y -= 5 * mm
-        c.drawString(16 * mm, y, f"TRN: {transport_company_trn or '-'}")
-        y -= 5 * mm
-        c.drawString(16 * mm, y, f"Bill To: {company.contact_person}")
-        c.drawRightString(page_width - 16 * mm, y, f"Due: {invoice.due_date.isoformat()}")
-
-        y -= 10 * mm
-        c.setFont("Helvetica-Bold", 9)
-        c.drawString(16 * mm, y, "Route")
-        c.drawString(90 * mm, y, "Freight")
-        c.drawRightString(page_width - 46 * mm, y, "Date")
-        c.drawRightString(page_width - 16 * mm, y, "Total")
-        y -= 2 * mm
-        c.line(16 * mm, y, page_width - 16 * mm, y)
-
-        c.setFont("Helvetica", 9)
-        y -= 6 * mm
-        for trip in trips:
-            c.drawString(16 * mm, y, f"{trip.origin} -> {trip.destination}")
-            c.drawString(90 * mm, y, trip.freight)
-            c.drawRightString(page_width - 46 * mm, y, trip.date.isoformat())
-            c.drawRightString(page_width - 16 * mm, y, f"AED {trip.total_amount:.2f}")
-            y -= 6 * mm
-            if y < 45 * mm:
-                c.showPage()
-                y = page_height - 22 * mm
-
-        summary = InvoiceService.summarize_trips(trips)
-        y -= 2 * mm
-        c.line(120 * mm, y, page_width - 16 * mm, y)
-        y -= 6 * mm
-        c.setFont("Helvetica-Bold", 10)
-        c.drawRightString(page_width - 50 * mm, y, "Total")
-        c.drawRightString(page_width - 16 * mm, y, f"AED {summary['total_amount_include_vat']:.2f}")
-
-        y -= 10 * mm
-        c.setFont("Helvetica", 8)
-        c.drawString(16 * mm, y, f"Address: {company.address}")
-        y -= 4 * mm
-        c.drawString(16 * mm, y, f"Phone: {company.phone} | Email: {company.email}")
-
-        c.save()
-        return buffer.getvalue()
-
-    @classmethod
-    def _template_c(cls, invoice: Invoice, company: Company, trips: list[Trip], transport_company_trn: str = "") -> bytes:
-        modules = cls._reportlab_modules()
-        page_width, page_height = modules["A4"]
-        mm = modules["mm"]
-        canvas_cls = modules["canvas"].Canvas
-
-        buffer = BytesIO()
-        c = canvas_cls(buffer, pagesize=modules["A4"])
-
-        invoice_no = InvoiceService.generate_invoice_number(invoice.id, invoice.invoice_number)
-        invoice_date = invoice.generated_at.date().strftime("%d-%b-%Y")
-        invoice_month = invoice.generated_at.strftime("%b-%y")
-
-        headers = [
-            ["Sr No."],
-            ["Delivery", "Date"],
-            ["Description"],
-            ["Amount", "(Excl. VAT)"],
-            ["VAT%"],
-            ["VAT"],
-            ["Total", "Amount"],
-            ["Remarks"],
-        ]
-        widths = [10, 20, 62, 18, 12, 12, 20, 28]
-        header_height = 12.5 * mm
-        row_height = 7.2 * mm
-        table_x = 14 * mm
-
-        def draw_page_header(first_page: bool) -> float:
-            y_top = page_height - 14 * mm
-            y = cls._draw_brand_header(c, page_width, y_top)
-
-            if first_page:
-                # Match template_a header/info alignment.
-                y -= 3 * mm
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(14 * mm, y, f"Ms/ {company.name}")
-                c.setFont("Helvetica-Bold", 8)
-                y -= 4.1 * mm
-                c.drawString(14 * mm, y, f"TRN:- {company.trn or '-'}")
-                y -= 4.1 * mm
-                c.drawString(14 * mm, y, f"Mobile Number:- {company.phone or '-'}")
-
-                y -= 6 * mm
-                c.setFont("Helvetica-Bold", 14)
-                c.drawCentredString(page_width / 2, y, "TAX INVOICE")
-
-                y -= 4.6 * mm
-                c.setFont("Helvetica-Bold", 9)
-                c.drawCentredString(page_width / 2, y, invoice_month)
-
-                y -= 8 * mm
-                c.drawString(14 * mm, y, f"Invoice No. :- {invoice_no}")
-                y -= 4.1 * mm
-                c.drawString(14 * mm, y, f"Invoice Date :- {invoice_date}")
-                y -= 4.1 * mm
-                c.drawString(14 * mm, y, f"TRN:- {transport_company_trn or '-'}")
-            else:
-                y -= 2.5 * mm
-                c.setFont("Helvetica-Bold", 9)
-                c.drawString(14 * mm, y, f"Invoice No. :- {invoice_no}")
-                y -= 4.6 * mm
-                c.setFont("Helvetica-Bold", 8)
-                c.drawString(14 * mm, y, f"Invoice Date :- {invoice_date}")
-                y -= 4.2 * mm
-                c.setFont("Helvetica", 7.2)
-                c.drawString(14 * mm, y, "Continued trip details")
-
-            y -= 6 * mm
-            x = table_x
-            c.setFont("Helvetica-Bold", 6.5)
-            for idx, header_lines in enumerate(headers):
-                cell_width = widths[idx] * mm
-                c.rect(x, y - header_height, cell_width, header_height, stroke=1, fill=0)
-                if len(header_lines) == 1:
-                    c.drawCentredString(x + (cell_width / 2), y - 7.7 * mm, header_lines[0])
-                else:
-                    c.drawCentredString(x + (cell_width / 2), y - 5.3 * mm, header_lines[0])
-                    c.drawCentredString(x + (cell_width / 2), y - 9.4 * mm, header_lines[1])
-                x += cell_width
-            return cast(float, y - header_height)
-
-        def draw_footer() -> None:
-            footer_line_y = 14 * mm
-            c.setLineWidth(1)
-            c.line(14 * mm, footer_line_y, page_width - 14 * mm, footer_line_y)
-            c.setFont("Helvetica", 8.2)
-            c.drawCentredString(
-                page_width / 2,
-                footer_line_y - (4.5 * mm),
-                "P.O. Box : 20124, Phone: 971 4 2503886, Fax: 971 4 2516492, Mobile: 971 55 2381722",
-            )
-            c.drawCentredString(
-                page_width / 2, footer_line_y - (8.5 * mm), "E-mail : sikarcargo@gmail.com"
-            )
-
-        y = draw_page_header(first_page=True)
-        c.setFont("Helvetica", 7)
-
-        for i, trip in enumerate(trips, start=1):
-            # Keep enough space for next row and footer; otherwise continue on next page.
-            if y - row_height < 34 * mm:
-                draw_footer()
-                c.showPage()
-                y = draw_page_header(first_page=False)
-                c.setFont("Helvetica", 7)
-
-            destination_company = (trip.destination_company_name or "").strip() or "Destination N/A"
-            row = [
-                str(i),
-                trip.date.strftime("%d-%b-%Y"),
-                f"{destination_company} ({trip.destination})",
-                f"{trip.amount:.2f}",
-                "0%" if float(trip.vat) == 0 else "5%",
-                f"{trip.vat:.2f}",
-                f"{trip.total_amount:.2f}",
-                trip.freight,
-            ]
-
-            x = table_x
-            for idx, value in enumerate(row):
-                cell_width = widths[idx] * mm
-                c.rect(x, y - row_height, cell_width, row_height, stroke=1, fill=0)
-                if idx == 2:
-                    c.drawString(x + 1.4 * mm, y - 5.0 * mm, str(value)[:52])
-                else:
-                    c.drawCentredString(x + (cell_width / 2), y - 5.0 * mm, str(value))
-                x += cell_width
-            y -= row_height
-
-        summary = InvoiceService.summarize_trips(trips)
-
-        if y - (row_height + (28 * mm)) < 24 * mm:
-            draw_footer()
-            c.showPage()
-            y = draw_page_header(first_page=False)
-
-        total_row = [
-            "",
-            "",
-            "",
-            f"{summary['total_amount']:.2f}",
-            "",
-            f"{summary['total_vat_amount']:.2f}",
-            f"{summary['total_amount_include_vat']:.2f}",
-            "",
-        ]
-        x = table_x
-        c.setFont("Helvetica-Bold", 7.8)
-        for idx, value in enumerate(total_row):
-            cell_width = widths[idx] * mm
-            c.rect(x, y - row_height, cell_width, row_height, stroke=1, fill=0)
-            c.drawCentredString(x + (cell_width / 2), y - 5.0 * mm, value)
-            x += cell_width
-        y -= row_height
-
-        y -= 9 * mm
-        c.setFont("Helvetica", 9)
-        c.drawString(14 * mm, y, "Prepare By  :-")
-        c.drawCentredString(page_width / 2, y, "Recived By")
-        c.drawRightString(page_width - 14 * mm, y, "Approved By :-")
-
-        if invoice.prepared_by_mode == "with_signature":
-            cls._draw_prepare_by_signature(c, invoice, 16 * mm, y + (0.8 * mm), 46 * mm, 20 * mm)
-
-        draw_footer()
-        c.save()
+        if template.setup is not None:
+            template.setup(doc)
+
+        def new_page() -> float:
+            if template.footer is not None and template.footer_on_every_page:
+                template.footer(doc)
+            doc.c.showPage()
+            return template.continuation_page(doc)
+
+        if group_by is None:
+            table, rows = template.table, _trip_rows(trips)
+        else:
+            table, rows = _summary_table(template.table, group_by), _grouped_rows(trips, group_by)
+        writer = TableWriter(doc.c, compile_table(table, doc.mm), new_page)
+        writer.start(template.first_page(doc))
+        writer.write_rows(rows)
+        y = writer.write_totals(InvoiceService.summarize_trips(trips))
+        template.closing(doc, y)
+        if template.footer is not None:
+            template.footer(doc)
+        doc.c.save()
         return buffer.getvalue()
 
     @classmethod
@@ -701,3 +435,353 @@ class InvoicePDFService:
             if candidate.exists() and candidate.is_file():
                 return candidate
         return None
+
+
+def _destination_company(trip: Trip) -> str:
+    return (trip.destination_company_name or "").strip() or "Destination N/A"
+
+
+def _trip_rows(trips: list[Trip]) -> Iterator[dict[str, Any]]:
+    for index, trip in enumerate(trips, start=1):
+        yield {
+            "index": index,
+            "date": trip.date,
+            "origin": trip.origin,
+            "destination": trip.destination,
+            "destination_company": _destination_company(trip),
+            "freight": trip.freight,
+            "amount": trip.amount,
+            "vat": trip.vat,
+            "vat_rate": "0%" if float(trip.vat) == 0 else "5%",
+            "toll_gate": trip.toll_gate,
+            "total_amount": trip.total_amount,
+        }
+
+
+def _grouped_rows(trips: list[Trip], group_by: str) -> Iterator[dict[str, Any]]:
+    # One running total per group, so memory grows with the number of groups, not trips.
+    groups: dict[Any, list[Any]] = {}
+    for trip in trips:
+        key: Any = (
+            trip.date if group_by == "date" else (_destination_company(trip), trip.destination)
+        )
+        totals = groups.get(key)
+        if totals is None:
+            groups[key] = [1, trip.amount, trip.vat, trip.toll_gate, trip.total_amount]
+        else:
+            totals[0] += 1
+            totals[1] += trip.amount
+            totals[2] += trip.vat
+            totals[3] += trip.toll_gate
+            totals[4] += trip.total_amount
+    for index, key in enumerate(sorted(groups), start=1):
+        count, amount, vat, toll_gate, total_amount = groups[key]
+        yield {
+            "index": index,
+            "label": f"{key:%d-%b-%Y}" if group_by == "date" else f"{key[0]} ({key[1]})",
+            "trips": count,
+            "amount": amount,
+            "vat": vat,
+            "toll_gate": toll_gate,
+            "total_amount": total_amount,
+        }
+
+
+@lru_cache(maxsize=16)
+def _summary_table(table: TableSpec, group_by: str) -> TableSpec:
+    columns = SUMMARY_COLUMNS[group_by]
+    scale = sum(column.width for column in table.columns) / sum(column.width for column in columns)
+    return replace(
+        table,
+        columns=tuple(replace(column, width=column.width * scale) for column in columns),
+    )
+
+
+def _customer_block(doc: InvoiceDocument, y: float) -> float:
+    c, mm = doc.c, doc.mm
+    y -= 3 * mm
+    c.setFont("Helvetica-Bold", 10)
+    c.drawString(14 * mm, y, f"Ms/ {doc.company.name}")
+    c.setFont("Helvetica-Bold", 8)
+    y -= 4.1 * mm
+    c.drawString(14 * mm, y, f"TRN:- {doc.company.trn or '-'}")
+    y -= 4.1 * mm
+    c.drawString(14 * mm, y, f"Mobile Number:- {doc.company.phone or '-'}")
+    y -= 6 * mm
+    c.setFont("Helvetica-Bold", 14)
+    c.drawCentredString(doc.page_width / 2, y, "TAX INVOICE")
+    return y
+
+
+def _letterhead_first_page(doc: InvoiceDocument) -> float:
+    c, mm = doc.c, doc.mm
+    y = InvoicePDFService._draw_brand_header(c, doc.page_width, doc.page_height - 14 * mm)
+    y = _customer_block(doc, y)
+    y -= 4.6 * mm
+    c.setFont("Helvetica-Bold", 9)
+    c.drawCentredString(doc.page_width / 2, y, f"TRN:- {doc.transport_company_trn or '-'}")
+    y -= 8 * mm
+    c.setFont("Helvetica-Bold", 9)
+    c.drawString(14 * mm, y, f"Invoice No. :- {doc.invoice_no}")
+    y -= 4.1 * mm
+    c.drawString(14 * mm, y, f"Invoice Date :- {doc.invoice.generated_at.strftime('%d-%b-%Y')}")
+    return y - 6 * mm
+
+
+def _letterhead_continuation_page(doc: InvoiceDocument) -> float:
+    c, mm = doc.c, doc.mm
+    y = doc.page_height - 18 * mm
+    c.setFont("Helvetica-Bold", 9)
+    c.drawString(14 * mm, y, f"Invoice No. :- {doc.invoice_no}")
+    c.setFont("Helvetica", 7.2)
+    c.drawRightString(doc.page_width - 14 * mm, y, "Continued trip details")
+    return y - 5 * mm
+
+
+def _signature_block(doc: InvoiceDocument, y: float) -> None:
+    c, mm = doc.c, doc.mm
+    y -= 9 * mm
+    c.setFont("Helvetica", 9)
+    c.drawString(14 * mm, y, "Prepare By  :-")
+    c.drawCentredString(doc.page_width / 2, y, "Recived By")
+    c.drawRightString(doc.page_width - 14 * mm, y, "Approved By :-")
+    if doc.invoice.prepared_by_mode == "with_signature":
+        InvoicePDFService._draw_prepare_by_signature(
+            c, doc.invoice, 16 * mm, y + (0.8 * mm), 46 * mm, 20 * mm
+        )
+
+
+def _draw_contact_footer(doc: InvoiceDocument, font_size: float) -> None:
+    c, mm = doc.c, doc.mm
+    footer_line_y = 14 * mm
+    c.setLineWidth(1)
+    c.line(14 * mm, footer_line_y, doc.page_width - 14 * mm, footer_line_y)
+    c.setFont("Helvetica", font_size)
+    c.drawCentredString(
+        doc.page_width / 2,
+        footer_line_y - (4.5 * mm),
+        "P.O. Box : 20124, Phone: 971 4 2503886, Fax: 971 4 2516492, Mobile: 971 55 2381722",
+    )
+    c.drawCentredString(
+        doc.page_width / 2, footer_line_y - (8.5 * mm), "E-mail : sikarcargo@gmail.com"
+    )
+
+
+def _letterhead_footer(doc: InvoiceDocument) -> None:
+    _draw_contact_footer(doc, 8.5)
+
+
+def _banner_first_page(doc: InvoiceDocument) -> float:
+    c, mm = doc.c, doc.mm
+    page_width, page_height = doc.page_width, doc.page_height
+    c.setFillColorRGB(0.05, 0.19, 0.35)
+    c.rect(0, page_height - 32 * mm, page_width, 32 * mm, fill=1, stroke=0)
+    c.setFillColorRGB(1, 1, 1)
+    c.setFont("Helvetica-Bold", 18)
+    c.drawString(16 * mm, page_height - 18 * mm, "INVOICE")
+    c.setFont("Helvetica", 10)
+    c.drawString(16 * mm, page_height - 24 * mm, doc.company.name)
+
+    c.setFillColorRGB(0.1, 0.1, 0.1)
+    y = page_height - 44 * mm
+    c.setFont("Helvetica", 9)
+    c.drawString(16 * mm, y, f"Invoice No: {doc.invoice_no}")
+    c.drawRightString(
+        page_width - 16 * mm, y, f"Date: {doc.invoice.generated_at.date().isoformat()}"
+    )
+    y -= 5 * mm
+    c.drawString(16 * mm, y, f"TRN: {doc.transport_company_trn or '-'}")
+    y -= 5 * mm
+    c.drawString(16 * mm, y, f"Bill To: {doc.company.contact_person}")
+    c.drawRightString(page_width - 16 * mm, y, f"Due: {doc.invoice.due_date.isoformat()}")
+    return y - 6 * mm
+
+
+def _banner_continuation_page(doc: InvoiceDocument) -> float:
+    c, mm = doc.c, doc.mm
+    y = doc.page_height - 18 * mm
+    c.setFillColorRGB(0.1, 0.1, 0.1)
+    c.setFont("Helvetica", 9)
+    c.drawString(16 * mm, y, f"Invoice No: {doc.invoice_no} (continued)")
+    return y - 6 * mm
+
+
+def _banner_closing(doc: InvoiceDocument, y: float) -> None:
+    c, mm = doc.c, doc.mm
+    y -= 10 * mm
+    c.setFont("Helvetica", 8)
+    c.drawString(16 * mm, y, f"Address: {doc.company.address}")
+    y -= 4 * mm
+    c.drawString(16 * mm, y, f"Phone: {doc.company.phone} | Email: {doc.company.email}")
+
+
+def _detailed_setup(doc: InvoiceDocument) -> None:
+    # Page chrome is recorded once as form XObjects and referenced from every page.
+    c, mm = doc.c, doc.mm
+    c.beginForm("brand_header")
+    doc.brand_header_bottom = InvoicePDFService._draw_brand_header(
+        c, doc.page_width, doc.page_height - 14 * mm
+    )
+    c.endForm()
+    c.beginForm("footer")
+    _draw_contact_footer(doc, 8.2)
+    c.endForm()
+
+
+def _detailed_first_page(doc: InvoiceDocument) -> float:
+    c, mm = doc.c, doc.mm
+    c.doForm("brand_header")
+    y = _customer_block(doc, doc.brand_header_bottom)
+    y -= 4.6 * mm
+    c.setFont("Helvetica-Bold", 9)
+    c.drawCentredString(doc.page_width / 2, y, doc.invoice.generated_at.strftime("%b-%y"))
+    y -= 8 * mm
+    c.drawString(14 * mm, y, f"Invoice No. :- {doc.invoice_no}")
+    y -= 4.1 * mm
+    c.drawString(14 * mm, y, f"Invoice Date :- {doc.invoice.generated_at.strftime('%d-%b-%Y')}")
+    y -= 4.1 * mm
+    c.drawString(14 * mm, y, f"TRN:- {doc.transport_company_trn or '-'}")
+    return y - 6 * mm
+
+
+def _detailed_continuation_page(doc: InvoiceDocument) -> float:
+    c, mm = doc.c, doc.mm
+    c.doForm("brand_header")
+    y = doc.brand_header_bottom - 2.5 * mm
+    c.setFont("Helvetica-Bold", 9)
+    c.drawString(14 * mm, y, f"Invoice No. :- {doc.invoice_no}")
+    y -= 4.6 * mm
+    c.setFont("Helvetica-Bold", 8)
+    c.drawString(14 * mm, y, f"Invoice Date :- {doc.invoice.generated_at.strftime('%d-%b-%Y')}")
+    y -= 4.2 * mm
+    c.setFont("Helvetica", 7.2)
+    c.drawString(14 * mm, y, "Continued trip details")
+    return y - 6 * mm
+
+
+def _detailed_footer(doc: InvoiceDocument) -> None:
+    doc.c.doForm("footer")
+
+
+TEMPLATE_A = InvoiceTemplate(
+    table=TableSpec(
+        columns=(
+            Column(("Sr No.",), 10, "{index}"),
+            Column(("Delivery", "Date"), 22, "{date:%d-%b-%Y}"),
+            Column(
+                ("Description",),
+                56,
+                "{origin} to {destination_company} ({destination})",
+                align="left",
+            ),
+            Column(("Amount", "(Excl. VAT)"), 18, "{amount:.2f}", total="{total_amount:.2f}"),
+            Column(("VAT 5%",), 14, "{vat:.2f}", total="{total_vat_amount:.2f}"),
+            Column(("Pass &", "Parking"), 14, "{toll_gate:.2f}", total="{total_toll_amount:.2f}"),
+            Column(
+                ("Total", "Amount"),
+                20,
+                "{total_amount:.2f}",
+                total="{total_amount_include_vat:.2f}",
+            ),
+            Column(("Remarks",), 28, "{freight}"),
+        ),
+        x=14,
+        header_height=13,
+        header_baselines=((8.0,), (5.6, 9.8)),
+        row_height=7.5,
+        baseline=5.2,
+        padding=1.5,
+        bottom=47.5,
+    ),
+    first_page=_letterhead_first_page,
+    continuation_page=_letterhead_continuation_page,
+    closing=_signature_block,
+    footer=_letterhead_footer,
+    footer_on_every_page=True,
+)
+TEMPLATE_B = InvoiceTemplate(
+    table=TableSpec(
+        columns=(
+            Column(("Route",), 74, "{origin} -> {destination}", align="left"),
+            Column(("Freight",), 44, "{freight}", align="left"),
+            Column(("Date",), 30, "{date:%Y-%m-%d}", align="right", total="Total"),
+            Column(
+                ("Total",),
+                30,
+                "AED {total_amount:.2f}",
+                align="right",
+                total="AED {total_amount_include_vat:.2f}",
+            ),
+        ),
+        x=16,
+        header_height=6,
+        header_baselines=((4.0,),),
+        row_height=6,
+        baseline=6,
+        padding=0,
+        bottom=45,
+        font=("Helvetica", 9),
+        header_font=("Helvetica-Bold", 9),
+        total_font=("Helvetica-Bold", 10),
+        boxed=False,
+        header_align=None,
+        closing_reserve=14,
+    ),
+    first_page=_banner_first_page,
+    continuation_page=_banner_continuation_page,
+    closing=_banner_closing,
+)
+TEMPLATE_C = InvoiceTemplate(
+    table=TableSpec(
+        columns=(
+            Column(("Sr No.",), 10, "{index}"),
+            Column(("Delivery", "Date"), 20, "{date:%d-%b-%Y}"),
+            Column(("Description",), 62, "{destination_company} ({destination})", align="left"),
+            Column(("Amount", "(Excl. VAT)"), 18, "{amount:.2f}", total="{total_amount:.2f}"),
+            Column(("VAT%",), 12, "{vat_rate}"),
+            Column(("VAT",), 12, "{vat:.2f}", total="{total_vat_amount:.2f}"),
+            Column(
+                ("Total", "Amount"),
+                20,
+                "{total_amount:.2f}",
+                total="{total_amount_include_vat:.2f}",
+            ),
+            Column(("Remarks",), 28, "{freight}"),
+        ),
+        x=14,
+        header_height=12.5,
+        header_baselines=((7.7,), (5.3, 9.4)),
+        row_height=7.2,
+        baseline=5.0,
+        padding=1.4,
+        bottom=34,
+        header_font=("Helvetica-Bold", 6.5),
+        total_font=("Helvetica-Bold", 7.8),
+        closing_reserve=18,
+    ),
+    first_page=_detailed_first_page,
+    continuation_page=_detailed_continuation_page,
+    closing=_signature_block,
+    footer=_detailed_footer,
+    footer_on_every_page=True,
+    setup=_detailed_setup,
+)
+# Compact layouts for very large invoices; widths are rescaled to each template's table.
+SUMMARY_COLUMNS: dict[str, tuple[Column, ...]] = {
+    group_by: (
+        Column(("Sr No.",), 10, "{index}"),
+        Column((label,), 62, "{label}", align="left"),
+        Column(("Trips",), 18, "{trips}"),
+        Column(("Amount",), 22, "{amount:.2f}", total="{total_amount:.2f}"),
+        Column(("VAT",), 18, "{vat:.2f}", total="{total_vat_amount:.2f}"),
+        Column(("Tolls",), 22, "{toll_gate:.2f}", total="{total_toll_amount:.2f}"),
+        Column(("Total",), 30, "{total_amount:.2f}", total="{total_amount_include_vat:.2f}"),
+    )
+    for group_by, label in (("date", "Date"), ("destination", "Destination"))
+}
+INVOICE_TEMPLATES: dict[str, InvoiceTemplate] = {
+    "template_a": TEMPLATE_A,
+    "template_b": TEMPLATE_B,
+    "template_c": TEMPLATE_C,
+    "detailed": TEMPLATE_C,
+}
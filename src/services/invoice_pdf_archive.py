@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import zipfile
+from datetime import datetime
+
+
+class _ChunkSink:
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        payload = b"".join(self._chunks)
+        self._chunks.clear()
+        return payload
+
+
+class ZipStreamWriter:
+    """Builds a ZIP archive incrementally; each call returns the bytes ready to send."""
+
+    def __init__(self) -> None:
+        self._sink = _ChunkSink()
+        # An unseekable sink makes zipfile write data descriptors instead of seeking back.
+        self._zip = zipfile.ZipFile(self._sink, mode="w")
+
+    def add(self, name: str, content: bytes, modified_at: datetime) -> bytes:
+        info = zipfile.ZipInfo(name, date_time=modified_at.timetuple()[:6])
+        info.compress_type = zipfile.ZIP_STORED
+        self._zip.writestr(info, content)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._zip.close()
+        return self._sink.drain()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from src.core.config import Settings
+from src.core.logging import logger
+from src.models.invoice import Invoice
+
+# Bump when a template change should invalidate every cached PDF.
+PDF_CACHE_VERSION = 4
+INVOICE_CACHE_FIELDS = (
+    "invoice_number",
+    "start_date",
+    "end_date",
+    "due_date",
+    "generated_at",
+    "total_amount",
+    "format_key",
+    "prepared_by_mode",
+    "signatory_name",
+    "signatory_image_path",
+    "signatory_image_mime",
+)
+
+
+def invoice_pdf_cache_key(
+    invoice: Invoice,
+    snapshot_hash: str,
+    template_key: str,
+    group_by: str | None = None,
+) -> str:
+    # The customer, TRN and lines are covered by the hash of the invoice's line snapshot.
+    signature = invoice.signatory_image_data
+    payload = {
+        "version": PDF_CACHE_VERSION,
+        "invoice_id": invoice.id,
+        "template": template_key,
+        "group_by": group_by,
+        "invoice": [getattr(invoice, name) for name in INVOICE_CACHE_FIELDS],
+        "snapshot": snapshot_hash,
+        "signature": hashlib.sha256(signature).hexdigest() if signature else None,
+    }
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class InvoicePDFCache:
+    def __init__(self, directory: Path, *, max_bytes: int) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Running size of the directory, so a put only scans it when over budget.
+        self._total_bytes: int | None = None
+        self._lock = threading.Lock()
+        directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> InvoicePDFCache | None:
+        if not settings.invoice_pdf_cache_dir.strip():
+            return None
+        return cls(
+            Path(settings.invoice_pdf_cache_dir),
+            max_bytes=settings.invoice_pdf_cache_max_bytes,
+        )
+
+    def get(self, invoice_id: int, key: str) -> bytes | None:
+        # Entries are returned as bytes so that a concurrent eviction cannot pull the
+        # file out from under a response that is still being sent.
+        path = self._path(invoice_id, key)
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with contextlib.suppress(FileNotFoundError):
+            # The mtime doubles as the last-access time for LRU eviction.
+            os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def put(self, invoice_id: int, key: str, content: bytes) -> Path:
+        path = self._path(invoice_id, key)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(content)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, _, size in self._entries())
+            else:
+                self._total_bytes += len(content) - replaced
+            if self._total_bytes > self._max_bytes:
+                self._evict(keep=path)
+        return path
+
+    def invalidate(self, invoice_id: int) -> int:
+        removed = 0
+        for path in self._directory.glob(f"{invoice_id}-*.pdf"):
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+            with self._lock:
+                if self._total_bytes is not None:
+                    self._total_bytes -= size
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, _, size in entries),
+        }
+
+    def _path(self, invoice_id: int, key: str) -> Path:
+        return self._directory / f"{invoice_id}-{key}.pdf"
+
+    def _entries(self) -> list[tuple[float, Path, int]]:
+        entries: list[tuple[float, Path, int]] = []
+        for path in self._directory.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _evict(self, *, keep: Path) -> None:
+        # Rescanned here because other processes may share the directory.
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug("invoice_pdf_cache_evicted path=%s bytes=%s", path.name, size)
+        self._total_bytes = total
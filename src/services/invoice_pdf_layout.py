@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import string
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Literal
+
+Align = Literal["left", "center", "right"]
+HEADER_FORM = "column_header"
+_DRAW_METHODS: dict[Align, str] = {
+    "left": "drawString",
+    "center": "drawCentredString",
+    "right": "drawRightString",
+}
+_VISIBLE_ASCII = string.ascii_letters + string.digits + string.punctuation
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    header: tuple[str, ...]
+    width: float
+    cell: str
+    align: Align = "center"
+    total: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class TableSpec:
+    """A trip table; lengths are in millimetres and offsets are measured down from a row top.
+
+    ``cell`` and ``total`` are ``str.format`` templates over the row fields and the invoice
+    summary. ``header_baselines`` holds the baseline offsets for one- and two-line headers.
+    """
+
+    columns: tuple[Column, ...]
+    x: float
+    header_height: float
+    header_baselines: tuple[tuple[float, ...], ...]
+    row_height: float
+    baseline: float
+    padding: float
+    bottom: float
+    font: tuple[str, float] = ("Helvetica", 7)
+    header_font: tuple[str, float] = ("Helvetica-Bold", 6.6)
+    total_font: tuple[str, float] = ("Helvetica-Bold", 8)
+    boxed: bool = True
+    header_align: Align | None = "center"
+    closing_reserve: float = 0.0
+    repeat_header: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledColumn:
+    draw: str
+    anchor: float
+    text: Callable[[Mapping[str, Any]], str]
+    total: Callable[[Mapping[str, Any]], str] | None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTable:
+    spec: TableSpec
+    columns: tuple[CompiledColumn, ...]
+    edges: tuple[float, ...]
+    header_text: tuple[tuple[str, float, float, str], ...]
+    header_height: float
+    row_height: float
+    baseline: float
+    bottom: float
+    closing_reserve: float
+    totals_left: float
+
+
+@lru_cache(maxsize=32)
+def compile_table(spec: TableSpec, mm: float) -> CompiledTable:
+    edges = [spec.x * mm]
+    for column in spec.columns:
+        edges.append(edges[-1] + column.width * mm)
+    padding = spec.padding * mm
+    header_height = spec.header_height * mm
+
+    columns: list[CompiledColumn] = []
+    header_text: list[tuple[str, float, float, str]] = []
+    for index, column in enumerate(spec.columns):
+        left, right = edges[index], edges[index + 1]
+        fit = _fitter(*spec.font, right - left - 2 * padding)
+        columns.append(
+            CompiledColumn(
+                draw=_DRAW_METHODS[column.align],
+                anchor=_anchor(column.align, left, right, padding),
+                text=_cell_text(column.cell.format_map, fit),
+                total=column.total.format_map if column.total else None,
+            )
+        )
+        header_align = spec.header_align or column.align
+        for line, offset in zip(
+            column.header, spec.header_baselines[len(column.header) - 1], strict=True
+        ):
+            header_text.append(
+                (
+                    _DRAW_METHODS[header_align],
+                    _anchor(header_align, left, right, padding),
+                    header_height - offset * mm,
+                    line,
+                )
+            )
+
+    totals_left = next(
+        (edges[index] for index, column in enumerate(spec.columns) if column.total), edges[0]
+    )
+    return CompiledTable(
+        spec=spec,
+        columns=tuple(columns),
+        edges=tuple(edges),
+        header_text=tuple(header_text),
+        header_height=header_height,
+        row_height=spec.row_height * mm,
+        baseline=spec.baseline * mm,
+        bottom=spec.bottom * mm,
+        closing_reserve=spec.closing_reserve * mm,
+        totals_left=totals_left,
+    )
+
+
+def _anchor(align: Align, left: float, right: float, padding: float) -> float:
+    if align == "left":
+        return left + padding
+    if align == "right":
+        return right - padding
+    return (left + right) / 2
+
+
+def _cell_text(
+    format_row: Callable[[Mapping[str, Any]], str], fit: Callable[[str], str]
+) -> Callable[[Mapping[str, Any]], str]:
+    def text(row: Mapping[str, Any]) -> str:
+        return fit(format_row(row))
+
+    return text
+
+
+def _fitter(font_name: str, font_size: float, max_width: float) -> Callable[[str], str]:
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    widest = max(stringWidth(char, font_name, font_size) for char in _VISIBLE_ASCII)
+    # ASCII text this short fits even if every glyph is the widest one, so skip measuring it.
+    safe_length = int(max_width // widest)
+
+    @lru_cache(maxsize=1024)
+    def measure_fit(text: str) -> str:
+        if stringWidth(text, font_name, font_size) <= max_width:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if stringWidth(text[:middle], font_name, font_size) <= max_width:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low]
+
+    def fit(text: str) -> str:
+        if len(text) <= safe_length and text.isascii():
+            return text
+        return measure_fit(text)
+
+    return fit
+
+
+class TableWriter:
+    def __init__(self, c: Any, table: CompiledTable, new_page: Callable[[], float]) -> None:
+        self._c = c
+        self._table = table
+        self._new_page = new_page
+        self._grid_top = 0.0
+        self._grid_rows = 0
+        self.y = 0.0
+
+    def start(self, top: float) -> None:
+        self._define_header_form()
+        self._begin_section(top, with_header=True)
+
+    def write_rows(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        c = self._c
+        table = self._table
+        cells = [(getattr(c, column.draw), column.anchor, column.text) for column in table.columns]
+        row_height = table.row_height
+        baseline = table.baseline
+        bottom = table.bottom
+        for row in rows:
+            if self.y - row_height < bottom:
+                self._break_page()
+            text_y = self.y - baseline
+            for draw, anchor, text in cells:
+                draw(anchor, text_y, text(row))
+            self.y -= row_height
+            self._grid_rows += 1
+        self._flush_grid()
+
+    def write_totals(self, summary: Mapping[str, Any]) -> float:
+        c = self._c
+        table = self._table
+        if self.y - table.row_height - table.closing_reserve < table.bottom:
+            self._break_page()
+        c.setFont(*table.spec.total_font)
+        if table.spec.boxed:
+            self._grid_top, self._grid_rows = self.y, 1
+            self._flush_grid()
+        else:
+            c.line(table.totals_left, self.y, table.edges[-1], self.y)
+        text_y = self.y - table.baseline
+        for column in table.columns:
+            if column.total is not None:
+                getattr(c, column.draw)(column.anchor, text_y, column.total(summary))
+        self.y -= table.row_height
+        return self.y
+
+    def _break_page(self) -> None:
+        self._flush_grid()
+        self._begin_section(self._new_page(), with_header=self._table.spec.repeat_header)
+
+    def _begin_section(self, top: float, *, with_header: bool) -> None:
+        c = self._c
+        table = self._table
+        self.y = top
+        if with_header:
+            c.saveState()
+            c.translate(0, top - table.header_height)
+            c.doForm(HEADER_FORM)
+            c.restoreState()
+            self.y -= table.header_height
+        c.setFont(*table.spec.font)
+        self._grid_top, self._grid_rows = self.y, 0
+
+    def _define_header_form(self) -> None:
+        c = self._c
+        table = self._table
+        edges = table.edges
+        height = table.header_height
+        c.beginForm(HEADER_FORM, lowery=-1, uppery=height + 1)
+        if table.spec.boxed:
+            band = c.beginPath()
+            band.rect(edges[0], 0, edges[-1] - edges[0], height)
+            for edge in edges[1:-1]:
+                band.moveTo(edge, 0)
+                band.lineTo(edge, height)
+            c.drawPath(band, stroke=1, fill=0)
+        else:
+            c.line(edges[0], 0, edges[-1], 0)
+        c.setFont(*table.spec.header_font)
+        for draw, anchor, y, line in table.header_text:
+            getattr(c, draw)(anchor, y, line)
+        c.endForm()
+
+    def _flush_grid(self) -> None:
+        rows = self._grid_rows
+        self._grid_rows = 0
+        if rows == 0 or not self._table.spec.boxed:
+            return
+        edges = self._table.edges
+        top = self._grid_top
+        row_height = self._table.row_height
+        bottom = top - rows * row_height
+        grid = self._c.beginPath()
+        for row_index in range(rows + 1):
+            line_y = top - row_index * row_height
+            grid.moveTo(edges[0], line_y)
+            grid.lineTo(edges[-1], line_y)
+        for edge in edges:
+            grid.moveTo(edge, top)
+            grid.lineTo(edge, bottom)
+        self._c.drawPath(grid, stroke=1, fill=0)
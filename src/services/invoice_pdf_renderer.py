@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import inspect
+
+from src.core.config import Settings
+from src.core.exceptions import AppException
+from src.models.invoice import Invoice
+from src.services.invoice_pdf import InvoicePDFService
+from src.services.invoice_snapshot import snapshot_company, snapshot_trips
+
+# Deferred columns hold blobs such as line_snapshot; only the ones the layout reads are sent.
+_RENDERED_DEFERRED_COLUMNS = frozenset({"_signatory_image_data"})
+
+
+def _column_snapshot(obj: Any) -> dict[str, Any]:
+    state = inspect(obj)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict and (not attr.deferred or attr.key in _RENDERED_DEFERRED_COLUMNS)
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class InvoicePDFJob:
+    invoice: dict[str, Any]
+    # In line_snapshot form; the lines are decoded in the render process, not on the event loop.
+    snapshot: dict[str, Any]
+    template_key: str | None = None
+    group_by: str | None = None
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        invoice: Invoice,
+        snapshot: dict[str, Any],
+        template_key: str | None = None,
+        group_by: str | None = None,
+    ) -> InvoicePDFJob:
+        # The signature blob travels as its stored (encrypted) column value.
+        return cls(
+            invoice=_column_snapshot(invoice),
+            snapshot=snapshot,
+            template_key=template_key,
+            group_by=group_by,
+        )
+
+
+def render_invoice_pdf(job: InvoicePDFJob) -> bytes:
+    return InvoicePDFService.generate_pdf(
+        Invoice(**job.invoice),
+        snapshot_company(job.snapshot),
+        snapshot_trips(job.snapshot),
+        job.template_key,
+        job.snapshot["transport_company_trn"],
+        job.group_by,
+    )
+
+
+class InvoicePDFRenderer:
+    def __init__(self, *, max_workers: int, max_pending: int, timeout_seconds: float) -> None:
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._timeout_seconds = timeout_seconds
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._slot_freed = asyncio.Event()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> InvoicePDFRenderer:
+        return cls(
+            max_workers=settings.invoice_pdf_render_workers,
+            max_pending=settings.invoice_pdf_render_max_pending,
+            timeout_seconds=settings.invoice_pdf_render_timeout_seconds,
+        )
+
+    @classmethod
+    def for_pdf_jobs(cls, settings: Settings) -> InvoicePDFRenderer:
+        # Background jobs get their own pool and a longer timeout than interactive downloads.
+        return cls(
+            max_workers=settings.pdf_job_worker_concurrency,
+            max_pending=settings.pdf_job_worker_concurrency,
+            timeout_seconds=settings.pdf_job_render_timeout_seconds,
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def render(self, job: InvoicePDFJob, *, wait_for_slot: bool = False) -> bytes:
+        while self._pending >= self._max_pending:
+            if not wait_for_slot:
+                raise AppException(
+                    "PDF rendering is busy, please retry shortly",
+                    status_code=503,
+                    code="pdf_render_busy",
+                )
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+        loop = asyncio.get_running_loop()
+        future = self._get_executor().submit(render_invoice_pdf, job)
+        self._pending += 1
+        # A timed-out render keeps its worker busy, so the slot is only freed once it finishes.
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._timeout_seconds)
+        except TimeoutError as exc:
+            raise AppException(
+                "PDF rendering timed out",
+                status_code=504,
+                code="pdf_render_timeout",
+            ) from exc
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._max_workers == 0:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=InvoicePDFService.warm_brand_header,
+                )
+        return self._executor
+
+    def _release(self) -> None:
+        self._pending -= 1
+        self._slot_freed.set()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Sequence
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from src.models.company import Company
+from src.models.trip import Trip
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_COMPANY_FIELDS = (
+    "id",
+    "name",
+    "address",
+    "email",
+    "phone",
+    "trn",
+    "contact_person",
+    "po_box",
+)
+SNAPSHOT_TRIP_COLUMNS = (
+    Trip.id,
+    Trip.date,
+    Trip.freight,
+    Trip.origin,
+    Trip.destination,
+    Trip.destination_company_name,
+    Trip.amount,
+    Trip.vat,
+    Trip.toll_gate,
+    Trip.total_amount,
+)
+SNAPSHOT_TRIP_FIELDS = tuple(column.key for column in SNAPSHOT_TRIP_COLUMNS)
+
+_TRIP_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "date": date.fromisoformat,
+    "amount": Decimal,
+    "vat": Decimal,
+    "toll_gate": Decimal,
+    "total_amount": Decimal,
+}
+
+
+def build_invoice_snapshot(
+    company: Company, transport_company_trn: str, trips: Sequence[Any]
+) -> dict[str, Any]:
+    # Accepts SNAPSHOT_TRIP_COLUMNS rows as well as Trip instances.
+    rows = sorted(trips, key=lambda trip: (trip.date, trip.id))
+    return {
+        "version": SNAPSHOT_VERSION,
+        "company": {name: getattr(company, name) for name in SNAPSHOT_COMPANY_FIELDS},
+        "transport_company_trn": transport_company_trn,
+        "trip_fields": list(SNAPSHOT_TRIP_FIELDS),
+        "trips": [[_encode(getattr(row, name)) for name in SNAPSHOT_TRIP_FIELDS] for row in rows],
+    }
+
+
+def snapshot_hash(snapshot: dict[str, Any]) -> str:
+    raw = json.dumps(snapshot, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def snapshot_company(snapshot: dict[str, Any]) -> Company:
+    return Company(**snapshot["company"])
+
+
+def snapshot_trips(snapshot: dict[str, Any]) -> list[Trip]:
+    fields = snapshot["trip_fields"]
+    decoders = [_TRIP_DECODERS.get(name) for name in fields]
+    trips: list[Trip] = []
+    for values in snapshot["trips"]:
+        trips.append(
+            Trip(
+                **{
+                    name: decode(value) if decode is not None and value is not None else value
+                    for name, decode, value in zip(fields, decoders, values, strict=True)
+                }
+            )
+        )
+    return trips
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Decimal | date):
+        return str(value)
+    return value
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.invoice import Invoice
+from src.models.trip import Trip
+
+
+@dataclass(slots=True)
+class InvoiceTripBackfillReport:
+    invoices_scanned: int = 0
+    invoices_linked: int = 0
+    trips_linked: int = 0
+    last_invoice_id: int = 0
+
+
+async def backfill_invoice_trip_links(
+    session: AsyncSession,
+    batch_size: int = 100,
+    after_invoice_id: int = 0,
+) -> InvoiceTripBackfillReport:
+    report = InvoiceTripBackfillReport(last_invoice_id=after_invoice_id)
+    has_linked_trips = exists().where(Trip.invoice_id == Invoice.id)
+    while True:
+        result = await session.execute(
+            select(
+                Invoice.id,
+                Invoice.transport_company_id,
+                Invoice.company_id,
+                Invoice.start_date,
+                Invoice.end_date,
+            )
+            .where(Invoice.id > report.last_invoice_id)
+            .where(~has_linked_trips)
+            .order_by(Invoice.id.asc())
+            .limit(batch_size)
+        )
+        invoices = result.all()
+        if not invoices:
+            break
+
+        for invoice_id, transport_company_id, company_id, start_date, end_date in invoices:
+            linked = await session.execute(
+                update(Trip)
+                .where(Trip.transport_company_id == transport_company_id)
+                .where(Trip.company_id == company_id)
+                .where(Trip.paid.is_(True))
+                .where(Trip.invoice_id.is_(None))
+                .where(Trip.date >= start_date)
+                .where(Trip.date <= end_date)
+                .values(invoice_id=invoice_id)
+                .execution_options(synchronize_session=False)
+            )
+            report.invoices_scanned += 1
+            if linked.rowcount:
+                report.invoices_linked += 1
+                report.trips_linked += linked.rowcount
+        # Commit per batch so an interrupted run resumes from the last committed invoice id.
+        await session.commit()
+        report.last_invoice_id = invoices[-1].id
+    return report
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import Settings
+from src.core.exceptions import AppException
+from src.core.logging import logger
+from src.handlers.invoice import InvoiceHandler
+from src.handlers.pdf_render_job import PdfRenderJobHandler
+from src.models.pdf_render_job import PdfRenderJob
+from src.services.invoice_pdf import InvoicePDFService
+from src.services.invoice_pdf_renderer import InvoicePDFJob, InvoicePDFRenderer
+
+invoice_handler = InvoiceHandler()
+job_handler = PdfRenderJobHandler()
+
+
+class PdfRenderWorker:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        renderer: InvoicePDFRenderer,
+        *,
+        concurrency: int,
+        poll_interval_seconds: float,
+        stale_after_seconds: float,
+        max_attempts: int,
+        legacy_trip_fallback: bool = True,
+    ) -> None:
+        self._session_factory = session_factory
+        self._renderer = renderer
+        self._concurrency = concurrency
+        self._poll_interval_seconds = poll_interval_seconds
+        self._stale_after = timedelta(seconds=stale_after_seconds)
+        self._max_attempts = max_attempts
+        self._legacy_trip_fallback = legacy_trip_fallback
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        session_factory: async_sessionmaker[AsyncSession],
+        renderer: InvoicePDFRenderer,
+    ) -> PdfRenderWorker:
+        return cls(
+            session_factory,
+            renderer,
+            concurrency=settings.pdf_job_worker_concurrency,
+            poll_interval_seconds=settings.pdf_job_poll_interval_seconds,
+            stale_after_seconds=settings.pdf_job_stale_after_seconds,
+            max_attempts=settings.pdf_job_max_attempts,
+            legacy_trip_fallback=settings.invoice_legacy_trip_fallback_enabled,
+        )
+
+    async def run_once(self) -> int:
+        async with self._session_factory() as session:
+            await job_handler.requeue_stale_jobs(session, self._stale_after, self._max_attempts)
+        results = await asyncio.gather(*(self._process_next() for _ in range(self._concurrency)))
+        return sum(results)
+
+    async def run_forever(self, stop_event: asyncio.Event) -> None:
+        logger.info("pdf_render_worker_started concurrency=%s", self._concurrency)
+        while not stop_event.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:
+                logger.exception("pdf_render_worker_poll_failed")
+                processed = 0
+            if processed:
+                continue
+            try:
+                await asyncio.wait_for(stop_event.wait(), self._poll_interval_seconds)
+            except TimeoutError:
+                pass
+        logger.info("pdf_render_worker_stopped")
+
+    async def _process_next(self) -> int:
+        processed = 0
+        while True:
+            async with self._session_factory() as session:
+                job = await job_handler.claim_next_job(session)
+                if job is None or not await self._process(session, job):
+                    return processed
+            processed += 1
+
+    async def _process(self, session: AsyncSession, job: PdfRenderJob) -> bool:
+        # A rollback expires the job, and reloading it lazily is not possible in an async session.
+        job_id, attempt = job.id, job.attempts
+        try:
+            bundle = await invoice_handler.get_invoice_bundle(
+                session,
+                job.transport_company_id,
+                job.invoice_id,
+                legacy_trip_fallback=self._legacy_trip_fallback,
+            )
+            template_key = InvoicePDFService.resolve_template_key(bundle.invoice, job.template_key)
+            render_job = InvoicePDFJob.from_snapshot(
+                bundle.invoice, bundle.snapshot, template_key, job.group_by
+            )
+            # Do not sit idle in a transaction for the length of the render.
+            await session.commit()
+            pdf_bytes = await self._renderer.render(render_job)
+        except AppException as exc:
+            await session.rollback()
+            if exc.code == "pdf_render_busy":
+                # Only when handed a pool smaller than its concurrency; try again later.
+                await job_handler.release_job(session, job_id, attempt)
+                return False
+            await job_handler.finish_job(session, job_id, attempt, error=exc.message)
+            logger.warning("pdf_render_job_failed job_id=%s error=%s", job_id, exc.message)
+            return True
+        except Exception as exc:
+            await session.rollback()
+            await job_handler.finish_job(session, job_id, attempt, error="PDF rendering failed")
+            logger.exception("pdf_render_job_failed job_id=%s error=%s", job_id, exc)
+            return True
+        if not await job_handler.finish_job(session, job_id, attempt, result=pdf_bytes):
+            logger.warning("pdf_render_job_superseded job_id=%s attempt=%s", job_id, attempt)
+            return True
+        logger.info("pdf_render_job_succeeded job_id=%s bytes=%s", job_id, len(pdf_bytes))
+        return True
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from cryptography.exceptions import InvalidTag
 from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from src.core.signature_crypto import get_signature_crypto
 from src.models.invoice import Invoice
@@ -26,8 +27,10 @@ async def rotate_signature_blobs(session: AsyncSession) -> SignatureRotationRepo
     crypto = get_signature_crypto()
     report = SignatureRotationReport()
 
-    signatory_stmt: Select[tuple[Signatory]] = select(Signatory).where(
-        Signatory._signature_image_data.is_not(None)
+    signatory_stmt: Select[tuple[Signatory]] = (
+        select(Signatory)
+        .options(undefer(Signatory._signature_image_data))
+        .where(Signatory._signature_image_data.is_not(None))
     )
     signatory_result = await session.execute(signatory_stmt)
     for signatory in signatory_result.scalars().all():
@@ -41,8 +44,10 @@ async def rotate_signature_blobs(session: AsyncSession) -> SignatureRotationRepo
             report.signatories_failed += 1
             report.failed_signatory_ids.append(signatory.id)
 
-    invoice_stmt: Select[tuple[Invoice]] = select(Invoice).where(
-        Invoice._signatory_image_data.is_not(None)
+    invoice_stmt: Select[tuple[Invoice]] = (
+        select(Invoice)
+        .options(undefer(Invoice._signatory_image_data))
+        .where(Invoice._signatory_image_data.is_not(None))
     )
     invoice_result = await session.execute(invoice_stmt)
     for invoice in invoice_result.scalars().all():
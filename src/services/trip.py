@@ -1,17 +1,19 @@
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 
 from src.models.trip import Trip
 
 
 class TripService:
     VAT_RATE = Decimal("0.05")
+    CENT = Decimal("0.01")
 
     @classmethod
     def calculate_amounts(
         cls, amount: Decimal, toll_gate: Decimal, trip_category: str = "domestic"
     ) -> tuple[Decimal, Decimal]:
         vat = Decimal("0.00") if trip_category == "international" else amount * cls.VAT_RATE
-        total = amount + vat + toll_gate
+        vat = vat.quantize(cls.CENT, rounding=ROUND_HALF_UP)
+        total = (amount + vat + toll_gate).quantize(cls.CENT, rounding=ROUND_HALF_UP)
         return vat, total
 
     @classmethod
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterator
+from datetime import datetime
+from decimal import Decimal
+from typing import IO, Any
+
+from openpyxl import load_workbook
+
+from src.core.exceptions import AppException
+
+XLSX_CONTENT_TYPES = {
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv", "application/vnd.ms-excel"}
+TRIP_IMPORT_COLUMNS = (
+    "company_id",
+    "date",
+    "freight",
+    "origin",
+    "destination",
+    "destination_company_name",
+    "trip_category",
+    "amount",
+    "toll_gate",
+    "driver",
+    "driver_id",
+    "external_driver_name",
+    "external_driver_mobile",
+)
+
+
+class TripImportService:
+    @classmethod
+    def iter_rows(
+        cls, stream: IO[bytes], filename: str | None, content_type: str | None
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        name = (filename or "").lower()
+        kind = (content_type or "").lower()
+        if name.endswith(".xlsx") or kind in XLSX_CONTENT_TYPES:
+            return cls._iter_xlsx_rows(stream)
+        if name.endswith(".csv") or kind in CSV_CONTENT_TYPES:
+            return cls._iter_csv_rows(stream)
+        raise AppException("Unsupported file format. Please upload a .csv or .xlsx file")
+
+    @classmethod
+    def _iter_csv_rows(cls, stream: IO[bytes]) -> Iterator[tuple[int, dict[str, Any]]]:
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        reader = csv.reader(text)
+        # The file is decoded and parsed lazily, so errors surface while rows are consumed.
+        try:
+            header = cls._normalize_header(next(reader, None))
+            for row_number, values in enumerate(reader, start=2):
+                row = cls._row_values(header, values)
+                if row:
+                    yield row_number, row
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise AppException("Invalid CSV file", status_code=400) from exc
+
+    @classmethod
+    def _iter_xlsx_rows(cls, stream: IO[bytes]) -> Iterator[tuple[int, dict[str, Any]]]:
+        try:
+            wb = load_workbook(filename=stream, read_only=True, data_only=True)
+        except Exception as exc:  # pragma: no cover - openpyxl exception types vary
+            raise AppException("Invalid Excel file", status_code=400) from exc
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = cls._normalize_header(next(rows, None))
+            for row_number, values in enumerate(rows, start=2):
+                row = cls._row_values(header, values)
+                if row:
+                    yield row_number, row
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _normalize_header(values: Any) -> list[str]:
+        if not values:
+            raise AppException("Import file is empty", status_code=400)
+        header = [str(value or "").strip().lower().replace(" ", "_") for value in values]
+        missing = [
+            column
+            for column in ("company_id", "date", "freight", "origin", "destination", "amount")
+            if column not in header
+        ]
+        if missing:
+            raise AppException(f"Import file is missing columns: {missing}", status_code=400)
+        return header
+
+    @staticmethod
+    def _row_values(header: list[str], values: Any) -> dict[str, Any]:
+        row: dict[str, Any] = {}
+        for column, value in zip(header, values, strict=False):
+            if column not in TRIP_IMPORT_COLUMNS or value is None:
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+                if not value:
+                    continue
+            elif isinstance(value, datetime):
+                value = value.date()
+            elif isinstance(value, float):
+                value = Decimal(str(value))
+            row[column] = value
+        return row
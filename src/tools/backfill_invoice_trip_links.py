@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from src.db.session import SessionFactory
+from src.services.invoice_trip_backfill import backfill_invoice_trip_links
+
+
+async def _run(batch_size: int, after_invoice_id: int) -> None:
+    async with SessionFactory() as session:
+        report = await backfill_invoice_trip_links(
+            session, batch_size=batch_size, after_invoice_id=after_invoice_id
+        )
+    print(
+        "invoice trip backfill complete: "
+        f"invoices_scanned={report.invoices_scanned}, "
+        f"invoices_linked={report.invoices_linked}, "
+        f"trips_linked={report.trips_linked}, "
+        f"last_invoice_id={report.last_invoice_id}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Link trips to invoices created before trips.invoice_id existed."
+    )
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--after-invoice-id",
+        type=int,
+        default=0,
+        help="Resume after this invoice id (the last_invoice_id of a previous run).",
+    )
+    args = parser.parse_args()
+    asyncio.run(_run(args.batch_size, args.after_invoice_id))
+
+
+if __name__ == "__main__":
+    main()
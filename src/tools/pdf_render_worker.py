@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+
+from src.core.config import get_settings
+from src.core.logging import configure_logging
+from src.db.session import SessionFactory
+from src.services.invoice_pdf_renderer import InvoicePDFRenderer
+from src.services.pdf_render_worker import PdfRenderWorker
+
+
+async def _run(once: bool) -> None:
+    settings = get_settings()
+    configure_logging(settings.log_level)
+    renderer = InvoicePDFRenderer.for_pdf_jobs(settings)
+    worker = PdfRenderWorker.from_settings(settings, SessionFactory, renderer)
+    try:
+        if once:
+            processed = await worker.run_once()
+            print(f"pdf render worker complete: jobs_processed={processed}")
+            return
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop_event.set)
+        await worker.run_forever(stop_event)
+    finally:
+        renderer.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render queued invoice PDF jobs.")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Drain the queue and exit instead of polling for new jobs.",
+    )
+    args = parser.parse_args()
+    asyncio.run(_run(args.once))
+
+
+if __name__ == "__main__":
+    main()
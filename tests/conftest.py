@@ -8,7 +8,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from src.core.auth import hash_password
 from src.core.config import get_settings
 from src.db.base import Base
-from src.db.session import get_db_session
+from src.db.session import (
+    get_db_session,
+    get_read_db_session,
+    get_read_session_factory,
+    get_session_factory,
+)
 from src.main import create_app
 from src.models.admin_user import AdminUser
 from src.models.transport_company import TransportCompany
@@ -70,6 +75,9 @@ async def app() -> AsyncIterator[FastAPI]:
 
     test_app = create_app()
     test_app.dependency_overrides[get_db_session] = override_session
+    test_app.dependency_overrides[get_read_db_session] = override_session
+    test_app.dependency_overrides[get_session_factory] = lambda: session_factory
+    test_app.dependency_overrides[get_read_session_factory] = lambda: session_factory
 
     yield test_app
 
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.db.db_handler import GenericDBHandler
+from src.models.transport_company import TransportCompany
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    async with session_factory() as db_session:
+        yield db_session
+    await engine.dispose()
+
+
+def _company_row(index: int, name: str) -> dict[str, str]:
+    return {
+        "uuid": f"00000000-0000-0000-0000-{index:012d}",
+        "name": name,
+        "email": f"tc{index}@bulk.local",
+        "location": "Bulk City",
+        "trn": f"TRN{index}",
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_inserts_all_rows_in_chunks(session: AsyncSession) -> None:
+    handler = GenericDBHandler(TransportCompany)
+    rows = [_company_row(index, f"Company {index}") for index in range(1, 8)]
+
+    created = await handler.bulk_create(session, rows, chunk_size=3)
+
+    assert [entity.uuid for entity in created] == [row["uuid"] for row in rows]
+    assert all(entity.id is not None and entity.created_at is not None for entity in created)
+    count = await session.scalar(select(func.count()).select_from(TransportCompany))
+    assert count == 7
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_updates_conflicting_rows(session: AsyncSession) -> None:
+    handler = GenericDBHandler(TransportCompany)
+    await handler.bulk_create(session, [_company_row(1, "Old"), _company_row(2, "Kept")])
+
+    upserted = await handler.bulk_upsert(
+        session,
+        [_company_row(1, "New"), _company_row(3, "Inserted")],
+        conflict_columns=["uuid"],
+        update_columns=["name"],
+        chunk_size=1,
+    )
+
+    assert [entity.name for entity in upserted] == ["New", "Inserted"]
+    names = (
+        await session.scalars(select(TransportCompany.name).order_by(TransportCompany.id))
+    ).all()
+    assert names == ["New", "Kept", "Inserted"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_returns_rows_in_input_order(session: AsyncSession) -> None:
+    handler = GenericDBHandler(TransportCompany)
+    await handler.bulk_create(session, [_company_row(2, "Old")])
+
+    upserted = await handler.bulk_upsert(
+        session,
+        [_company_row(3, "Third"), _company_row(2, "Second"), _company_row(1, "First")],
+        conflict_columns=["uuid"],
+        update_columns=["name"],
+    )
+
+    assert [entity.name for entity in upserted] == ["Third", "Second", "First"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_keeps_the_last_duplicate_conflict_key(session: AsyncSession) -> None:
+    handler = GenericDBHandler(TransportCompany)
+
+    upserted = await handler.bulk_upsert(
+        session,
+        [_company_row(1, "First"), _company_row(2, "Other"), _company_row(1, "Last")],
+        conflict_columns=["uuid"],
+        update_columns=["name"],
+    )
+
+    assert [entity.name for entity in upserted] == ["Last", "Other", "Last"]
+    assert upserted[0] is upserted[2]
+    names = (
+        await session.scalars(select(TransportCompany.name).order_by(TransportCompany.id))
+    ).all()
+    assert names == ["Last", "Other"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_rejects_unsupported_dialects(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(session.get_bind().dialect, "name", "mysql")
+
+    with pytest.raises(ValueError, match="mysql"):
+        await GenericDBHandler(TransportCompany).bulk_upsert(
+            session, [_company_row(1, "X")], conflict_columns=["uuid"]
+        )
@@ -1,5 +1,25 @@
+import importlib
+from pathlib import Path
+
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy.exc import OperationalError
+
+from src.services.invoice_pdf_cache import InvoicePDFCache
+
+# The package re-exports the APIRouter under the module's name.
+health_router = importlib.import_module("src.api.routes.health.router")
+
+
+async def _auth_headers(client: AsyncClient) -> dict[str, str]:
+    token_response = await client.post(
+        "/api/v1/auth/token",
+        json={"username": "admin", "password": "secret"},
+    )
+    token = token_response.cookies.get("access_token")
+    assert token
+    return {"Authorization": f"Bearer {token}"}
 
 
 @pytest.mark.asyncio
@@ -7,3 +27,44 @@ async def test_health(client: AsyncClient) -> None:
     response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_replica_health_reports_disabled_without_read_url(client: AsyncClient) -> None:
+    anonymous = await client.get("/health/replica")
+    assert anonymous.status_code == 401
+
+    response = await client.get("/health/replica", headers=await _auth_headers(client))
+    assert response.status_code == 200
+    assert response.json() == {"status": "disabled", "lag_seconds": None}
+
+
+@pytest.mark.asyncio
+async def test_replica_health_reports_unreachable_replica(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _unreachable(_engine: object) -> float | None:
+        raise OperationalError("SELECT 1", {}, ConnectionRefusedError("connection refused"))
+
+    monkeypatch.setattr(health_router, "read_engine", object())
+    monkeypatch.setattr(health_router, "measure_replica_lag", _unreachable)
+
+    response = await client.get("/health/replica", headers=await _auth_headers(client))
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable", "lag_seconds": None}
+
+
+@pytest.mark.asyncio
+async def test_pdf_cache_health_requires_an_admin(
+    client: AsyncClient, app: FastAPI, tmp_path: Path
+) -> None:
+    cache = InvoicePDFCache(tmp_path, max_bytes=1024)
+    cache.put(1, "a", b"%PDF-1")
+    app.state.invoice_pdf_cache = cache
+
+    anonymous = await client.get("/health/pdf-cache")
+    assert anonymous.status_code == 401
+
+    response = await client.get("/health/pdf-cache", headers=await _auth_headers(client))
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "hits": 0, "misses": 0, "entries": 1, "bytes": 6}
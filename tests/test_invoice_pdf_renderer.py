@@ -0,0 +1,126 @@
+import asyncio
+import threading
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+
+from src.core.exceptions import AppException
+from src.models.company import Company
+from src.models.invoice import Invoice
+from src.models.trip import Trip
+from src.services import invoice_pdf_renderer
+from src.services.invoice_pdf_renderer import InvoicePDFJob, InvoicePDFRenderer
+from src.services.invoice_snapshot import build_invoice_snapshot
+
+
+def _job() -> InvoicePDFJob:
+    company = Company(
+        name="Render Co",
+        address="Dubai",
+        email="ops@render.example.com",
+        phone="+971551234567",
+        trn="100000000000006",
+        contact_person="Mohammed",
+        po_box="100",
+    )
+    invoice = Invoice(
+        id=9,
+        company_id=1,
+        start_date=date(2026, 2, 1),
+        end_date=date(2026, 2, 28),
+        due_date=date(2026, 3, 15),
+        format_key="template_a",
+        total_amount=Decimal("105.00"),
+        generated_at=datetime(2026, 2, 28, tzinfo=UTC),
+    )
+    trip = Trip(
+        id=1,
+        company_id=1,
+        date=date(2026, 2, 1),
+        freight="1 Ton",
+        origin="Dubai",
+        destination="Sharjah",
+        amount=Decimal("100.00"),
+        vat=Decimal("5.00"),
+        toll_gate=Decimal("0.00"),
+        total_amount=Decimal("105.00"),
+        driver="Driver 1",
+    )
+    snapshot = build_invoice_snapshot(company, "100000000000099", [trip])
+    return InvoicePDFJob.from_snapshot(invoice, snapshot, "template_a")
+
+
+def test_job_leaves_deferred_blobs_except_the_signature_behind() -> None:
+    job = _job()
+    invoice = Invoice(**job.invoice, line_snapshot=job.snapshot)
+    invoice._signatory_image_data = b"stored-signature"
+
+    payload = InvoicePDFJob.from_snapshot(invoice, job.snapshot, "template_a").invoice
+
+    assert "line_snapshot" not in payload
+    assert payload["_signatory_image_data"] == b"stored-signature"
+
+
+@pytest.mark.asyncio
+async def test_renderer_builds_pdf_in_worker_process() -> None:
+    renderer = InvoicePDFRenderer(max_workers=1, max_pending=2, timeout_seconds=60)
+    try:
+        payload = await renderer.render(_job())
+    finally:
+        renderer.shutdown()
+    assert payload.startswith(b"%PDF")
+    assert renderer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_renderer_rejects_when_queue_is_full_and_times_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+
+    def _blocked_render(_job: InvoicePDFJob) -> bytes:
+        release.wait(5)
+        return b"%PDF-SLOW"
+
+    monkeypatch.setattr(invoice_pdf_renderer, "render_invoice_pdf", _blocked_render)
+    renderer = InvoicePDFRenderer(max_workers=0, max_pending=1, timeout_seconds=0.05)
+    try:
+        with pytest.raises(AppException) as timed_out:
+            await renderer.render(_job())
+        assert timed_out.value.status_code == 504
+        assert renderer.pending == 1
+
+        with pytest.raises(AppException) as busy:
+            await renderer.render(_job())
+        assert busy.value.status_code == 503
+    finally:
+        release.set()
+        renderer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_renderer_can_wait_for_a_free_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    def _blocked_render(_job: InvoicePDFJob) -> bytes:
+        release.wait(5)
+        return b"%PDF-SLOW"
+
+    monkeypatch.setattr(invoice_pdf_renderer, "render_invoice_pdf", _blocked_render)
+    renderer = InvoicePDFRenderer(max_workers=0, max_pending=1, timeout_seconds=5)
+    try:
+        first = asyncio.create_task(renderer.render(_job()))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(renderer.render(_job(), wait_for_slot=True))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        assert renderer.pending == 1
+
+        release.set()
+        assert await first == b"%PDF-SLOW"
+        assert await waiting == b"%PDF-SLOW"
+        assert renderer.pending == 0
+    finally:
+        release.set()
+        renderer.shutdown()
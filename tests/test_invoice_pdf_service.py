@@ -1,6 +1,9 @@
+import os
+import shutil
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from io import BytesIO
+from pathlib import Path
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -9,7 +12,20 @@ from src.core.exceptions import AppException
 from src.models.company import Company
 from src.models.invoice import Invoice
 from src.models.trip import Trip
-from src.services.invoice_pdf import InvoicePDFService
+from src.services import invoice_pdf
+from src.services.invoice_pdf import BRAND_HEADER_DIR, TEMPLATE_C, InvoicePDFService
+from src.services.invoice_pdf_layout import HEADER_FORM, compile_table
+
+
+class _FakePath:
+    def rect(self, *_args: object, **_kwargs: object) -> None:
+        return None
+
+    def moveTo(self, *_args: object) -> None:
+        return None
+
+    def lineTo(self, *_args: object) -> None:
+        return None
 
 
 class _FakeCanvas:
@@ -44,10 +60,99 @@ class _FakeCanvas:
     def setLineWidth(self, *_args: object, **_kwargs: object) -> None:
         return None
 
+    def beginPath(self) -> _FakePath:
+        return _FakePath()
+
+    def drawPath(self, *_args: object, **_kwargs: object) -> None:
+        return None
+
+    def beginForm(self, *_args: object, **_kwargs: object) -> None:
+        return None
+
+    def endForm(self) -> None:
+        return None
+
+    def doForm(self, *_args: object) -> None:
+        return None
+
+    def saveState(self) -> None:
+        return None
+
+    def restoreState(self) -> None:
+        return None
+
+    def translate(self, *_args: object) -> None:
+        return None
+
     def save(self) -> None:
         self._buffer.write(b"%PDF-FAKE")
 
 
+class _RecordingCanvas(_FakeCanvas):
+    def __init__(self, buffer: BytesIO, pagesize: tuple[float, float]) -> None:
+        super().__init__(buffer, pagesize)
+        self.pages = 1
+        self.header_pages: list[int] = []
+        self.cells: list[str] = []
+
+    def drawString(self, *args: object, **_kwargs: object) -> None:
+        self.cells.append(str(args[2]))
+
+    def drawCentredString(self, *args: object, **_kwargs: object) -> None:
+        self.cells.append(str(args[2]))
+
+    def drawRightString(self, *args: object, **_kwargs: object) -> None:
+        self.cells.append(str(args[2]))
+
+    def showPage(self) -> None:
+        self.pages += 1
+
+    def doForm(self, *args: object) -> None:
+        if args[0] == HEADER_FORM:
+            self.header_pages.append(self.pages)
+
+
+def _record_canvas(monkeypatch: MonkeyPatch) -> list[_RecordingCanvas]:
+    canvases: list[_RecordingCanvas] = []
+
+    def _canvas(buffer: BytesIO, pagesize: tuple[float, float]) -> _RecordingCanvas:
+        canvases.append(_RecordingCanvas(buffer, pagesize))
+        return canvases[-1]
+
+    monkeypatch.setattr(
+        InvoicePDFService,
+        "_reportlab_modules",
+        classmethod(
+            lambda cls: {
+                "A4": (595.0, 842.0),
+                "mm": 2.834,
+                "canvas": type("C", (), {"Canvas": staticmethod(_canvas)}),
+            },
+        ),
+    )
+    return canvases
+
+
+def _many_trips(count: int) -> list[Trip]:
+    return [
+        Trip(
+            id=index,
+            company_id=1,
+            date=date(2026, 2, 1 + index % 3),
+            freight="1 Ton",
+            origin="Dubai",
+            destination="Sharjah" if index % 2 else "Ajman",
+            destination_company_name=f"Site {index % 2}",
+            amount=Decimal("100.00"),
+            vat=Decimal("5.00"),
+            toll_gate=Decimal("1.00"),
+            total_amount=Decimal("106.00"),
+            driver="Driver 1",
+        )
+        for index in range(1, count + 1)
+    ]
+
+
 @pytest.fixture
 def invoice_fixture_data() -> tuple[Invoice, Company, list[Trip]]:
     company = Company(
@@ -163,3 +268,155 @@ def test_generate_pdf_rejects_unknown_template(
 
     with pytest.raises(AppException):
         InvoicePDFService.generate_pdf(invoice, company, trips, "unknown_template")
+
+
+def test_brand_header_asset_is_decoded_once_per_mtime(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    shutil.copy(
+        invoice_pdf.BRAND_HEADER_DIR / "Sikar_cargo_transport_logo.png",
+        tmp_path / "Sikar_cargo_transport_logo.png",
+    )
+    monkeypatch.setattr(invoice_pdf, "BRAND_HEADER_DIR", tmp_path)
+    monkeypatch.setattr(invoice_pdf, "_brand_header_cache", {})
+    invoice_pdf._find_brand_header.cache_clear()
+    loads: list[Path] = []
+    original = InvoicePDFService._load_brand_header
+
+    def _counting_load(header_asset: Path, target_width: float) -> object:
+        loads.append(header_asset)
+        return original(header_asset, target_width)
+
+    monkeypatch.setattr(InvoicePDFService, "_load_brand_header", staticmethod(_counting_load))
+    try:
+        first = InvoicePDFService._brand_header_asset(500.0)
+        for _ in range(40):
+            assert InvoicePDFService._brand_header_asset(500.0) is first
+        assert first is not None and first.image is not None
+        assert len(loads) == 1
+
+        os.utime(tmp_path / "Sikar_cargo_transport_logo.png", (1, 1))
+        assert InvoicePDFService._brand_header_asset(500.0) is not first
+        assert len(loads) == 2
+    finally:
+        invoice_pdf._find_brand_header.cache_clear()
+
+
+def test_missing_brand_header_is_probed_again_once_added(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(invoice_pdf, "BRAND_HEADER_DIR", tmp_path)
+    monkeypatch.setattr(invoice_pdf, "_brand_header_cache", {})
+    try:
+        assert InvoicePDFService._brand_header_asset(500.0) is None
+
+        shutil.copy(
+            BRAND_HEADER_DIR / "Sikar_cargo_transport_logo.png",
+            tmp_path / "Sikar_cargo_transport_logo.png",
+        )
+        os.utime(tmp_path, ns=(1, 1))
+        asset = InvoicePDFService._brand_header_asset(500.0)
+        assert asset is not None and asset.image is not None
+    finally:
+        invoice_pdf._find_brand_header.cache_clear()
+
+
+def test_template_c_shares_page_chrome_forms_across_pages(
+    invoice_fixture_data: tuple[Invoice, Company, list[Trip]],
+) -> None:
+    invoice, company, trips = invoice_fixture_data
+    many_trips = [
+        Trip(
+            id=index,
+            company_id=1,
+            date=date(2026, 2, 1),
+            freight="1 Ton",
+            origin="Dubai",
+            destination="Sharjah",
+            amount=Decimal("100.00"),
+            vat=Decimal("5.00"),
+            toll_gate=Decimal("0.00"),
+            total_amount=Decimal("105.00"),
+            driver="Driver 1",
+        )
+        for index in range(1, 61)
+    ]
+
+    payload = InvoicePDFService.generate_pdf(
+        invoice, company, many_trips, "template_c", "100000000000099"
+    )
+
+    assert payload.count(b"/Type /Page\n") == 3
+    assert payload.count(b"/Subtype /Form") == 3
+
+
+def test_compiled_template_fits_cells_to_column_width() -> None:
+    from reportlab.lib.units import mm
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    table = compile_table(TEMPLATE_C.table, mm)
+    assert compile_table(TEMPLATE_C.table, mm) is table
+    description = table.columns[2]
+    max_width = (62 - 2 * 1.4) * mm
+    row = {"destination_company": "Warehouse " * 20, "destination": "Sharjah"}
+
+    text = description.text(row)
+    assert text.startswith("Warehouse Warehouse")
+    assert stringWidth(text, "Helvetica", 7) <= max_width
+    assert stringWidth(text + "W", "Helvetica", 7) > max_width
+    assert description.text({"destination_company": "Site 1", "destination": "Ajman"}) == (
+        "Site 1 (Ajman)"
+    )
+
+
+@pytest.mark.parametrize("template_key", ["template_a", "template_b", "template_c"])
+def test_every_template_repeats_column_headers_on_each_page(
+    monkeypatch: MonkeyPatch,
+    invoice_fixture_data: tuple[Invoice, Company, list[Trip]],
+    template_key: str,
+) -> None:
+    invoice, company, _ = invoice_fixture_data
+    canvases = _record_canvas(monkeypatch)
+
+    InvoicePDFService.generate_pdf(invoice, company, _many_trips(150), template_key)
+
+    canvas = canvases[0]
+    assert canvas.pages >= 3
+    assert canvas.header_pages == list(range(1, canvas.pages + 1))
+    assert any(cell.endswith("15900.00") for cell in canvas.cells)
+
+
+def test_summary_mode_groups_trips_with_matching_totals(
+    monkeypatch: MonkeyPatch,
+    invoice_fixture_data: tuple[Invoice, Company, list[Trip]],
+) -> None:
+    invoice, company, _ = invoice_fixture_data
+    canvases = _record_canvas(monkeypatch)
+    trips = _many_trips(300)
+
+    InvoicePDFService.generate_pdf(invoice, company, trips, "template_a", "", "date")
+    InvoicePDFService.generate_pdf(invoice, company, trips, "template_b", "", "destination")
+
+    by_date, by_destination = canvases
+    assert by_date.pages == 1
+    assert by_date.cells[by_date.cells.index("01-Feb-2026") :][:6] == [
+        "01-Feb-2026",
+        "100",
+        "10000.00",
+        "500.00",
+        "100.00",
+        "10600.00",
+    ]
+    assert "30000.00" in by_date.cells and "31800.00" in by_date.cells
+    assert "Site 0 (Ajman)" in by_destination.cells
+    assert "Site 1 (Sharjah)" in by_destination.cells
+    assert "31800.00" in by_destination.cells
+
+
+def test_generate_pdf_rejects_unknown_grouping(
+    invoice_fixture_data: tuple[Invoice, Company, list[Trip]],
+) -> None:
+    invoice, company, trips = invoice_fixture_data
+
+    with pytest.raises(AppException):
+        InvoicePDFService.generate_pdf(invoice, company, trips, "template_a", "", "week")
@@ -0,0 +1,114 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.handlers.invoice import InvoiceHandler
+from src.models.company import Company
+from src.models.invoice import Invoice
+from src.models.transport_company import TransportCompany
+from src.models.trip import Trip
+from src.services.invoice_snapshot import snapshot_trips
+from src.services.invoice_trip_backfill import backfill_invoice_trip_links
+
+
+@pytest.fixture
+async def session_factory() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+
+def _trip(tenant_id: int, company_id: int, trip_date: date, paid: bool) -> Trip:
+    return Trip(
+        company_id=company_id,
+        transport_company_id=tenant_id,
+        date=trip_date,
+        freight="1 Ton",
+        origin="A",
+        destination="B",
+        amount=Decimal("100.00"),
+        vat=Decimal("5.00"),
+        toll_gate=Decimal("0.00"),
+        total_amount=Decimal("105.00"),
+        driver="Driver",
+        paid=paid,
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_links_legacy_invoices_and_is_resumable(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        tenant = TransportCompany(
+            uuid="00000000-0000-0000-0000-000000000088",
+            name="Legacy Co",
+            email="legacy@co.local",
+            location="Old Town",
+            trn="TRN-LEGACY-01",
+        )
+        session.add(tenant)
+        await session.flush()
+        company = Company(
+            transport_company_id=tenant.id,
+            name="Customer",
+            address="Road",
+            email="customer@legacy.local",
+            phone="555",
+            trn="100000000000088",
+            contact_person="Lee",
+            po_box="88",
+        )
+        session.add(company)
+        await session.flush()
+        invoices = [
+            Invoice(
+                company_id=company.id,
+                transport_company_id=tenant.id,
+                start_date=date(2026, month, 1),
+                end_date=date(2026, month, 28),
+                due_date=date(2026, month + 1, 28),
+                total_amount=Decimal("105.00"),
+                generated_at=datetime(2026, month + 1, 1, tzinfo=UTC),
+            )
+            for month in (1, 2)
+        ]
+        session.add_all(invoices)
+        session.add_all(
+            [
+                _trip(tenant.id, company.id, date(2026, 1, 5), paid=True),
+                _trip(tenant.id, company.id, date(2026, 2, 5), paid=True),
+                _trip(tenant.id, company.id, date(2026, 2, 6), paid=False),
+            ]
+        )
+        await session.commit()
+        tenant_id, first_id, second_id = tenant.id, invoices[0].id, invoices[1].id
+
+    async with session_factory() as session:
+        report = await backfill_invoice_trip_links(session, batch_size=1)
+    assert (report.invoices_scanned, report.invoices_linked, report.trips_linked) == (2, 2, 2)
+    assert report.last_invoice_id == second_id
+
+    async with session_factory() as session:
+        linked = await session.execute(select(Trip.date, Trip.invoice_id).order_by(Trip.date))
+        assert linked.all() == [
+            (date(2026, 1, 5), first_id),
+            (date(2026, 2, 5), second_id),
+            (date(2026, 2, 6), None),
+        ]
+        rerun = await backfill_invoice_trip_links(session)
+    assert rerun.invoices_scanned == 0
+
+    async with session_factory() as session:
+        bundle = await InvoiceHandler().get_invoice_bundle(
+            session, tenant_id, first_id, legacy_trip_fallback=False
+        )
+    assert bundle.snapshot["transport_company_trn"] == "TRN-LEGACY-01"
+    assert [trip.date for trip in snapshot_trips(bundle.snapshot)] == [date(2026, 1, 5)]
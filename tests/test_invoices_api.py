@@ -1,9 +1,36 @@
+import json
+import logging
+import os
+import time
+import zipfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.exceptions import AppException
+from src.db.session import get_db_session
+from src.handlers.invoice import InvoiceHandler
+from src.handlers.pdf_render_job import PdfRenderJobHandler
+from src.models.invoice import Invoice
+from src.models.pdf_render_job import PdfRenderJob
 from src.models.signatory import Signatory
+from src.models.trip import Trip
+from src.services import invoice_pdf_renderer
 from src.services.invoice_pdf import InvoicePDFService
+from src.services.invoice_pdf_cache import InvoicePDFCache
+from src.services.invoice_pdf_renderer import InvoicePDFJob, InvoicePDFRenderer
+from src.services.invoice_snapshot import snapshot_company, snapshot_hash, snapshot_trips
+from src.services.pdf_render_worker import PdfRenderWorker
 
 
 async def _auth_headers(
@@ -157,13 +184,32 @@ async def test_download_invoice_pdf_route(
     )
     invoice_id = created.json()["id"]
 
-    monkeypatch.setattr(InvoicePDFService, "generate_pdf", lambda *_args, **_kwargs: b"%PDF-FAKE")
+    app.state.invoice_pdf_renderer = InvoicePDFRenderer(
+        max_workers=0, max_pending=1, timeout_seconds=5
+    )
+    groupings: list[object] = []
+
+    def _fake_generate_pdf(*args: object) -> bytes:
+        groupings.append(args[5])
+        return b"%PDF-FAKE"
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", _fake_generate_pdf)
 
     download = await client.get(f"/api/v1/invoices/{invoice_id}/pdf", headers=headers)
     assert download.status_code == 200
     assert download.headers["content-type"] == "application/pdf"
     assert download.content.startswith(b"%PDF")
 
+    summary = await client.get(
+        f"/api/v1/invoices/{invoice_id}/pdf", params={"group_by": "date"}, headers=headers
+    )
+    assert summary.status_code == 200
+    assert groupings == [None, "date"]
+    invalid = await client.get(
+        f"/api/v1/invoices/{invoice_id}/pdf", params={"group_by": "week"}, headers=headers
+    )
+    assert invalid.status_code == 422
+
 
 @pytest.mark.asyncio
 async def test_create_invoice_accepts_custom_invoice_number(client: AsyncClient) -> None:
@@ -414,3 +460,993 @@ async def test_update_signatory_returns_404_when_missing(client: AsyncClient) ->
         headers=headers,
     )
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_invoice_list_pagination_and_status_summary(client: AsyncClient) -> None:
+    headers = await _auth_headers(client)
+    company_ids: list[int] = []
+    for index in range(2):
+        company = await client.post(
+            "/api/v1/companies",
+            json={
+                "name": f"Summary {index}",
+                "address": "Road 4",
+                "email": f"ops{index}@summary.example.com",
+                "phone": "555",
+                "trn": f"10000000000004{index}",
+                "contact_person": "Sue",
+                "po_box": "44",
+            },
+            headers=headers,
+        )
+        company_ids.append(company.json()["id"])
+
+    invoice_ids: list[int] = []
+    for company_id, due_date, amount in [
+        (company_ids[0], "2020-01-31", "100.00"),
+        (company_ids[0], "2099-01-31", "200.00"),
+        (company_ids[1], "2099-01-31", "300.00"),
+    ]:
+        trip = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company_id,
+                "date": "2026-02-05",
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": amount,
+                "toll_gate": "0.00",
+                "driver": "Driver",
+            },
+            headers=headers,
+        )
+        invoice = await client.post(
+            "/api/v1/invoices",
+            json={"company_id": company_id, "due_date": due_date, "trip_ids": [trip.json()["id"]]},
+            headers=headers,
+        )
+        assert invoice.status_code == 201
+        invoice_ids.append(invoice.json()["id"])
+    paid = await client.patch(
+        f"/api/v1/invoices/{invoice_ids[2]}/mark-paid", json={}, headers=headers
+    )
+    assert paid.status_code == 200
+
+    first_page = await client.get("/api/v1/invoices", params={"limit": 2}, headers=headers)
+    cursor = first_page.headers.get("X-Next-Cursor")
+    assert cursor
+    second_page = await client.get(
+        "/api/v1/invoices", params={"limit": 2, "cursor": cursor}, headers=headers
+    )
+    assert "X-Next-Cursor" not in second_page.headers
+    listed = [item["id"] for item in first_page.json() + second_page.json()]
+    assert sorted(listed) == sorted(invoice_ids)
+
+    summary = await client.get("/api/v1/invoices/summary", headers=headers)
+    assert summary.status_code == 200
+    assert summary.json() == [
+        {
+            "company_id": None,
+            "paid": {"count": 1, "total_amount": "315.00"},
+            "unpaid": {"count": 1, "total_amount": "210.00"},
+            "overdue": {"count": 1, "total_amount": "105.00"},
+        }
+    ]
+
+    grouped = await client.get(
+        "/api/v1/invoices/summary", params={"group_by": "company_id"}, headers=headers
+    )
+    assert [
+        (row["company_id"], row["overdue"]["count"], row["paid"]["count"]) for row in grouped.json()
+    ] == [
+        (company_ids[0], 1, 0),
+        (company_ids[1], 0, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_invoices_batch_for_period(client: AsyncClient, app: FastAPI) -> None:
+    headers = await _auth_headers(client)
+    company_ids: list[int] = []
+    for index in range(3):
+        company = await client.post(
+            "/api/v1/companies",
+            json={
+                "name": f"Batch {index}",
+                "address": "Road 9",
+                "email": f"ops{index}@batch.example.com",
+                "phone": "555",
+                "trn": f"10000000000009{index}",
+                "contact_person": "Lee",
+                "po_box": "99",
+            },
+            headers=headers,
+        )
+        company_ids.append(company.json()["id"])
+
+    for company_id, trip_date, amount in [
+        (company_ids[0], "2026-02-05", "100.00"),
+        (company_ids[0], "2026-02-06", "50.00"),
+        (company_ids[1], "2026-02-07", "200.00"),
+        (company_ids[1], "2026-03-01", "400.00"),
+        (company_ids[2], "2026-02-08", "300.00"),
+    ]:
+        trip = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company_id,
+                "date": trip_date,
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": amount,
+                "toll_gate": "0.00",
+                "driver": "Driver",
+            },
+            headers=headers,
+        )
+        assert trip.status_code == 201
+
+    response = await client.post(
+        "/api/v1/invoices/batch",
+        json={
+            "start_date": "2026-02-01",
+            "end_date": "2026-02-28",
+            "company_ids": company_ids[:2],
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    invoices = response.json()
+    assert [(item["company_id"], item["total_amount"]) for item in invoices] == [
+        (company_ids[0], "157.50"),
+        (company_ids[1], "210.00"),
+    ]
+
+    trips = (await client.get("/api/v1/trips", headers=headers)).json()
+    invoice_by_company = {item["company_id"]: item["id"] for item in invoices}
+    for trip in trips:
+        in_batch = trip["company_id"] in invoice_by_company and trip["date"] < "2026-03-01"
+        assert trip["paid"] is in_batch
+        assert trip["invoice_id"] == (invoice_by_company[trip["company_id"]] if in_batch else None)
+
+    companies = {
+        item["id"]: item for item in (await client.get("/api/v1/companies", headers=headers)).json()
+    }
+    assert (
+        companies[company_ids[0]]["paid_amount"],
+        companies[company_ids[0]]["unpaid_amount"],
+    ) == (
+        "157.50",
+        "0.00",
+    )
+    assert (
+        companies[company_ids[1]]["paid_amount"],
+        companies[company_ids[1]]["unpaid_amount"],
+    ) == (
+        "210.00",
+        "420.00",
+    )
+    assert companies[company_ids[2]]["unpaid_amount"] == "315.00"
+
+    async with asynccontextmanager(app.dependency_overrides[get_db_session])() as session:
+        snapshot, stored_hash = (
+            await session.execute(
+                select(Invoice.line_snapshot, Invoice.line_snapshot_hash).where(
+                    Invoice.id == invoice_by_company[company_ids[0]]
+                )
+            )
+        ).one()
+    assert snapshot is not None
+    assert stored_hash == snapshot_hash(snapshot)
+    assert snapshot_company(snapshot).name == "Batch 0"
+    assert [
+        (trip.date, trip.amount, trip.vat, trip.toll_gate, trip.total_amount)
+        for trip in snapshot_trips(snapshot)
+    ] == [
+        (date(2026, 2, 5), Decimal("100.00"), Decimal("5.00"), Decimal("0.00"), Decimal("105.00")),
+        (date(2026, 2, 6), Decimal("50.00"), Decimal("2.50"), Decimal("0.00"), Decimal("52.50")),
+    ]
+
+    again = await client.post(
+        "/api/v1/invoices/batch",
+        json={"start_date": "2026-02-01", "end_date": "2026-02-28", "company_ids": company_ids[:2]},
+        headers=headers,
+    )
+    assert again.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_create_invoice_aborts_when_trips_were_claimed_concurrently(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    headers = await _auth_headers(client)
+    company = await client.post(
+        "/api/v1/companies",
+        json={
+            "name": "Race",
+            "address": "Road 8",
+            "email": "ops@race.example.com",
+            "phone": "555",
+            "trn": "100000000000088",
+            "contact_person": "Max",
+            "po_box": "88",
+        },
+        headers=headers,
+    )
+    company_id = company.json()["id"]
+    trip_ids: list[int] = []
+    for amount in ("100.00", "200.00"):
+        trip = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company_id,
+                "date": "2026-02-05",
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": amount,
+                "toll_gate": "0.00",
+                "driver": "Driver",
+            },
+            headers=headers,
+        )
+        trip_ids.append(trip.json()["id"])
+
+    original = InvoiceHandler._specific_unpaid_trips
+
+    async def _claimed_after_read(self: InvoiceHandler, **kwargs: Any) -> list[Trip]:
+        trips = await original(self, **kwargs)
+        await kwargs["session"].execute(
+            update(Trip).where(Trip.id == trip_ids[0]).values(paid=True)
+        )
+        return trips
+
+    monkeypatch.setattr(InvoiceHandler, "_specific_unpaid_trips", _claimed_after_read)
+    response = await client.post(
+        "/api/v1/invoices",
+        json={"company_id": company_id, "trip_ids": trip_ids},
+        headers=headers,
+    )
+    assert response.status_code == 409
+
+    assert (await client.get("/api/v1/invoices", headers=headers)).json() == []
+    trips = (await client.get("/api/v1/trips", headers=headers)).json()
+    assert [(trip["paid"], trip["invoice_id"]) for trip in trips] == [(False, None), (False, None)]
+    companies = (await client.get("/api/v1/companies", headers=headers)).json()
+    assert (companies[0]["paid_amount"], companies[0]["unpaid_amount"]) == ("0.00", "315.00")
+
+
+@pytest.mark.asyncio
+async def test_download_invoice_pdf_uses_disk_cache(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient, app: FastAPI, tmp_path: Path
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    cache = InvoicePDFCache(tmp_path, max_bytes=1024)
+    app.state.invoice_pdf_cache = cache
+    app.state.invoice_pdf_renderer = InvoicePDFRenderer(
+        max_workers=0, max_pending=1, timeout_seconds=5
+    )
+    headers = await _auth_headers(client)
+    company = await client.post(
+        "/api/v1/companies",
+        json={
+            "name": "Cache",
+            "address": "Road 7",
+            "email": "ops@cache.example.com",
+            "phone": "555",
+            "trn": "100000000000077",
+            "contact_person": "Ivy",
+            "po_box": "77",
+        },
+        headers=headers,
+    )
+    trip = await client.post(
+        "/api/v1/trips",
+        json={
+            "company_id": company.json()["id"],
+            "date": "2026-02-10",
+            "freight": "1 Ton",
+            "origin": "X",
+            "destination": "Y",
+            "amount": "50.00",
+            "toll_gate": "0.00",
+            "driver": "Driver",
+        },
+        headers=headers,
+    )
+    created = await client.post(
+        "/api/v1/invoices",
+        json={"company_id": company.json()["id"], "trip_ids": [trip.json()["id"]]},
+        headers=headers,
+    )
+    invoice_id = created.json()["id"]
+    renders: list[str] = []
+
+    def _render(*args: Any, **_kwargs: Any) -> bytes:
+        renders.append(args[2][0].destination)
+        return b"%PDF-" + args[2][0].destination.encode()
+
+    decoded: list[int] = []
+
+    def _snapshot_trips(snapshot: dict[str, Any]) -> list[Trip]:
+        decoded.append(len(snapshot["trips"]))
+        return snapshot_trips(snapshot)
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", _render)
+    monkeypatch.setattr(invoice_pdf_renderer, "snapshot_trips", _snapshot_trips)
+    url = f"/api/v1/invoices/{invoice_id}/pdf"
+
+    first = await client.get(url, headers=headers)
+    second = await client.get(url, headers=headers)
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content == b"%PDF-Y"
+    etag = first.headers["etag"]
+    assert second.headers["etag"] == etag
+    assert renders == ["Y"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    not_modified = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    # The invoice renders from its line snapshot, so editing the trip leaves the PDF as issued.
+    await client.patch(
+        f"/api/v1/trips/{trip.json()['id']}", json={"destination": "Z"}, headers=headers
+    )
+    await client.patch(
+        f"/api/v1/companies/{company.json()['id']}", json={"name": "Renamed"}, headers=headers
+    )
+    assert len(list(tmp_path.glob("*.pdf"))) == 1
+    edited = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert edited.status_code == 304
+    third = await client.get(url, headers=headers)
+    assert third.content == b"%PDF-Y"
+    assert renders == ["Y"]
+    # Cache hits and 304s are keyed on the stored snapshot hash and never decode the lines.
+    assert decoded == [1]
+
+
+@pytest.mark.asyncio
+async def test_trip_edit_rerenders_invoice_without_line_snapshot(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient, app: FastAPI, tmp_path: Path
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    app.state.invoice_pdf_cache = InvoicePDFCache(tmp_path, max_bytes=1024)
+    app.state.invoice_pdf_renderer = InvoicePDFRenderer(
+        max_workers=0, max_pending=1, timeout_seconds=5
+    )
+    headers = await _auth_headers(client)
+    company = await client.post(
+        "/api/v1/companies",
+        json={
+            "name": "Legacy",
+            "address": "Road 7",
+            "email": "ops@legacy.example.com",
+            "phone": "555",
+            "trn": "100000000000078",
+            "contact_person": "Ivo",
+            "po_box": "78",
+        },
+        headers=headers,
+    )
+    trip = await client.post(
+        "/api/v1/trips",
+        json={
+            "company_id": company.json()["id"],
+            "date": "2026-02-10",
+            "freight": "1 Ton",
+            "origin": "X",
+            "destination": "Y",
+            "amount": "50.00",
+            "toll_gate": "0.00",
+            "driver": "Driver",
+        },
+        headers=headers,
+    )
+    created = await client.post(
+        "/api/v1/invoices",
+        json={"company_id": company.json()["id"], "trip_ids": [trip.json()["id"]]},
+        headers=headers,
+    )
+    invoice_id = created.json()["id"]
+    # Invoices issued before line snapshots existed render from the live trip rows.
+    async with asynccontextmanager(app.dependency_overrides[get_db_session])() as session:
+        await session.execute(
+            update(Invoice)
+            .where(Invoice.id == invoice_id)
+            .values(line_snapshot=None, line_snapshot_hash=None)
+        )
+        await session.commit()
+    renders: list[str] = []
+
+    def _render(*args: Any) -> bytes:
+        renders.append(args[2][0].destination)
+        return b"%PDF-" + args[2][0].destination.encode()
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", _render)
+    url = f"/api/v1/invoices/{invoice_id}/pdf"
+
+    first = await client.get(url, headers=headers)
+    assert first.content == b"%PDF-Y"
+    assert len(list(tmp_path.glob("*.pdf"))) == 1
+
+    await client.patch(
+        f"/api/v1/trips/{trip.json()['id']}", json={"destination": "Z"}, headers=headers
+    )
+    assert list(tmp_path.glob("*.pdf")) == []
+    edited = await client.get(url, headers={**headers, "If-None-Match": first.headers["etag"]})
+    assert edited.status_code == 200
+    assert edited.content == b"%PDF-Z"
+    assert renders == ["Y", "Z"]
+
+
+def test_invoice_pdf_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = InvoicePDFCache(tmp_path, max_bytes=20)
+    first = cache.put(1, "a", b"x" * 10)
+    os.utime(first, (1, 1))
+    second = cache.put(2, "b", b"y" * 10)
+    os.utime(second, (2, 2))
+    assert cache.get(1, "a") == b"x" * 10
+
+    cache.put(3, "c", b"z" * 10)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["1-a.pdf", "3-c.pdf"]
+    assert cache.stats() == {"hits": 1, "misses": 0, "entries": 2, "bytes": 20}
+
+
+def test_invoice_pdf_cache_keeps_a_running_size(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache = InvoicePDFCache(tmp_path, max_bytes=100)
+    os.utime(cache.put(1, "a", b"x" * 10), (1, 1))
+    scans: list[int] = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    cache.put(2, "b", b"y" * 10)
+    os.utime(cache.put(2, "b", b"y" * 20), (2, 2))
+    assert cache.invalidate(1) == 1
+    os.utime(cache.put(3, "c", b"z" * 75), (3, 3))
+    assert scans == []
+
+    cache.put(4, "d", b"w" * 10)
+    assert scans == [1]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["3-c.pdf", "4-d.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_download_invoice_pdf_archive_streams_zip(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient, app: FastAPI
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    app.state.settings.invoice_pdf_archive_parallelism = 2
+    # Fewer render slots than archive parallelism: entries must wait rather than fail.
+    app.state.invoice_pdf_renderer = InvoicePDFRenderer(
+        max_workers=0, max_pending=1, timeout_seconds=5
+    )
+    headers = await _auth_headers(client)
+    company_ids: list[int] = []
+    for index in range(2):
+        company = await client.post(
+            "/api/v1/companies",
+            json={
+                "name": f"Archive {index}",
+                "address": "Road 6",
+                "email": f"ops{index}@archive.example.com",
+                "phone": "555",
+                "trn": f"10000000000006{index}",
+                "contact_person": "Ray",
+                "po_box": "66",
+            },
+            headers=headers,
+        )
+        company_ids.append(company.json()["id"])
+    invoice_ids: list[int] = []
+    for company_id in [*company_ids, company_ids[0]]:
+        trip = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company_id,
+                "date": "2026-02-05",
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": "10.00",
+                "toll_gate": "0.00",
+                "driver": "Driver",
+            },
+            headers=headers,
+        )
+        invoice = await client.post(
+            "/api/v1/invoices",
+            json={"company_id": company_id, "trip_ids": [trip.json()["id"]]},
+            headers=headers,
+        )
+        invoice_ids.append(invoice.json()["id"])
+
+    def slow_generate_pdf(invoice: Any, *_args: Any) -> bytes:
+        time.sleep(0.05)
+        return f"%PDF-{invoice.id}".encode()
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", slow_generate_pdf)
+    today = datetime.now(UTC).date().isoformat()
+    response = await client.get(
+        "/api/v1/invoices/pdf-archive",
+        params={"start": today, "end": today, "company_id": company_ids[0]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+
+    with zipfile.ZipFile(BytesIO(response.content)) as archive:
+        names = archive.namelist()
+        contents = [archive.read(name) for name in names]
+    assert [name.split("_")[0] for name in names] == [
+        f"{invoice_ids[0]:06d}",
+        f"{invoice_ids[2]:06d}",
+    ]
+    assert contents == [f"%PDF-{invoice_ids[0]}".encode(), f"%PDF-{invoice_ids[2]}".encode()]
+
+
+@pytest.mark.asyncio
+async def test_download_invoice_pdf_archive_lists_failed_entries(
+    monkeypatch: pytest.MonkeyPatch,
+    client: AsyncClient,
+    app: FastAPI,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    app.state.settings.invoice_pdf_archive_parallelism = 1
+    app.state.invoice_pdf_renderer = InvoicePDFRenderer(
+        max_workers=0, max_pending=2, timeout_seconds=0.25
+    )
+    headers = await _auth_headers(client)
+    company = await client.post(
+        "/api/v1/companies",
+        json={
+            "name": "Archive Slow",
+            "address": "Road 6",
+            "email": "ops@slow.archive.example.com",
+            "phone": "555",
+            "trn": "100000000000065",
+            "contact_person": "Ray",
+            "po_box": "66",
+        },
+        headers=headers,
+    )
+    invoice_ids: list[int] = []
+    for _ in range(2):
+        trip = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company.json()["id"],
+                "date": "2026-02-05",
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": "10.00",
+                "toll_gate": "0.00",
+                "driver": "Driver",
+            },
+            headers=headers,
+        )
+        invoice = await client.post(
+            "/api/v1/invoices",
+            json={"company_id": company.json()["id"], "trip_ids": [trip.json()["id"]]},
+            headers=headers,
+        )
+        invoice_ids.append(invoice.json()["id"])
+
+    def generate_pdf(invoice: Any, *_args: Any) -> bytes:
+        if invoice.id == invoice_ids[0]:
+            time.sleep(0.3)
+        return f"%PDF-{invoice.id}".encode()
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", generate_pdf)
+    caplog.set_level(logging.INFO, logger="transportation.audit")
+    today = datetime.now(UTC).date().isoformat()
+    response = await client.get(
+        "/api/v1/invoices/pdf-archive",
+        params={"start": today, "end": today, "company_id": company.json()["id"]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    with zipfile.ZipFile(BytesIO(response.content)) as archive:
+        names = archive.namelist()
+        errors = archive.read("errors.txt").decode()
+    assert [name.split("_")[0] for name in names] == [f"{invoice_ids[1]:06d}", "errors.txt"]
+    assert errors == f"{invoice_ids[0]}: PDF rendering timed out"
+
+    exports = [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "transportation.audit"
+        and json.loads(record.getMessage())["resource"] == "invoice_pdf_archive"
+    ]
+    assert [event["metadata"]["failed_count"] for event in exports] == [1]
+
+
+@pytest.mark.asyncio
+async def test_invoice_pdf_job_renders_in_background(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient, app: FastAPI
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    renderer = InvoicePDFRenderer(max_workers=0, max_pending=2, timeout_seconds=5)
+    headers = await _auth_headers(client)
+    company = await client.post(
+        "/api/v1/companies",
+        json={
+            "name": "Queued Co",
+            "address": "Road 7",
+            "email": "ops@queued.example.com",
+            "phone": "555",
+            "trn": "100000000000070",
+            "contact_person": "Kim",
+            "po_box": "77",
+        },
+        headers=headers,
+    )
+    trip = await client.post(
+        "/api/v1/trips",
+        json={
+            "company_id": company.json()["id"],
+            "date": "2026-02-05",
+            "freight": "1 Ton",
+            "origin": "A",
+            "destination": "B",
+            "amount": "10.00",
+            "toll_gate": "0.00",
+            "driver": "Driver",
+        },
+        headers=headers,
+    )
+    invoice = await client.post(
+        "/api/v1/invoices",
+        json={"company_id": company.json()["id"], "trip_ids": [trip.json()["id"]]},
+        headers=headers,
+    )
+    invoice_id = invoice.json()["id"]
+
+    queued = await client.post(
+        f"/api/v1/invoices/{invoice_id}/pdf-jobs",
+        params={"template": "template_b", "group_by": "date"},
+        headers=headers,
+    )
+    assert queued.status_code == 202
+    job = queued.json()
+    assert (job["status"], job["group_by"]) == ("queued", "date")
+    assert queued.headers["location"].endswith(f"/api/v1/pdf-jobs/{job['id']}")
+
+    pending = await client.get(f"/api/v1/pdf-jobs/{job['id']}/result", headers=headers)
+    assert pending.status_code == 409
+
+    rendered: list[tuple[str, str]] = []
+
+    def fake_generate_pdf(
+        invoice: Any, _company: Any, _trips: Any, template_key: Any, _trn: Any, group_by: Any
+    ) -> bytes:
+        rendered.append((template_key, group_by))
+        return f"%PDF-{invoice.id}".encode()
+
+    sessions: list[AsyncSession] = []
+    session_factory = asynccontextmanager(app.dependency_overrides[get_db_session])
+
+    @asynccontextmanager
+    async def tracked_session_factory() -> AsyncIterator[AsyncSession]:
+        async with session_factory() as session:
+            sessions.append(session)
+            yield session
+
+    render = renderer.render
+    held_transactions: list[bool] = []
+
+    async def tracked_render(job: InvoicePDFJob, **kwargs: Any) -> bytes:
+        held_transactions.append(any(session.in_transaction() for session in sessions))
+        return await render(job, **kwargs)
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", fake_generate_pdf)
+    monkeypatch.setattr(renderer, "render", tracked_render)
+    worker = PdfRenderWorker(
+        tracked_session_factory,
+        renderer,
+        concurrency=2,
+        poll_interval_seconds=0.1,
+        stale_after_seconds=60,
+        max_attempts=3,
+    )
+    assert await worker.run_once() == 1
+    assert await worker.run_once() == 0
+    assert rendered == [("template_b", "date")]
+    assert held_transactions == [False]
+
+    status_response = await client.get(f"/api/v1/pdf-jobs/{job['id']}", headers=headers)
+    body = status_response.json()
+    assert body["status"] == "succeeded"
+    assert body["attempts"] == 1
+    assert body["result_size"] == len(f"%PDF-{invoice_id}")
+    assert body["result_url"].endswith(f"/api/v1/pdf-jobs/{job['id']}/result")
+
+    result = await client.get(body["result_url"], headers=headers)
+    assert result.status_code == 200
+    assert result.content == f"%PDF-{invoice_id}".encode()
+    assert result.headers["content-length"] == str(body["result_size"])
+
+    other_headers = await _auth_headers(client, username="admin2")
+    hidden = await client.get(f"/api/v1/pdf-jobs/{job['id']}", headers=other_headers)
+    assert hidden.status_code == 404
+
+
+async def _queue_pdf_jobs(client: AsyncClient, headers: dict[str, str], count: int) -> list[int]:
+    company = await client.post(
+        "/api/v1/companies",
+        json={
+            "name": "Retry Co",
+            "address": "Road 8",
+            "email": "ops@retry.example.com",
+            "phone": "555",
+            "trn": "100000000000071",
+            "contact_person": "Lee",
+            "po_box": "78",
+        },
+        headers=headers,
+    )
+    trip = await client.post(
+        "/api/v1/trips",
+        json={
+            "company_id": company.json()["id"],
+            "date": "2026-02-05",
+            "freight": "1 Ton",
+            "origin": "A",
+            "destination": "B",
+            "amount": "10.00",
+            "toll_gate": "0.00",
+            "driver": "Driver",
+        },
+        headers=headers,
+    )
+    invoice = await client.post(
+        "/api/v1/invoices",
+        json={"company_id": company.json()["id"], "trip_ids": [trip.json()["id"]]},
+        headers=headers,
+    )
+    job_ids = []
+    for _ in range(count):
+        queued = await client.post(
+            f"/api/v1/invoices/{invoice.json()['id']}/pdf-jobs", headers=headers
+        )
+        job_ids.append(queued.json()["id"])
+    return job_ids
+
+
+@pytest.mark.asyncio
+async def test_invoice_pdf_job_records_render_failures(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient, app: FastAPI
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    headers = await _auth_headers(client)
+    first_id, second_id = await _queue_pdf_jobs(client, headers, 2)
+    failures: list[Exception] = [
+        AppException("Template broke", status_code=400),
+        RuntimeError("reportlab exploded"),
+    ]
+
+    def failing_generate_pdf(*_args: Any) -> bytes:
+        raise failures.pop(0)
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", failing_generate_pdf)
+    worker = PdfRenderWorker(
+        asynccontextmanager(app.dependency_overrides[get_db_session]),
+        InvoicePDFRenderer(max_workers=0, max_pending=2, timeout_seconds=5),
+        concurrency=1,
+        poll_interval_seconds=0.1,
+        stale_after_seconds=60,
+        max_attempts=3,
+    )
+    assert await worker.run_once() == 2
+
+    first = (await client.get(f"/api/v1/pdf-jobs/{first_id}", headers=headers)).json()
+    second = (await client.get(f"/api/v1/pdf-jobs/{second_id}", headers=headers)).json()
+    assert (first["status"], first["error"]) == ("failed", "Template broke")
+    assert (second["status"], second["error"]) == ("failed", "PDF rendering failed")
+    assert first["result_url"] is None
+
+
+@pytest.mark.asyncio
+async def test_invoice_pdf_job_is_released_when_renderer_is_busy(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient, app: FastAPI
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    headers = await _auth_headers(client)
+    (job_id,) = await _queue_pdf_jobs(client, headers, 1)
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", lambda *_args: b"%PDF-FAKE")
+    session_factory = asynccontextmanager(app.dependency_overrides[get_db_session])
+
+    def build_worker(max_pending: int) -> PdfRenderWorker:
+        return PdfRenderWorker(
+            session_factory,
+            InvoicePDFRenderer(max_workers=0, max_pending=max_pending, timeout_seconds=5),
+            concurrency=1,
+            poll_interval_seconds=0.1,
+            stale_after_seconds=60,
+            max_attempts=3,
+        )
+
+    assert await build_worker(0).run_once() == 0
+    job = (await client.get(f"/api/v1/pdf-jobs/{job_id}", headers=headers)).json()
+    assert (job["status"], job["attempts"]) == ("queued", 0)
+
+    assert await build_worker(1).run_once() == 1
+    job = (await client.get(f"/api/v1/pdf-jobs/{job_id}", headers=headers)).json()
+    assert (job["status"], job["attempts"]) == ("succeeded", 1)
+
+
+@pytest.mark.asyncio
+async def test_stale_pdf_job_is_requeued_and_ignores_the_old_claim(
+    monkeypatch: pytest.MonkeyPatch, client: AsyncClient, app: FastAPI
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    headers = await _auth_headers(client)
+    (job_id,) = await _queue_pdf_jobs(client, headers, 1)
+    session_factory = asynccontextmanager(app.dependency_overrides[get_db_session])
+    job_handler = PdfRenderJobHandler()
+    async with session_factory() as session:
+        claimed = await job_handler.claim_next_job(session)
+        assert claimed is not None and claimed.attempts == 1
+        await session.execute(
+            update(PdfRenderJob)
+            .where(PdfRenderJob.id == job_id)
+            .values(started_at=datetime.now(UTC) - timedelta(minutes=5))
+        )
+        await session.commit()
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", lambda *_args: b"%PDF-RETRY")
+    worker = PdfRenderWorker(
+        session_factory,
+        InvoicePDFRenderer(max_workers=0, max_pending=1, timeout_seconds=5),
+        concurrency=1,
+        poll_interval_seconds=0.1,
+        stale_after_seconds=60,
+        max_attempts=3,
+    )
+    assert await worker.run_once() == 1
+
+    async with session_factory() as session:
+        assert not await job_handler.finish_job(session, job_id, 1, error="late failure")
+    job = (await client.get(f"/api/v1/pdf-jobs/{job_id}", headers=headers)).json()
+    assert (job["status"], job["attempts"], job["error"]) == ("succeeded", 2, None)
+
+
+@pytest.mark.asyncio
+async def test_create_invoice_prerenders_pdf_into_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    client: AsyncClient,
+    app: FastAPI,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    app.state.settings.invoice_pdf_prerender_enabled = True
+    cache = InvoicePDFCache(tmp_path, max_bytes=1024)
+    app.state.invoice_pdf_cache = cache
+    app.state.invoice_pdf_renderer = InvoicePDFRenderer(
+        max_workers=0, max_pending=1, timeout_seconds=5
+    )
+    rendered: list[str | None] = []
+
+    def fake_generate_pdf(
+        invoice: Any, _company: Any, _trips: Any, template_key: Any, *_: Any
+    ) -> bytes:
+        rendered.append(template_key)
+        return b"%PDF-prerendered"
+
+    monkeypatch.setattr(InvoicePDFService, "generate_pdf", fake_generate_pdf)
+    headers = await _auth_headers(client)
+    company = await client.post(
+        "/api/v1/companies",
+        json={
+            "name": "Eager",
+            "address": "Road 8",
+            "email": "ops@eager.example.com",
+            "phone": "555",
+            "trn": "100000000000088",
+            "contact_person": "Eli",
+            "po_box": "88",
+        },
+        headers=headers,
+    )
+    trip = await client.post(
+        "/api/v1/trips",
+        json={
+            "company_id": company.json()["id"],
+            "date": "2026-02-05",
+            "freight": "1 Ton",
+            "origin": "A",
+            "destination": "B",
+            "amount": "10.00",
+            "toll_gate": "0.00",
+            "driver": "Driver",
+        },
+        headers=headers,
+    )
+    invoice = await client.post(
+        "/api/v1/invoices",
+        json={
+            "company_id": company.json()["id"],
+            "trip_ids": [trip.json()["id"]],
+            "format_key": "template_c",
+        },
+        headers=headers,
+    )
+    assert invoice.status_code == 201
+    assert rendered == ["template_c"]
+    assert cache.stats()["entries"] == 1
+
+    response = await client.get(f"/api/v1/invoices/{invoice.json()['id']}/pdf", headers=headers)
+    assert response.status_code == 200
+    assert response.content == b"%PDF-prerendered"
+    assert response.headers["content-length"] == str(len(b"%PDF-prerendered"))
+    assert response.headers["etag"]
+    assert rendered == ["template_c"]
+    assert cache.hits == 1
+
+    def full_disk(*_args: Any) -> Path:
+        raise OSError(28, "No space left on device")
+
+    put = cache.put
+    monkeypatch.setattr(cache, "put", full_disk)
+    second_trip = await client.post(
+        "/api/v1/trips",
+        json={
+            "company_id": company.json()["id"],
+            "date": "2026-02-06",
+            "freight": "1 Ton",
+            "origin": "A",
+            "destination": "C",
+            "amount": "10.00",
+            "toll_gate": "0.00",
+            "driver": "Driver",
+        },
+        headers=headers,
+    )
+    second = await client.post(
+        "/api/v1/invoices",
+        json={"company_id": company.json()["id"], "trip_ids": [second_trip.json()["id"]]},
+        headers=headers,
+    )
+    assert second.status_code == 201
+    assert cache.stats()["entries"] == 1
+    assert "invoice_pdf_prerender_failed" in caplog.text
+    monkeypatch.setattr(cache, "put", put)
+    download = await client.get(f"/api/v1/invoices/{second.json()['id']}/pdf", headers=headers)
+    assert download.status_code == 200
+    assert len(rendered) == 3
+
+    async def broken_bundle(*_args: Any, **_kwargs: Any) -> Any:
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(InvoiceHandler, "get_invoice_bundle", broken_bundle)
+    third_trip = await client.post(
+        "/api/v1/trips",
+        json={
+            "company_id": company.json()["id"],
+            "date": "2026-02-07",
+            "freight": "1 Ton",
+            "origin": "A",
+            "destination": "D",
+            "amount": "10.00",
+            "toll_gate": "0.00",
+            "driver": "Driver",
+        },
+        headers=headers,
+    )
+    # The bundle loads in the background task, so a failure there no longer fails the create.
+    third = await client.post(
+        "/api/v1/invoices",
+        json={"company_id": company.json()["id"], "trip_ids": [third_trip.json()["id"]]},
+        headers=headers,
+    )
+    assert third.status_code == 201
+    assert f"invoice_pdf_prerender_failed invoice_id={third.json()['id']}" in caplog.text
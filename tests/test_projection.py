@@ -0,0 +1,91 @@
+import pytest
+from httpx import AsyncClient
+from pydantic import BaseModel
+
+from src.db.projection import read_columns
+from src.models.company import Company
+from src.schemas.company import CompanyRead
+
+
+async def _auth_headers(client: AsyncClient) -> dict[str, str]:
+    token_response = await client.post(
+        "/api/v1/auth/token",
+        json={"username": "admin", "password": "secret"},
+    )
+    token = token_response.cookies.get("access_token")
+    assert token
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_read_columns_follow_schema_field_order() -> None:
+    columns = read_columns(Company, CompanyRead)
+    assert [column.key for column in columns] == list(CompanyRead.model_fields)
+
+
+def test_read_columns_reject_fields_without_a_column() -> None:
+    class CompanyWithExtra(BaseModel):
+        id: int
+        missing: str
+
+    with pytest.raises(ValueError, match="CompanyWithExtra.missing"):
+        read_columns(Company, CompanyWithExtra)
+
+
+@pytest.mark.asyncio
+async def test_projected_lists_match_single_item_reads(client: AsyncClient) -> None:
+    headers = await _auth_headers(client)
+    company = (
+        await client.post(
+            "/api/v1/companies",
+            json={
+                "name": "Projected",
+                "address": "Road 5",
+                "email": "ops@projected.example.com",
+                "phone": "555",
+                "trn": "100000000000005",
+                "contact_person": "Pia",
+                "po_box": "55",
+            },
+            headers=headers,
+        )
+    ).json()
+    trip = (
+        await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company["id"],
+                "date": "2026-02-01",
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": "10.10",
+                "toll_gate": "0.00",
+                "driver": "Driver",
+            },
+            headers=headers,
+        )
+    ).json()
+    invoice = (
+        await client.post(
+            "/api/v1/invoices",
+            json={"company_id": company["id"], "trip_ids": [trip["id"]]},
+            headers=headers,
+        )
+    ).json()
+
+    companies = (await client.get("/api/v1/companies", headers=headers)).json()
+    single_company = (
+        await client.get(f"/api/v1/companies/{company['id']}", headers=headers)
+    ).json()
+    assert single_company in companies
+
+    trips = (
+        await client.get("/api/v1/trips", params={"company_id": company["id"]}, headers=headers)
+    ).json()
+    single_trip = (await client.get(f"/api/v1/trips/{trip['id']}", headers=headers)).json()
+    assert trips == [single_trip]
+
+    invoices = (
+        await client.get("/api/v1/invoices", params={"company_id": company["id"]}, headers=headers)
+    ).json()
+    assert invoices == [invoice]
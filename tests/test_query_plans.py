@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.db.base import Base
+from src.handlers.driver_cash_handover import DriverCashHandoverHandler
+from src.handlers.invoice import InvoiceHandler
+from src.handlers.trip import TripHandler
+from src.models.company import Company
+from src.models.driver import Driver
+from src.models.driver_cash_handover import DriverCashHandover
+from src.models.invoice import Invoice
+from src.models.signatory import Signatory
+from src.models.transport_company import TransportCompany
+from src.models.trip import Trip
+
+_FULL_SCAN = re.compile(r"^SCAN (\w+)")
+# A blob column that is fetched, as opposed to only tested with IS [NOT] NULL.
+_BLOB_COLUMN = re.compile(r"(signature|signatory)_image_data(?! IS)")
+
+trip_handler = TripHandler()
+invoice_handler = InvoiceHandler()
+handover_handler = DriverCashHandoverHandler()
+
+
+@dataclass
+class PlanContext:
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    tenant_id: int
+    company_id: int
+    driver_id: int
+    invoice_id: int
+    legacy_invoice_id: int
+
+
+@pytest.fixture
+async def plan_context() -> AsyncIterator[PlanContext]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with session_factory() as session:
+        tenant = TransportCompany(
+            uuid="00000000-0000-0000-0000-000000000077",
+            name="Plan Co",
+            email="plan@co.local",
+            location="Plan City",
+            trn="TRN-PLAN-01",
+        )
+        session.add(tenant)
+        await session.flush()
+        company = Company(
+            transport_company_id=tenant.id,
+            name="Customer",
+            address="Road",
+            email="customer@plan.local",
+            phone="555",
+            trn="100000000000077",
+            contact_person="Sam",
+            po_box="77",
+        )
+        driver = Driver(transport_company_id=tenant.id, name="Planner", mobile_number="0500")
+        signatory = Signatory(
+            transport_company_id=tenant.id,
+            name="Signer",
+            signature_image_mime="image/png",
+            signature_image_data=b"signature-bytes",
+        )
+        session.add_all([company, driver, signatory])
+        await session.flush()
+        invoice = Invoice(
+            company_id=company.id,
+            transport_company_id=tenant.id,
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+            due_date=date(2026, 3, 30),
+            total_amount=Decimal("105.00"),
+            generated_at=datetime(2026, 3, 1, tzinfo=UTC),
+            signatory_id=signatory.id,
+            signatory_name=signatory.name,
+            signatory_image_data=b"signature-bytes",
+        )
+        legacy_invoice = Invoice(
+            company_id=company.id,
+            transport_company_id=tenant.id,
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            due_date=date(2026, 2, 28),
+            total_amount=Decimal("0.00"),
+            generated_at=datetime(2026, 2, 1, tzinfo=UTC),
+        )
+        session.add_all([invoice, legacy_invoice])
+        await session.flush()
+        session.add_all(
+            [
+                Trip(
+                    company_id=company.id,
+                    transport_company_id=tenant.id,
+                    date=date(2026, 2, 5),
+                    freight="1 Ton",
+                    origin="A",
+                    destination="B",
+                    amount=Decimal("100.00"),
+                    vat=Decimal("5.00"),
+                    toll_gate=Decimal("0.00"),
+                    total_amount=Decimal("105.00"),
+                    driver=driver.name,
+                    driver_id=driver.id,
+                    paid=True,
+                    invoice_id=invoice.id,
+                ),
+                DriverCashHandover(
+                    transport_company_id=tenant.id,
+                    driver_id=driver.id,
+                    handover_date=date(2026, 2, 6),
+                    amount=Decimal("50.00"),
+                ),
+            ]
+        )
+        await session.commit()
+        context = PlanContext(
+            engine=engine,
+            session_factory=session_factory,
+            tenant_id=tenant.id,
+            company_id=company.id,
+            driver_id=driver.id,
+            invoice_id=invoice.id,
+            legacy_invoice_id=legacy_invoice.id,
+        )
+
+    yield context
+    await engine.dispose()
+
+
+async def _capture_selects(
+    context: PlanContext, run: Callable[[AsyncSession], Awaitable[Any]]
+) -> list[tuple[str, Any]]:
+    captured: list[tuple[str, Any]] = []
+
+    def _record(_conn: Any, _cursor: Any, statement: str, parameters: Any, *_: Any) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(context.engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        async with context.session_factory() as session:
+            await run(session)
+    finally:
+        event.remove(context.engine.sync_engine, "before_cursor_execute", _record)
+    return captured
+
+
+async def _full_scans(context: PlanContext, statement: str, parameters: Any) -> list[str]:
+    async with context.engine.connect() as connection:
+        result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        details = [str(row[3]) for row in result.all()]
+    return [detail for detail in details if _FULL_SCAN.match(detail)]
+
+
+def _cases(context: PlanContext) -> dict[str, Callable[[AsyncSession], Awaitable[Any]]]:
+    tenant_id = context.tenant_id
+    return {
+        "trips_all": lambda s: trip_handler.list_trips(s, tenant_id),
+        "trips_page": lambda s: trip_handler.list_trips_page(s, tenant_id, limit=10),
+        "trips_by_company": lambda s: trip_handler.list_trips(
+            s, tenant_id, company_id=context.company_id
+        ),
+        "trips_unpaid_by_company": lambda s: trip_handler.list_trips(
+            s, tenant_id, company_id=context.company_id, paid=False
+        ),
+        "trips_by_driver_range": lambda s: trip_handler.list_trips(
+            s,
+            tenant_id,
+            driver_id=context.driver_id,
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+        ),
+        "trips_by_range": lambda s: trip_handler.list_trips(
+            s, tenant_id, start_date=date(2026, 2, 1), end_date=date(2026, 2, 28)
+        ),
+        "driver_report": lambda s: trip_handler.driver_report(
+            s, tenant_id, start_date=date(2026, 2, 1), end_date=date(2026, 2, 28)
+        ),
+        "invoice_unpaid_trips": lambda s: invoice_handler._unpaid_trips(
+            s, tenant_id, context.company_id, date(2026, 2, 1), date(2026, 2, 28)
+        ),
+        "invoice_bundle": lambda s: invoice_handler.get_invoice_bundle(
+            s, tenant_id, context.invoice_id
+        ),
+        "invoice_bundle_legacy": lambda s: invoice_handler.get_invoice_bundle(
+            s, tenant_id, context.legacy_invoice_id
+        ),
+        "invoice_archive_ids": lambda s: invoice_handler.list_invoice_ids_generated_between(
+            s, tenant_id, date(2026, 3, 1), date(2026, 3, 31), company_id=context.company_id
+        ),
+        "invoice_detail": lambda s: invoice_handler.get_invoice(s, tenant_id, context.invoice_id),
+        "invoices_all": lambda s: invoice_handler.list_invoices(s, tenant_id),
+        "invoices_page": lambda s: invoice_handler.list_invoices_page(s, tenant_id, limit=10),
+        "invoice_summary": lambda s: invoice_handler.invoice_summary(s, tenant_id),
+        "invoice_summary_by_company": lambda s: invoice_handler.invoice_summary(
+            s, tenant_id, group_by_company=True
+        ),
+        "invoices_by_company": lambda s: invoice_handler.list_invoices(
+            s, tenant_id, company_id=context.company_id
+        ),
+        "invoices_paid": lambda s: invoice_handler.list_invoices(s, tenant_id, status="paid"),
+        "invoices_unpaid": lambda s: invoice_handler.list_invoices(s, tenant_id, status="unpaid"),
+        "invoices_overdue": lambda s: invoice_handler.list_invoices(s, tenant_id, status="overdue"),
+        "signatories": lambda s: s.execute(
+            select(Signatory).where(Signatory.transport_company_id == tenant_id)
+        ),
+        "handovers_by_driver": lambda s: handover_handler.list_handovers(
+            s, tenant_id, driver_id=context.driver_id
+        ),
+        "cash_summary": lambda s: handover_handler.summary_by_driver(
+            s, tenant_id, start_date=date(2026, 2, 1), end_date=date(2026, 2, 28)
+        ),
+        "cash_summary_by_driver": lambda s: handover_handler.summary_by_driver(
+            s, tenant_id, driver_id=context.driver_id
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_handler_queries_avoid_full_table_scans(plan_context: PlanContext) -> None:
+    failures: list[str] = []
+    for label, run in _cases(plan_context).items():
+        statements = await _capture_selects(plan_context, run)
+        assert statements, f"{label} issued no SELECT statements"
+        for statement, parameters in statements:
+            for detail in await _full_scans(plan_context, statement, parameters):
+                failures.append(f"{label}: {detail}\n{statement}")
+    assert not failures, "\n\n".join(failures)
+
+
+@pytest.mark.asyncio
+async def test_list_queries_do_not_select_signature_blobs(plan_context: PlanContext) -> None:
+    cases = _cases(plan_context)
+    for label in ("invoice_detail", "invoices_all", "invoices_by_company", "signatories"):
+        for statement, _ in await _capture_selects(plan_context, cases[label]):
+            assert not _BLOB_COLUMN.search(statement), f"{label}: {statement}"
+
+    bundle_statements = await _capture_selects(plan_context, cases["invoice_bundle"])
+    assert any(_BLOB_COLUMN.search(statement) for statement, _ in bundle_statements)
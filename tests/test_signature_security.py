@@ -5,6 +5,7 @@ from decimal import Decimal
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import undefer
 
 from src.core.signature_crypto import get_signature_crypto
 from src.db.base import Base
@@ -94,13 +95,23 @@ async def test_rotation_migrates_legacy_plaintext_signature_payloads() -> None:
         assert report.signatories_reencrypted == 1
         assert report.invoices_reencrypted == 1
 
-        refreshed_signatory = await session.get(Signatory, 1)
+        refreshed_signatory = await session.get(
+            Signatory,
+            1,
+            options=[undefer(Signatory._signature_image_data)],
+            populate_existing=True,
+        )
         assert refreshed_signatory is not None
         assert refreshed_signatory._signature_image_data is not None
         assert refreshed_signatory._signature_image_data != b"legacy-signatory-bytes"
         assert refreshed_signatory.signature_image_data == b"legacy-signatory-bytes"
 
-        refreshed_invoice = await session.get(Invoice, 1)
+        refreshed_invoice = await session.get(
+            Invoice,
+            1,
+            options=[undefer(Invoice._signatory_image_data)],
+            populate_existing=True,
+        )
         assert refreshed_invoice is not None
         assert refreshed_invoice._signatory_image_data is not None
         assert refreshed_invoice._signatory_image_data != b"legacy-invoice-bytes"
@@ -1,4 +1,8 @@
+import csv
+from io import StringIO
+
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
 
 
@@ -41,3 +45,290 @@ async def test_create_trip_updates_totals(client: AsyncClient) -> None:
     trip = trip_response.json()
     assert trip["vat"] == "5.00"
     assert trip["total_amount"] == "115.00"
+
+
+@pytest.mark.asyncio
+async def test_list_trips_paginates_with_cursor(client: AsyncClient) -> None:
+    headers = await _auth_headers(client)
+    company_payload = {
+        "name": "Paged",
+        "address": "Road 9",
+        "email": "ops@paged.example.com",
+        "phone": "555",
+        "trn": "100000000000009",
+        "contact_person": "Pat",
+        "po_box": "99",
+    }
+    company = (await client.post("/api/v1/companies", json=company_payload, headers=headers)).json()
+
+    created_ids: list[int] = []
+    for trip_date in ["2026-02-01", "2026-02-03", "2026-02-03", "2026-02-02"]:
+        response = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company["id"],
+                "date": trip_date,
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": "100.00",
+                "toll_gate": "0.00",
+                "driver": "Driver",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+        created_ids.append(response.json()["id"])
+
+    first_page = await client.get("/api/v1/trips", params={"limit": 3}, headers=headers)
+    assert first_page.status_code == 200
+    cursor = first_page.headers.get("X-Next-Cursor")
+    assert cursor
+    second_page = await client.get(
+        "/api/v1/trips", params={"limit": 3, "cursor": cursor}, headers=headers
+    )
+    assert second_page.status_code == 200
+    assert "X-Next-Cursor" not in second_page.headers
+
+    listed_ids = [item["id"] for item in first_page.json() + second_page.json()]
+    assert listed_ids == [created_ids[2], created_ids[1], created_ids[3], created_ids[0]]
+
+    invalid = await client.get("/api/v1/trips", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_driver_report_export_streams_rows_and_total(
+    client: AsyncClient, app: FastAPI
+) -> None:
+    app.state.settings.sensitive_export_step_up_required = False
+    headers = await _auth_headers(client)
+    company_payload = {
+        "name": "Export Co",
+        "address": "Road 7",
+        "email": "ops@export.example.com",
+        "phone": "555",
+        "trn": "100000000000007",
+        "contact_person": "Eve",
+        "po_box": "77",
+    }
+    company = (await client.post("/api/v1/companies", json=company_payload, headers=headers)).json()
+    for trip_date, amount in [("2026-02-01", "100.10"), ("2026-02-02", "0.20")]:
+        response = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company["id"],
+                "date": trip_date,
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": amount,
+                "toll_gate": "0.00",
+                "driver": "Exporter",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    export = await client.get("/api/v1/trips/driver-report/export", headers=headers)
+    assert export.status_code == 200
+    assert export.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(StringIO(export.text)))
+    assert rows[0][0] == "Trip ID"
+    assert [row[1] for row in rows[1:3]] == ["2026-02-02", "2026-02-01"]
+    assert rows[1][3] == "Export Co"
+    assert rows[-1][-2:] == ["Total", "100.30"]
+
+
+@pytest.mark.asyncio
+async def test_driver_report_groups_trips_per_driver(client: AsyncClient) -> None:
+    headers = await _auth_headers(client)
+    company_payload = {
+        "name": "Report Co",
+        "address": "Road 8",
+        "email": "ops@report.example.com",
+        "phone": "555",
+        "trn": "100000000000008",
+        "contact_person": "Ray",
+        "po_box": "88",
+    }
+    company = (await client.post("/api/v1/companies", json=company_payload, headers=headers)).json()
+    for driver_name, amount in [("beta", "0.10"), ("Alpha", "10.05"), ("beta", "0.20")]:
+        response = await client.post(
+            "/api/v1/trips",
+            json={
+                "company_id": company["id"],
+                "date": "2026-02-01",
+                "freight": "1 Ton",
+                "origin": "A",
+                "destination": "B",
+                "amount": amount,
+                "toll_gate": "0.00",
+                "driver": driver_name,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    report = await client.get("/api/v1/trips/driver-report", headers=headers)
+    assert report.status_code == 200
+    assert report.json() == [
+        {"driver_name": "Alpha", "trip_count": 1, "amount_excl_vat_total": "10.05"},
+        {"driver_name": "beta", "trip_count": 2, "amount_excl_vat_total": "0.30"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_trips_from_csv_batches_company_balance(client: AsyncClient) -> None:
+    headers = await _auth_headers(client)
+    company_payload = {
+        "name": "Import Co",
+        "address": "Road 7",
+        "email": "ops@import.example.com",
+        "phone": "555",
+        "trn": "100000000000007",
+        "contact_person": "Ira",
+        "po_box": "77",
+    }
+    company = (await client.post("/api/v1/companies", json=company_payload, headers=headers)).json()
+    driver = (
+        await client.post(
+            "/api/v1/drivers",
+            json={"name": "Imported Driver", "mobile_number": "0500000007"},
+            headers=headers,
+        )
+    ).json()
+
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["Company ID", "Date", "Freight", "Origin", "Destination", "Amount", "Driver"])
+    writer.writerow([company["id"], "2026-02-01", "1 Ton", "A", "B", "100.00", "imported driver"])
+    writer.writerow([company["id"], "2026-02-02", "1 Ton", "A", "B", "not-a-number", "Driver"])
+    writer.writerow([999999, "2026-02-03", "1 Ton", "A", "B", "50.00", "Driver"])
+    writer.writerow([company["id"], "2026-02-04", "1 Ton", "A", "B", "200.00", "Walk-in"])
+
+    response = await client.post(
+        "/api/v1/trips/import",
+        files={"file": ("trips.csv", buffer.getvalue().encode("utf-8"), "text/csv")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == 2
+    assert [item["row_number"] for item in result["skipped"]] == [3, 4]
+    assert result["skipped"][0]["reason"].startswith("amount:")
+    assert result["skipped"][1]["reason"] == "Company not found"
+
+    trips = (
+        await client.get("/api/v1/trips", params={"company_id": company["id"]}, headers=headers)
+    ).json()
+    assert [(trip["driver"], trip["driver_id"]) for trip in trips] == [
+        ("Walk-in", None),
+        ("Imported Driver", driver["id"]),
+    ]
+    refreshed = (await client.get(f"/api/v1/companies/{company['id']}", headers=headers)).json()
+    assert refreshed["unpaid_amount"] == "315.00"
+
+    empty = await client.post(
+        "/api/v1/trips/import",
+        files={"file": ("trips.txt", b"company_id\n", "text/plain")},
+        headers=headers,
+    )
+    assert empty.status_code == 400
+
+    header = b"company_id,date,freight,origin,destination,amount\n"
+    for body in (header + b"\xff\xfe,1\n", header + b'1,"' + b"x" * 200_000 + b"\n"):
+        invalid = await client.post(
+            "/api/v1/trips/import",
+            files={"file": ("trips.csv", body, "text/csv")},
+            headers=headers,
+        )
+        assert invalid.status_code == 400
+        assert invalid.json()["error"]["message"] == "Invalid CSV file"
+
+
+@pytest.mark.asyncio
+async def test_trip_batch_create_update_and_delete(client: AsyncClient) -> None:
+    headers = await _auth_headers(client)
+    company_payload = {
+        "name": "Batch Co",
+        "address": "Road 6",
+        "email": "ops@batch.example.com",
+        "phone": "555",
+        "trn": "100000000000006",
+        "contact_person": "Bo",
+        "po_box": "66",
+    }
+    company = (await client.post("/api/v1/companies", json=company_payload, headers=headers)).json()
+    driver = (
+        await client.post(
+            "/api/v1/drivers",
+            json={"name": "Batch Driver", "mobile_number": "0500000006"},
+            headers=headers,
+        )
+    ).json()
+
+    def trip(amount: str, **extra: object) -> dict[str, object]:
+        return {
+            "company_id": company["id"],
+            "date": "2026-02-01",
+            "freight": "1 Ton",
+            "origin": "A",
+            "destination": "B",
+            "amount": amount,
+            "toll_gate": "0.00",
+            "driver": "Walk-in",
+            **extra,
+        }
+
+    created = await client.post(
+        "/api/v1/trips/batch",
+        json={"trips": [trip("100.00", driver_id=driver["id"]), trip("200.00"), trip("300.00")]},
+        headers=headers,
+    )
+    assert created.status_code == 201
+    trips = created.json()
+    assert [item["total_amount"] for item in trips] == ["105.00", "210.00", "315.00"]
+    assert trips[0]["driver"] == "Batch Driver"
+
+    rejected = await client.post(
+        "/api/v1/trips/batch",
+        json={"trips": [trip("10.00"), trip("20.00", driver_id=999999)]},
+        headers=headers,
+    )
+    assert rejected.status_code == 404
+    assert rejected.json()["error"]["message"] == "trips[1]: Selected driver not found"
+
+    refreshed = (await client.get(f"/api/v1/companies/{company['id']}", headers=headers)).json()
+    assert refreshed["unpaid_amount"] == "630.00"
+
+    patched = await client.patch(
+        "/api/v1/trips/batch",
+        json={
+            "trips": [
+                {"id": trips[0]["id"], "amount": "50.00"},
+                {"id": trips[1]["id"], "driver_id": driver["id"]},
+            ],
+            "delete_ids": [trips[2]["id"]],
+        },
+        headers=headers,
+    )
+    assert patched.status_code == 200
+    result = patched.json()
+    assert [item["total_amount"] for item in result["updated"]] == ["52.50", "210.00"]
+    assert result["updated"][1]["driver_id"] == driver["id"]
+    assert result["deleted"] == [trips[2]["id"]]
+
+    refreshed = (await client.get(f"/api/v1/companies/{company['id']}", headers=headers)).json()
+    assert refreshed["unpaid_amount"] == "262.50"
+    remaining = (
+        await client.get("/api/v1/trips", params={"company_id": company["id"]}, headers=headers)
+    ).json()
+    assert sorted(item["id"] for item in remaining) == [trips[0]["id"], trips[1]["id"]]
+
+    duplicate = await client.patch(
+        "/api/v1/trips/batch",
+        json={"trips": [{"id": trips[0]["id"]}], "delete_ids": [trips[0]["id"]]},
+        headers=headers,
+    )
+    assert duplicate.status_code == 400